@@ -5,11 +5,82 @@
 """
 import sqlite3
 import os
+import re
 from datetime import datetime
 
 # 데이터베이스 경로
 DB_PATH = '/home/ls/nara1/나라장터 api/narajangter_app/src/database/app.db'
 
+def migrate_bid_notice_key(cursor):
+    """bid_notices의 bid_notice_no 단일 유니크 제약을 (bid_notice_no, bid_notice_ord) 복합키로 변경
+    
+    SQLite는 제약 삭제를 지원하지 않으므로 테이블을 새로 만들어 데이터를 옮김
+    """
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='bid_notices'")
+    row = cursor.fetchone()
+    if not row:
+        return False
+    
+    legacy = False
+    for index in cursor.execute("PRAGMA index_list(bid_notices)").fetchall():
+        name, unique = index[1], index[2]
+        columns = [info[2] for info in cursor.execute(f"PRAGMA index_info('{name}')").fetchall()]
+        if unique and columns == ['bid_notice_no']:
+            legacy = True
+    if not legacy:
+        return False
+    
+    print("🔧 bid_notices 유니크 제약 변경: (bid_notice_no) → (bid_notice_no, bid_notice_ord)")
+    create_sql = re.sub(r',\s*UNIQUE\s*\(\s*bid_notice_no\s*\)', '', row[0])
+    create_sql = re.sub(r'(bid_notice_no\s+VARCHAR\(50\)\s+NOT NULL)\s+UNIQUE', r'\1', create_sql)
+    create_sql = re.sub(r'CREATE TABLE\s+"?bid_notices"?', 'CREATE TABLE bid_notices_new', create_sql, count=1)
+    columns = ', '.join(info[1] for info in cursor.execute("PRAGMA table_info(bid_notices)").fetchall())
+    
+    cursor.execute(create_sql)
+    cursor.execute(f"INSERT INTO bid_notices_new ({columns}) SELECT {columns} FROM bid_notices")
+    cursor.execute("DROP TABLE bid_notices")
+    cursor.execute("ALTER TABLE bid_notices_new RENAME TO bid_notices")
+    return True
+
+# 수집 upsert가 마이크로초 없이 저장했던 일시 컬럼 (ORM 저장 형식 'YYYY-MM-DD HH:MM:SS.ffffff'로 통일)
+DATETIME_COLUMNS = {
+    'bid_notices': ('rgst_dt', 'bid_begin_dt', 'bid_close_dt', 'openg_dt', 'created_at'),
+    'successful_bids': ('openg_dt', 'created_at'),
+}
+
+def normalize_datetime_columns(cursor):
+    """'YYYY-MM-DD HH:MM:SS'로 저장된 일시에 '.000000'을 붙여 ORM 바인딩 값과 문자열 비교가 맞도록 함
+    
+    (커서 페이지네이션이 경계 행을 반복하거나 같은 등록일시 행의 순서가 어긋나는 문제)
+    """
+    normalized = 0
+    for table, columns in DATETIME_COLUMNS.items():
+        cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table}'")
+        if not cursor.fetchone():
+            continue
+        for column in columns:
+            cursor.execute(f"UPDATE {table} SET {column} = {column} || '.000000' WHERE length({column}) = 19")
+            normalized += cursor.rowcount
+    if normalized:
+        print(f"🔧 일시 저장 형식 통일: {normalized:,}개 값")
+    return normalized
+
+# 이전 버전 테이블에 없는 컬럼 (테이블, 컬럼, 정의)
+ADDED_COLUMNS = [
+    ('sync_jobs', 'incremental', 'BOOLEAN DEFAULT 0'),
+]
+
+def add_missing_columns(cursor):
+    """db.create_all()은 기존 테이블에 컬럼을 추가하지 않으므로 새 컬럼을 ALTER TABLE로 추가"""
+    added = 0
+    for table, column, definition in ADDED_COLUMNS:
+        columns = [info[1] for info in cursor.execute(f"PRAGMA table_info({table})").fetchall()]
+        if columns and column not in columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            print(f"🔧 컬럼 추가: {table}.{column}")
+            added += 1
+    return added
+
 def add_indexes():
     """데이터베이스에 인덱스 추가"""
     
@@ -24,6 +95,18 @@ def add_indexes():
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     
+    # 구버전 유니크 제약 마이그레이션 (테이블 재생성 시 기존 인덱스가 삭제되므로 인덱스 생성 전에 실행)
+    if migrate_bid_notice_key(cursor):
+        conn.commit()
+    
+    # 일시 저장 형식 통일 (이전 버전 수집 upsert가 마이크로초 없이 저장한 기존 행)
+    if normalize_datetime_columns(cursor):
+        conn.commit()
+    
+    # 이전 버전 테이블에 새 컬럼 추가
+    if add_missing_columns(cursor):
+        conn.commit()
+    
     # 추가할 인덱스 목록
     indexes = [
         # bid_notices 테이블 인덱스
@@ -47,10 +130,19 @@ def add_indexes():
         ("idx_api_config_active", "api_configs", "is_active")
     ]
     
+    # 중복 방지용 유니크 인덱스 목록
+    unique_indexes = [
+        ("uq_bid_notice_key", "bid_notices", "bid_notice_no, bid_notice_ord"),
+        ("uq_sb_bid_notice_key", "successful_bids", "bid_notice_no, bid_notice_ord")
+    ]
+    
     created_count = 0
     skipped_count = 0
     
-    for index_name, table_name, columns in indexes:
+    for index_name, table_name, columns, unique in (
+        [(name, table, cols, False) for name, table, cols in indexes] +
+        [(name, table, cols, True) for name, table, cols in unique_indexes]
+    ):
         try:
             # 테이블 존재 확인
             cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}'")
@@ -59,7 +151,7 @@ def add_indexes():
                 continue
             
             # 인덱스 생성
-            sql = f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}({columns})"
+            sql = f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {index_name} ON {table_name}({columns})"
             cursor.execute(sql)
             
             # 인덱스 생성 확인
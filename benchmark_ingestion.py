@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+수집 엔진 벤치마크 스크립트
+로컬 스텁 서버를 대상으로 스레드풀 방식과 asyncio 엔진의 페이지 조회 처리량 비교
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import concurrent.futures
+from datetime import datetime
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'narajangter_app', 'src'))
+
+from utils.async_fetcher import AsyncPageFetcher, extract_items
+from utils.stub_server import StubServer
+
+
+def fetch_with_thread_pool(url: str, params: dict, total_pages: int, max_workers: int) -> int:
+    """기존 방식: ThreadPoolExecutor + requests.get"""
+
+    def fetch(page_no):
+        page_params = dict(params, pageNo=str(page_no))
+        response = requests.get(url, params=page_params, timeout=30)
+        return extract_items(response.json()['response']['body'])
+
+    count = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for items in executor.map(fetch, range(1, total_pages + 1)):
+            count += len(items)
+    return count
+
+
+def ingest_with_batch_processor(url: str, total_count: int, concurrency: int) -> dict:
+    """조회→변환→upsert 전체 파이프라인 처리량 (임시 SQLite DB)"""
+    from unittest import mock
+    from flask import Flask
+    from models.narajangter import db
+    from utils import batch_processor
+    from utils.quota import QuotaManager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            quota = QuotaManager(db_path=os.path.join(tmpdir, 'quota.db'), daily_limit=10 ** 6, rate_per_second=10 ** 6, burst=10 ** 6)
+            processor = batch_processor.BatchProcessor(db, 'benchmark-key', quota_manager=quota)
+            with mock.patch.object(batch_processor, 'BID_NOTICE_API_URL', url):
+                return processor.sync_bid_notices_optimized('20250101', '20250131', max_workers=concurrency)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='페이지 조회 엔진 벤치마크')
+    parser.add_argument('--url', help='대상 URL (미지정 시 로컬 스텁 서버 사용)')
+    parser.add_argument('--total-count', type=int, default=31691, help='스텁 서버 전체 건수')
+    parser.add_argument('--latency', type=float, default=0.2, help='스텁 서버 페이지당 지연 (초)')
+    parser.add_argument('--concurrency', type=int, default=20, help='asyncio 엔진 동시성')
+    parser.add_argument('--workers', type=int, default=5, help='스레드풀 워커 수')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='스텁 서버 HTTP 500 비율')
+    parser.add_argument('--ingest', action='store_true', help='DB 삽입까지 포함한 전체 파이프라인 측정 (스텁 서버 전용)')
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if not url:
+        server = StubServer(total_count=args.total_count, latency=args.latency, error_rate=args.error_rate, seed=0).start()
+        url = server.url('bid_notice')
+
+    params = {'type': 'json', 'numOfRows': '100'}
+    total_pages = (args.total_count + 99) // 100
+
+    print("=" * 60)
+    print("페이지 조회 엔진 벤치마크")
+    print("=" * 60)
+    print(f"시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"대상: {url}")
+    print(f"페이지: {total_pages}, 지연: {args.latency}s")
+
+    start = time.time()
+    thread_count = fetch_with_thread_pool(url, params, total_pages, args.workers)
+    thread_elapsed = time.time() - start
+    print(f"\n[ThreadPoolExecutor x{args.workers}]")
+    print(f"  - {thread_count}건, {thread_elapsed:.2f}s, {total_pages / thread_elapsed:.1f} pages/s")
+
+    fetcher = AsyncPageFetcher(concurrency=args.concurrency, limit_per_host=args.concurrency)
+    start = time.time()
+    async_count = len(fetcher.fetch_all_pages(url, params))
+    async_elapsed = time.time() - start
+    print(f"\n[AsyncPageFetcher 동시성 {args.concurrency}]")
+    print(f"  - {async_count}건, {async_elapsed:.2f}s, {total_pages / async_elapsed:.1f} pages/s")
+    print(f"  - 실패 페이지: {len(fetcher.failed_pages)}")
+
+    print(f"\n📊 속도 향상: {thread_elapsed / async_elapsed:.1f}x")
+
+    if args.ingest and server:
+        result = ingest_with_batch_processor(url, args.total_count, args.concurrency)
+        print(f"\n[BatchProcessor 전체 파이프라인 동시성 {args.concurrency}]")
+        print(f"  - 조회 {result['total_fetched']}건, 삽입 {result['inserted']}건, {result['elapsed_time']:.2f}s")
+        print(f"  - {result['items_per_second']:.0f} items/s, 실패 페이지: {len(result['failed_pages'])}")
+    print("=" * 60)
+
+    if server:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
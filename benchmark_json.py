@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+JSON 직렬화 벤치마크 스크립트
+100건 data.go.kr 응답 파싱과 100건 목록 API 응답 직렬화를 표준 json / orjson으로 비교
+(XML 응답의 iterparse 파싱 속도도 함께 측정)
+"""
+import os
+import sys
+import time
+import argparse
+from datetime import datetime, timedelta
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'narajangter_app', 'src'))
+
+from utils.json_codec import CODECS, FastJSONProvider, configure_json_codec
+from utils.stub_server import StubRequestHandler, synthetic_bid_notice
+from utils.xml_decoder import decode_xml
+
+
+def upstream_page(rows: int, xml: bool = False) -> bytes:
+    """입찰공고 API 1페이지 응답 본문 (JSON 또는 XML)"""
+    begin = datetime(2025, 1, 1)
+    header = {'resultCode': '00', 'resultMsg': 'NORMAL SERVICE.'}
+    body = {
+        'items': [synthetic_bid_notice(i, begin) for i in range(rows)],
+        'numOfRows': rows,
+        'pageNo': 1,
+        'totalCount': 31691
+    }
+    if xml:
+        return StubRequestHandler._to_xml(header, body)
+    return CODECS['json'].dumps({'response': {'header': header, 'body': body}})
+
+
+def list_response(rows: int) -> dict:
+    """/bid-notices 목록 응답 (BidNotice.to_dict() 형식)"""
+    begin = datetime(2025, 1, 1)
+    notices = []
+    for i in range(rows):
+        rgst_dt = begin + timedelta(minutes=i)
+        notices.append({
+            'id': i + 1,
+            'bid_notice_no': f'20250101{i:04d}',
+            'bid_notice_nm': f'테스트 공고 {i} - 정보시스템 유지관리 용역',
+            'bid_notice_ord': '00',
+            'dminstt_nm': '조달청',
+            'rgst_dt': rgst_dt.isoformat(),
+            'bid_begin_dt': (rgst_dt + timedelta(days=1)).isoformat(),
+            'bid_close_dt': (rgst_dt + timedelta(days=10)).isoformat(),
+            'openg_dt': (rgst_dt + timedelta(days=10, hours=1)).isoformat(),
+            'presmpt_price': 1000000.0 + i,
+            'basic_amount': 1100000.0 + i,
+            'bid_method_nm': '전자입찰',
+            'cntrct_cncls_mthd_nm': '제한경쟁',
+            'work_div_nm': '용역',
+            'created_at': datetime(2025, 1, 2, 3, 4, 5, 678901).isoformat()
+        })
+    return {'notices': notices, 'total': 31691, 'pages': 317, 'current_page': 1, 'per_page': rows}
+
+
+def measure(fn, iterations: int) -> float:
+    """1회 평균 소요 시간 (마이크로초)"""
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JSON 직렬화 벤치마크')
+    parser.add_argument('--rows', type=int, default=100, help='페이지/목록 건수')
+    parser.add_argument('--iterations', type=int, default=2000, help='반복 횟수')
+    args = parser.parse_args()
+
+    page = upstream_page(args.rows)
+    payload = list_response(args.rows)
+
+    print("=" * 60)
+    print("JSON 직렬화 벤치마크")
+    print("=" * 60)
+    print(f"응답 페이지: {len(page):,} bytes, 목록 {args.rows}건, 반복 {args.iterations}회")
+    print(f"사용 가능한 백엔드: {', '.join(CODECS)}")
+
+    results = {}
+    for name, codec in CODECS.items():
+        configure_json_codec(name)
+        app = Flask(__name__)
+        app.json = FastJSONProvider(app) if name != 'json' else DefaultJSONProvider(app)
+        with app.app_context():
+            decode = measure(lambda: codec.loads(page), args.iterations)
+            encode = measure(lambda: app.json.response(payload).get_data(), args.iterations)
+        results[name] = (decode, encode)
+        label = 'json + Flask 기본 provider' if name == 'json' else f'{name} + FastJSONProvider'
+        print(f"\n[{label}]")
+        print(f"  - 응답 파싱: {decode:,.0f} us/페이지")
+        print(f"  - 목록 응답 직렬화: {encode:,.0f} us/요청")
+
+    xml_page = upstream_page(args.rows, xml=True)
+    xml_decode = measure(lambda: decode_xml(xml_page), args.iterations)
+    print(f"\n[XML iterparse]")
+    print(f"  - 응답 파싱: {xml_decode:,.0f} us/페이지 ({len(xml_page):,} bytes)")
+
+    if 'orjson' in results:
+        (json_decode, json_encode), (fast_decode, fast_encode) = results['json'], results['orjson']
+        print(f"\n📊 파싱 {json_decode / fast_decode:.1f}x, 직렬화 {json_encode / fast_encode:.1f}x 향상")
+    else:
+        print("\n⚠️ orjson이 설치되지 않아 표준 json만 측정했습니다. (pip install orjson)")
+    print("=" * 60)
+
+    configure_json_codec()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+수집 행 변환 벤치마크 스크립트
+API 응답 항목 100,000건을 DB 행으로 변환하는 처리량을 기존 방식(strptime + 예외 처리)과 비교
+"""
+import os
+import sys
+import time
+import argparse
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'narajangter_app', 'src'))
+
+from utils.row_transform import BID_NOTICE_TRANSFORMER
+from utils.stub_server import synthetic_bid_notice
+
+
+def legacy_parse_datetime(date_str):
+    if not date_str:
+        return None
+    try:
+        if len(date_str) == 12:
+            return datetime.strptime(date_str, '%Y%m%d%H%M')
+        elif len(date_str) == 8:
+            return datetime.strptime(date_str, '%Y%m%d')
+    except ValueError:
+        pass
+    return None
+
+
+def legacy_parse_int(value):
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def legacy_transform(item):
+    """기존 BatchProcessor._build_bid_notice_record 방식"""
+    return {
+        'bid_notice_no': item.get('bidNtceNo'),
+        'bid_notice_nm': item.get('bidNtceNm', '')[:500],
+        'bid_notice_ord': item.get('bidNtceOrd', '00'),
+        'dminstt_nm': item.get('dminsttNm', '')[:200],
+        'rgst_dt': legacy_parse_datetime(item.get('rgstDt')),
+        'bid_begin_dt': legacy_parse_datetime(item.get('bidBeginDt')),
+        'bid_close_dt': legacy_parse_datetime(item.get('bidClseDt')),
+        'openg_dt': legacy_parse_datetime(item.get('opengDt')),
+        'presmpt_price': legacy_parse_int(item.get('presmptPrce')),
+        'basic_amount': legacy_parse_int(item.get('asignBdgtAmt')),
+        'bid_method_nm': item.get('bidMethdNm', '')[:100],
+        'cntrct_cncls_mthd_nm': item.get('cntrctCnclsMthdNm', '')[:100],
+        'work_div_nm': item.get('taskClsfcNm', '')[:50],
+        'created_at': datetime.utcnow()
+    }
+
+
+def synthetic_items(count: int, distinct_minutes: int):
+    """등록일시가 distinct_minutes개 값 안에서 반복되는 항목 (실제 응답처럼 같은 시각이 반복)"""
+    begin = datetime(2025, 1, 1)
+    items = []
+    for i in range(count):
+        item = synthetic_bid_notice(i % distinct_minutes, begin)
+        item['bidNtceNo'] = f'2025{i:08d}'
+        items.append(item)
+    return items
+
+
+def measure(label: str, fn, items) -> float:
+    start = time.perf_counter()
+    rows = fn(items)
+    elapsed = time.perf_counter() - start
+    rate = len(rows) / elapsed
+    print(f"  - {label}: {len(rows):,}건, {elapsed:.3f}s, {rate:,.0f} rows/s")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description='수집 행 변환 벤치마크')
+    parser.add_argument('--rows', type=int, default=100000, help='변환할 항목 수')
+    parser.add_argument('--distinct-minutes', type=int, default=1440, help='서로 다른 등록일시 수')
+    args = parser.parse_args()
+
+    items = synthetic_items(args.rows, args.distinct_minutes)
+
+    print("=" * 60)
+    print("수집 행 변환 벤치마크")
+    print("=" * 60)
+    print(f"항목: {args.rows:,}건, 서로 다른 등록일시: {args.distinct_minutes:,}개")
+
+    legacy = measure('기존 방식 (strptime)', lambda rows: [legacy_transform(item) for item in rows if item.get('bidNtceNo')], items)
+    fast = measure('RowTransformer', BID_NOTICE_TRANSFORMER.transform_many, items)
+
+    sample = items[123]
+    expected = legacy_transform(sample)
+    actual = BID_NOTICE_TRANSFORMER.transform(sample, expected['created_at'])
+    print(f"\n결과 일치: {'✅' if actual == expected else '❌'}")
+    print(f"📊 속도 향상: {fast / legacy:.1f}x")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+컬럼형 스냅샷 내보내기 스크립트
+입찰공고/낙찰정보 테이블을 월별 파티션 Parquet/Arrow 파일로 내보냄 (기본은 바뀐 월만 기록하는 증분)
+pandas/DuckDB 등에서 디렉터리를 Hive 파티션 데이터셋으로 읽으면 필요한 컬럼과 월만 스캔
+"""
+import os
+import sys
+import argparse
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'narajangter_app', 'src'))
+
+from utils.snapshot import SNAPSHOT_FORMATS, SNAPSHOT_TABLES, export_snapshots
+
+# 데이터베이스/스냅샷 경로
+DB_PATH = os.path.join(os.path.dirname(__file__), 'narajangter_app', 'src', 'database', 'app.db')
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), 'narajangter_app', 'src', 'database', 'snapshots')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='입찰공고/낙찰정보 월별 파티션 스냅샷 내보내기')
+    parser.add_argument('--db', default=DB_PATH, help='SQLite DB 경로')
+    parser.add_argument('--output', default=os.environ.get('SNAPSHOT_DIR', SNAPSHOT_DIR), help='스냅샷 디렉터리')
+    parser.add_argument('--table', action='append', choices=list(SNAPSHOT_TABLES), help='대상 테이블 (반복 지정 가능, 기본 전체)')
+    parser.add_argument('--format', default='parquet', choices=list(SNAPSHOT_FORMATS), help='파일 형식')
+    parser.add_argument('--month', action='append', help='강제로 다시 쓸 월 (YYYY-MM, 반복 지정 가능)')
+    parser.add_argument('--full', action='store_true', help='바뀌지 않은 월도 모두 다시 기록')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"❌ DB 파일이 없습니다: {args.db}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"컬럼형 스냅샷 내보내기 ({args.format}) → {args.output}")
+    print("=" * 60)
+
+    with Session(create_engine(f'sqlite:///{args.db}')) as session:
+        try:
+            results = export_snapshots(
+                session, args.output, tables=args.table, snapshot_format=args.format,
+                full=args.full, months=args.month
+            )
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+    for result in results:
+        print(f"📦 {result['table']}: 전체 {result['rows']:,}건")
+        print(f"   기록 {len(result['written'])}개 월 / 유지 {result['unchanged']}개 월 / 삭제 {len(result['removed'])}개 월")
+        if result['written']:
+            print(f"   기록한 월: {', '.join(result['written'][:12])}{' ...' if len(result['written']) > 12 else ''}")
+
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,8 +9,15 @@ from src.models.narajangter import db, BidNotice, SuccessfulBid, ApiConfig
 from src.models.user import User
 from src.routes.user import user_bp
 from src.routes.narajangter import narajangter_bp
+from src.utils.upstream_cache import configure_upstream_cache
+from src.utils.http_cache import configure_response_cache
+from src.utils.shared_cache import configure_shared_cache
+from src.utils.json_codec import FastJSONProvider
+from src.utils.fulltext import BID_NOTICE_FTS
+from src.utils.rollups import ensure_rollups
 
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
+app.json = FastJSONProvider(app)
 app.config['SECRET_KEY'] = 'asdf#FGSgvasgf$5$WGT'
 
 # CORS 설정
@@ -22,9 +29,24 @@ app.register_blueprint(narajangter_bp, url_prefix='/api/narajangter')
 # uncomment if you need to use database
 app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# 컬럼형 스냅샷(Parquet/Arrow) 저장 위치
+app.config['SNAPSHOT_DIR'] = os.environ.get('SNAPSHOT_DIR', os.path.join(os.path.dirname(__file__), 'database', 'snapshots'))
 db.init_app(app)
 with app.app_context():
     db.create_all()
+    # 입찰공고명/발주처 전문 검색 색인 (없으면 생성 후 기존 데이터로 재구축)
+    BID_NOTICE_FTS.ensure(db.session)
+    # 분석 집계 테이블 (없으면 생성 후 기존 데이터로 재구축)
+    ensure_rollups(db.session)
+
+# data.go.kr 응답 캐시 (이미 조회한 구간 재동기화 시 호출 한도 절약)
+configure_upstream_cache()
+
+# 조회 API 응답 캐시 (동기화로 데이터 세대가 바뀔 때까지 렌더링된 응답 재사용)
+configure_response_cache()
+
+# 워커 간 공유 캐시 계층 (REDIS_URL이 있으면 응답/건수 캐시와 데이터 세대를 Redis로 공유)
+configure_shared_cache(os.environ.get('REDIS_URL'))
 
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
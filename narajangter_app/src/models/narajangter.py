@@ -6,9 +6,13 @@ db = SQLAlchemy()
 class BidNotice(db.Model):
     """입찰공고 정보 모델"""
     __tablename__ = 'bid_notices'
+    __table_args__ = (
+        db.UniqueConstraint('bid_notice_no', 'bid_notice_ord', name='uq_bid_notice_key'),
+        db.Index('idx_rgst_dt', 'rgst_dt'),  # 목록 정렬/커서 페이지네이션 (rgst_dt, rowid)
+    )
     
     id = db.Column(db.Integer, primary_key=True)
-    bid_notice_no = db.Column(db.String(50), unique=True, nullable=False)  # 입찰공고번호
+    bid_notice_no = db.Column(db.String(50), nullable=False)  # 입찰공고번호
     bid_notice_nm = db.Column(db.String(500), nullable=False)  # 입찰공고명
     bid_notice_ord = db.Column(db.String(10))  # 입찰공고차수
     dminstt_nm = db.Column(db.String(200))  # 수요기관명
@@ -45,6 +49,10 @@ class BidNotice(db.Model):
 class SuccessfulBid(db.Model):
     """낙찰 정보 모델"""
     __tablename__ = 'successful_bids'
+    __table_args__ = (
+        db.UniqueConstraint('bid_notice_no', 'bid_notice_ord', name='uq_sb_bid_notice_key'),
+        db.Index('idx_sb_openg_dt', 'openg_dt'),  # 목록 정렬/커서 페이지네이션 (openg_dt, rowid)
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     bid_notice_no = db.Column(db.String(50), nullable=False)  # 입찰공고번호
@@ -90,3 +98,69 @@ class ApiConfig(db.Model):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
+
+class SyncWatermark(db.Model):
+    """엔드포인트별 증분 동기화 기준점 모델"""
+    __tablename__ = 'sync_watermarks'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    endpoint = db.Column(db.String(50), unique=True, nullable=False)  # 동기화 대상 (bid_notice 등)
+    last_rgst_dt = db.Column(db.DateTime)  # 마지막으로 반영한 등록일시
+    window_start = db.Column(db.String(12))  # 마지막 성공 조회 구간 시작 (YYYYMMDDHHMM)
+    window_end = db.Column(db.String(12))  # 마지막 성공 조회 구간 종료 (YYYYMMDDHHMM)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def to_dict(self):
+        return {
+            'endpoint': self.endpoint,
+            'last_rgst_dt': self.last_rgst_dt.isoformat() if self.last_rgst_dt else None,
+            'window_start': self.window_start,
+            'window_end': self.window_end,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class SyncJob(db.Model):
+    """동기화 작업 모델 (페이지 단위 체크포인트로 재개 가능)"""
+    __tablename__ = 'sync_jobs'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    endpoint = db.Column(db.String(50), nullable=False)  # 동기화 대상 (bid_notice 등)
+    window_start = db.Column(db.String(12), nullable=False)  # 조회 구간 시작 (YYYYMMDD[HHMM])
+    window_end = db.Column(db.String(12), nullable=False)  # 조회 구간 종료 (YYYYMMDD[HHMM])
+    incremental = db.Column(db.Boolean, default=False)  # 증분 동기화 작업 (완료 시 기준점 갱신)
+    status = db.Column(db.String(20), default='pending')  # pending/running/completed/failed/cancelled
+    windows = db.Column(db.Text)  # 구간별 [전체 건수, 페이지 수] (JSON)
+    total_pages = db.Column(db.Integer, default=0)  # 전체 페이지 수
+    completed_pages = db.Column(db.Integer, default=0)  # 완료(삽입까지 반영)된 페이지 수
+    fetched_count = db.Column(db.Integer, default=0)  # 조회 건수
+    inserted_count = db.Column(db.Integer, default=0)  # 신규 삽입 건수
+    error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'endpoint': self.endpoint,
+            'window_start': self.window_start,
+            'window_end': self.window_end,
+            'incremental': bool(self.incremental),
+            'status': self.status,
+            'total_pages': self.total_pages,
+            'completed_pages': self.completed_pages,
+            'fetched_count': self.fetched_count,
+            'inserted_count': self.inserted_count,
+            'error': self.error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class SyncJobPage(db.Model):
+    """동기화 작업 페이지 체크포인트 모델"""
+    __tablename__ = 'sync_job_pages'
+    __table_args__ = (db.UniqueConstraint('job_id', 'window_index', 'page_no'),)
+    
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('sync_jobs.id'), nullable=False, index=True)
+    window_index = db.Column(db.Integer, nullable=False)  # 작업 내 조회 구간 순번
+    page_no = db.Column(db.Integer, nullable=False)
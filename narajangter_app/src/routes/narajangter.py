@@ -1,8 +1,24 @@
-from flask import Blueprint, request, jsonify
-import requests
-import xml.etree.ElementTree as ET
+import os
+from flask import Blueprint, Response, request, jsonify, current_app, send_from_directory, stream_with_context
 from datetime import datetime, timedelta
-from src.models.narajangter import db, BidNotice, SuccessfulBid, ApiConfig
+from src.models.narajangter import db, BidNotice, SuccessfulBid, ApiConfig, SyncWatermark, SyncJob
+from src.utils.batch_processor import BatchProcessor
+from src.utils.count_cache import get_count_cache
+from src.utils.date_windows import plan_windows
+from src.utils.export import DEFAULT_BATCH_SIZE, EXPORT_FORMATS, EXPORTERS
+from src.utils.fulltext import BID_NOTICE_FTS, phrase
+from src.utils.http_cache import cached_view, get_response_cache
+from src.utils.job_queue import get_job_queue
+from src.utils.key_pool import get_key_pool
+from src.utils.pagination import MAX_PER_PAGE, keyset_page
+from src.utils.sync_jobs import SyncJobStore
+from src.utils.http_client import get_http_client
+from src.utils.quota import get_quota_manager
+from src.utils.upstream_cache import get_upstream_cache
+from src.utils.resilience import breaker_stats
+from src.utils.rollups import check_rollups, read_rollup, rebuild_rollups
+from src.utils.shared_cache import get_shared_cache
+from src.utils.snapshot import SNAPSHOT_FORMATS, SNAPSHOT_TABLES, export_snapshots, read_manifest
 from urllib.parse import quote
 
 narajangter_bp = Blueprint('narajangter', __name__)
@@ -11,30 +27,32 @@ narajangter_bp = Blueprint('narajangter', __name__)
 BID_NOTICE_API_URL = "http://apis.data.go.kr/1230000/ao/PubDataOpnStdService/getDataSetOpnStdBidPblancInfo"
 SUCCESSFUL_BID_API_URL = "http://apis.data.go.kr/1230000/ao/PubDataOpnStdService/getDataSetOpnStdScsbidInfo"
 
+# 목록 검색 조건 - 인덱스로 처리되는 조건만 있으면 정확한 건수, LIKE 부분 문자열 검색이 있으면 추정 건수
+BID_NOTICE_FILTERS = ('search', 'dminstt_nm', 'work_div', 'start_date', 'end_date')
+SUCCESSFUL_BID_FILTERS = ('search', 'work_div', 'start_date', 'end_date')
+EXACT_COUNT_FILTERS = ('work_div', 'start_date', 'end_date')
+
+# 수집으로 데이터 세대가 바뀌는 테이블
+DATA_TABLES = ('bid_notices', 'successful_bids')
+
+# 입찰공고 전문 검색 파라미터 → 색인 컬럼
+FTS_COLUMNS = {'search': 'bid_notice_nm', 'dminstt_nm': 'dminstt_nm'}
+
+# 컬럼형 스냅샷 기본 저장 위치 (SNAPSHOT_DIR 설정으로 변경)
+DEFAULT_SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database', 'snapshots')
+
 def get_active_service_key():
     """활성화된 서비스 키 조회"""
     config = ApiConfig.query.filter_by(is_active=True).first()
     return config.service_key if config else None
 
-def parse_datetime(date_str):
-    """날짜 문자열을 datetime 객체로 변환"""
-    if not date_str:
-        return None
-    try:
-        # YYYYMMDDHHMM 형식
-        if len(date_str) == 12:
-            return datetime.strptime(date_str, '%Y%m%d%H%M')
-        # YYYYMMDD 형식
-        elif len(date_str) == 8:
-            return datetime.strptime(date_str, '%Y%m%d')
-        else:
-            return None
-    except ValueError:
-        return None
+def get_active_service_keys():
+    """활성화된 서비스 키 전체 (등록 순)"""
+    return [config.service_key for config in ApiConfig.query.filter_by(is_active=True).order_by(ApiConfig.id)]
 
 @narajangter_bp.route('/config', methods=['POST'])
 def set_api_config():
-    """API 설정 저장"""
+    """API 설정 저장 (기존 키는 유지하고 키 풀에 추가, replace=true면 기존 키 비활성화)"""
     try:
         data = request.get_json()
         service_key = data.get('service_key')
@@ -42,15 +60,22 @@ def set_api_config():
         if not service_key:
             return jsonify({'error': '서비스 키가 필요합니다.'}), 400
         
-        # 기존 설정 비활성화
-        ApiConfig.query.update({'is_active': False})
+        if data.get('replace'):
+            ApiConfig.query.update({'is_active': False})
         
-        # 새 설정 추가
-        new_config = ApiConfig(service_key=service_key, is_active=True)
-        db.session.add(new_config)
+        # 이미 등록된 키는 다시 활성화
+        config = ApiConfig.query.filter_by(service_key=service_key).first()
+        if config:
+            config.is_active = True
+        else:
+            db.session.add(ApiConfig(service_key=service_key, is_active=True))
         db.session.commit()
+        get_key_pool().restore(service_key)
         
-        return jsonify({'message': 'API 설정이 저장되었습니다.'}), 200
+        return jsonify({
+            'message': 'API 설정이 저장되었습니다.',
+            'active_keys': ApiConfig.query.filter_by(is_active=True).count()
+        }), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -66,217 +91,428 @@ def get_api_config():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@narajangter_bp.route('/bid-notices', methods=['GET'])
-def get_bid_notices():
-    """입찰공고 목록 조회"""
+@narajangter_bp.route('/config/keys', methods=['GET'])
+def list_api_keys():
+    """등록된 서비스 키 목록과 키 풀 상태 (키는 일부만 표시)"""
     try:
-        # 쿼리 파라미터
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 20, type=int)
-        search_keyword = request.args.get('search', '')
-        dminstt_nm = request.args.get('dminstt_nm', '')  # 발주처 검색
-        work_div = request.args.get('work_div', '')  # 업무구분
-        start_date = request.args.get('start_date', '')
-        end_date = request.args.get('end_date', '')
-        
-        # 기본 쿼리
-        query = BidNotice.query
-        
-        # 검색 조건 적용
-        if search_keyword:
-            query = query.filter(BidNotice.bid_notice_nm.contains(search_keyword))
-        
-        if dminstt_nm:
-            query = query.filter(BidNotice.dminstt_nm.contains(dminstt_nm))
-        
-        if work_div:
-            query = query.filter(BidNotice.work_div_nm == work_div)
-        
-        if start_date:
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            query = query.filter(BidNotice.rgst_dt >= start_dt)
+        configs = ApiConfig.query.order_by(ApiConfig.id).all()
+        pool = get_key_pool()
+        pool.set_keys(config.service_key for config in configs if config.is_active)
+        stats = {item['key_id']: item for item in pool.stats()}
+        keys = []
+        for config in configs:
+            item = config.to_dict()
+            item['pool'] = stats.get(get_quota_manager().key_id(config.service_key))
+            keys.append(item)
+        return jsonify({'keys': keys, 'remaining': pool.remaining()}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/config/keys/<int:config_id>', methods=['DELETE'])
+def deactivate_api_key(config_id):
+    """서비스 키 비활성화 (키 풀에서 제외)"""
+    try:
+        config = db.session.get(ApiConfig, config_id)
+        if not config:
+            return jsonify({'error': '서비스 키를 찾을 수 없습니다.'}), 404
         
-        if end_date:
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-            query = query.filter(BidNotice.rgst_dt <= end_dt)
+        config.is_active = False
+        db.session.commit()
+        get_key_pool().set_keys(get_active_service_keys())
+        return jsonify({'message': f'서비스 키 #{config_id} 비활성화 완료'}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def filter_bid_notices(args):
+    """입찰공고 검색 조건을 적용한 (쿼리, 관련도 컬럼, 색인으로 처리한 조건) (목록 조회 공통)
+    
+    3글자 이상 공고명/발주처 검색어는 전문 검색 색인(FTS5 trigram)으로, 더 짧으면 LIKE로 검색
+    """
+    search_keyword = args.get('search', '')
+    dminstt_nm = args.get('dminstt_nm', '')  # 발주처 검색
+    work_div = args.get('work_div', '')  # 업무구분
+    start_date = args.get('start_date', '')
+    end_date = args.get('end_date', '')
+    
+    # 기본 쿼리
+    query = BidNotice.query
+    rank = None
+    indexed = set()
+    
+    # 전문 검색 색인 조건 (검색 파라미터 → 색인 컬럼)
+    fts_terms = {
+        name: keyword for name, keyword in (('search', search_keyword), ('dminstt_nm', dminstt_nm))
+        if phrase(keyword) is not None
+    }
+    if fts_terms and BID_NOTICE_FTS.ensure(db.session):
+        matches = BID_NOTICE_FTS.matches(BID_NOTICE_FTS.match_expression({
+            FTS_COLUMNS[name]: keyword for name, keyword in fts_terms.items()
+        }))
+        query = query.join(matches, BidNotice.id == matches.c.id)
+        rank = matches.c.rank
+        indexed.update(fts_terms)
+    
+    # 검색 조건 적용
+    if search_keyword and 'search' not in indexed:
+        query = query.filter(BidNotice.bid_notice_nm.contains(search_keyword))
+    
+    if dminstt_nm and 'dminstt_nm' not in indexed:
+        query = query.filter(BidNotice.dminstt_nm.contains(dminstt_nm))
+    
+    if work_div:
+        query = query.filter(BidNotice.work_div_nm == work_div)
+    
+    if start_date:
+        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+        query = query.filter(BidNotice.rgst_dt >= start_dt)
+    
+    if end_date:
+        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+        query = query.filter(BidNotice.rgst_dt <= end_dt)
+    
+    return query, rank, indexed
+
+def filter_successful_bids(args):
+    """낙찰정보 검색 조건을 적용한 (쿼리, 관련도 컬럼, 색인으로 처리한 조건) (목록 조회 공통)"""
+    search_keyword = args.get('search', '')
+    work_div = args.get('work_div', '')
+    start_date = args.get('start_date', '')
+    end_date = args.get('end_date', '')
+    
+    # 기본 쿼리
+    query = SuccessfulBid.query
+    
+    # 검색 조건 적용
+    if search_keyword:
+        query = query.filter(SuccessfulBid.scsbid_corp_nm.contains(search_keyword))
+    
+    if work_div:
+        query = query.filter(SuccessfulBid.work_div_nm == work_div)
+    
+    if start_date:
+        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+        query = query.filter(SuccessfulBid.openg_dt >= start_dt)
+    
+    if end_date:
+        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+        query = query.filter(SuccessfulBid.openg_dt <= end_dt)
+    
+    return query, None, set()
+
+def list_response(model, filtered, sort_column, filter_names):
+    """목록 응답 - cursor 파라미터(첫 페이지는 빈 값) 또는 mode=cursor면 커서 방식, 아니면 페이지 번호 방식
+    
+    sort=relevance면 전문 검색 관련도 순 (페이지 번호 방식, 색인 검색어가 있을 때만)
+    """
+    query, rank, indexed = filtered
+    id_column = model.id
+    per_page = request.args.get('per_page', 20, type=int)
+    by_relevance = request.args.get('sort') == 'relevance'
+    
+    if 'cursor' in request.args or request.args.get('mode') == 'cursor':
+        if by_relevance:
+            return jsonify({'error': '관련도 정렬은 페이지 번호 방식에서만 지원합니다'}), 400
         
-        # 페이지네이션
-        pagination = query.order_by(BidNotice.rgst_dt.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
+        # 커서 방식 - OFFSET/COUNT 없이 마지막 행 다음부터 조회
+        per_page = max(1, min(per_page, MAX_PER_PAGE))
+        try:
+            items, next_cursor = keyset_page(
+                query, sort_column, id_column, per_page, request.args.get('cursor') or None
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
         return jsonify({
-            'items': [item.to_dict() for item in pagination.items],
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'current_page': page,
+            'items': [item.to_dict() for item in items],
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None,
             'per_page': per_page
         }), 200
+    
+    # 페이지네이션 - 건수는 COUNT 대신 건수 캐시 사용 (exact_total=true면 정확한 건수)
+    page = request.args.get('page', 1, type=int)
+    order = (rank, sort_column.desc()) if by_relevance and rank is not None else (sort_column.desc(),)
+    pagination = query.order_by(*order).paginate(
+        page=page, per_page=per_page, error_out=False, count=False
+    )
+    total, total_exact = get_count_cache().count(
+        query, model,
+        {name: request.args.get(name, '') for name in filter_names},
+        exact_filters=set(EXACT_COUNT_FILTERS) | indexed,
+        force_exact=request.args.get('exact_total', '').lower() == 'true'
+    )
+    
+    return jsonify({
+        'items': [item.to_dict() for item in pagination.items],
+        'total': total,
+        'total_exact': total_exact,
+        'pages': -(-total // per_page) if per_page > 0 else 0,
+        'current_page': page,
+        'per_page': per_page
+    }), 200
+
+@narajangter_bp.route('/bid-notices', methods=['GET'])
+@cached_view('bid_notices')
+def get_bid_notices():
+    """입찰공고 목록 조회"""
+    try:
+        return list_response(BidNotice, filter_bid_notices(request.args), BidNotice.rgst_dt, BID_NOTICE_FILTERS)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @narajangter_bp.route('/successful-bids', methods=['GET'])
+@cached_view('successful_bids')
 def get_successful_bids():
     """낙찰정보 목록 조회"""
     try:
-        # 쿼리 파라미터
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 20, type=int)
-        search_keyword = request.args.get('search', '')
-        work_div = request.args.get('work_div', '')
-        start_date = request.args.get('start_date', '')
-        end_date = request.args.get('end_date', '')
-        
-        # 기본 쿼리
-        query = SuccessfulBid.query
+        return list_response(
+            SuccessfulBid, filter_successful_bids(request.args), SuccessfulBid.openg_dt, SUCCESSFUL_BID_FILTERS
+        )
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def export_response(model, filtered, sort_column, filename):
+    """목록 조회와 같은 검색 조건의 전체 결과를 NDJSON/CSV로 스트리밍 (format 파라미터, 기본 ndjson)
+    
+    ORM 객체 대신 컬럼 tuple을 yield_per로 DB 커서에서 나눠 읽어 결과 크기와 상관없이 일정한 메모리 사용
+    """
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'error': f"지원하지 않는 형식입니다: {export_format} ({', '.join(EXPORT_FORMATS)})"}), 400
+    
+    query = filtered[0]
+    columns = [column.name for column in model.__table__.columns]
+    rows = query.with_entities(*[getattr(model, name) for name in columns]).order_by(
+        sort_column.desc(), model.id.desc()
+    ).yield_per(DEFAULT_BATCH_SIZE)
+    
+    kwargs = {'bom': request.args.get('bom', 'true').lower() != 'false'} if export_format == 'csv' else {}
+    content_type, extension = EXPORT_FORMATS[export_format]
+    response = Response(stream_with_context(EXPORTERS[export_format](rows, columns, **kwargs)), content_type=content_type)
+    response.headers['Content-Disposition'] = (
+        f'attachment; filename={filename}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{extension}'
+    )
+    return response
+
+@narajangter_bp.route('/bid-notices/export', methods=['GET'])
+def export_bid_notices():
+    """입찰공고 대량 내보내기 (NDJSON/CSV 스트리밍)"""
+    try:
+        return export_response(BidNotice, filter_bid_notices(request.args), BidNotice.rgst_dt, 'bid_notices')
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/successful-bids/export', methods=['GET'])
+def export_successful_bids():
+    """낙찰정보 대량 내보내기 (NDJSON/CSV 스트리밍)"""
+    try:
+        return export_response(
+            SuccessfulBid, filter_successful_bids(request.args), SuccessfulBid.openg_dt, 'successful_bids'
+        )
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def create_processor(service_keys):
+    """활성 키가 여러 개면 공유 키 풀로 호출을 나눠 보내는 BatchProcessor"""
+    key_pool = get_key_pool() if len(service_keys) > 1 else None
+    return BatchProcessor(db, service_keys[0], key_pool=key_pool)
+
+def enqueue_sync(service_keys, job_id, run):
+    """동기화 작업을 백그라운드 큐에 등록하고 202 응답 반환
+    
+    run은 워커 스레드에서 BatchProcessor를 인자로 호출됨
+    """
+    processor = create_processor(service_keys)
+    get_job_queue().submit(
+        job_id,
+        current_app._get_current_object(),
+        lambda: run(processor),
+        progress=processor.progress,
+        cancel=processor.cancel
+    )
+    return jsonify({
+        'job_id': job_id,
+        'status': 'queued',
+        'message': f'동기화 작업이 등록되었습니다. (작업 #{job_id})',
+        'status_url': f'/api/narajangter/sync-jobs/{job_id}'
+    }), 202
+
+def check_sync_request():
+    """동기화 요청 공통 검증 - (활성 서비스 키 목록, 오류 응답)"""
+    service_keys = get_active_service_keys()
+    if not service_keys:
+        return None, (jsonify({'error': 'API 서비스 키가 설정되지 않았습니다.'}), 400)
+    
+    pool = get_key_pool()
+    pool.set_keys(service_keys)
+    if pool.remaining() <= 0:
+        return None, (jsonify({
+            'error': '오늘의 API 호출 한도를 모두 사용했습니다.',
+            'retry_after': get_quota_manager().seconds_until_reset()
+        }), 429)
+    return service_keys, None
+
+def sync_job_status(job):
+    """작업 기록 + 실행 중 진행 상황"""
+    data = job.to_dict()
+    live = get_job_queue().get(job.id)
+    if live:
+        data.update({key: value for key, value in live.items() if key != 'error' or value})
+        if live['queue_status'] == 'error' and data['status'] in ('pending', 'running'):
+            data['status'] = 'failed'
+    return data
+
+@narajangter_bp.route('/sync-bid-notices', methods=['POST'])
+def sync_bid_notices():
+    """입찰공고 동기화 작업 등록 (백그라운드 실행, 202 + 작업 ID 반환)
+    
+    기간을 지정하지 않으면 마지막 동기화 이후 변경분만 조회 (증분 동기화)
+    """
+    try:
+        service_keys, error = check_sync_request()
+        if error:
+            return error
         
-        # 검색 조건 적용
-        if search_keyword:
-            query = query.filter(SuccessfulBid.scsbid_corp_nm.contains(search_keyword))
+        data = request.get_json(silent=True) or {}
+        start_date = data.get('start_date')
+        end_date = data.get('end_date')
+        jobs = SyncJobStore(db)
         
-        if work_div:
-            query = query.filter(SuccessfulBid.work_div_nm == work_div)
+        if start_date or end_date:
+            start_date = start_date or (datetime.now() - timedelta(days=30)).strftime('%Y%m%d')
+            end_date = end_date or datetime.now().strftime('%Y%m%d')
+            try:
+                plan_windows('bid_notice', start_date, end_date)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            job_id = jobs.create('bid_notice', start_date, end_date)
+            return enqueue_sync(
+                service_keys, job_id,
+                lambda processor: processor.sync_bid_notices_optimized(start_date, end_date, job_id=job_id)
+            )
         
-        if start_date:
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            query = query.filter(SuccessfulBid.openg_dt >= start_dt)
+        window_start, window_end = create_processor(service_keys).next_incremental_window()
+        job_id = jobs.create('bid_notice', window_start, window_end, incremental=True)
+        return enqueue_sync(
+            service_keys, job_id,
+            lambda processor: processor.sync_bid_notices_incremental(job_id=job_id)
+        )
+            
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/sync-successful-bids', methods=['POST'])
+def sync_successful_bids():
+    """낙찰정보 동기화 작업 등록 (개찰일 기준, 기본 최근 7일)"""
+    try:
+        service_keys, error = check_sync_request()
+        if error:
+            return error
         
-        if end_date:
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-            query = query.filter(SuccessfulBid.openg_dt <= end_dt)
+        data = request.get_json(silent=True) or {}
+        start_date = data.get('start_date', (datetime.now() - timedelta(days=6)).strftime('%Y%m%d'))
+        end_date = data.get('end_date', datetime.now().strftime('%Y%m%d'))
+        try:
+            plan_windows('successful_bid', start_date, end_date)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        # 페이지네이션
-        pagination = query.order_by(SuccessfulBid.openg_dt.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
+        job_id = SyncJobStore(db).create('successful_bid', start_date, end_date)
+        return enqueue_sync(
+            service_keys, job_id,
+            lambda processor: processor.sync_successful_bids_optimized(start_date, end_date, job_id=job_id)
         )
-        
+            
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/sync-jobs', methods=['GET'])
+def list_sync_jobs():
+    """최근 동기화 작업 목록"""
+    try:
+        limit = min(request.args.get('limit', 20, type=int), 100)
+        jobs = SyncJob.query.order_by(SyncJob.id.desc()).limit(limit).all()
         return jsonify({
-            'items': [item.to_dict() for item in pagination.items],
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'current_page': page,
-            'per_page': per_page
-        }), 200
+            'jobs': [sync_job_status(job) for job in jobs],
+            'pending': get_job_queue().pending_count()
+        })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@narajangter_bp.route('/sync-bid-notices', methods=['POST'])
-def sync_bid_notices():
-    """나라장터 API에서 입찰공고 데이터 동기화"""
+@narajangter_bp.route('/sync-jobs/<int:job_id>', methods=['GET'])
+def get_sync_job(job_id):
+    """동기화 작업 진행 상황 및 결과 조회"""
+    job = db.session.get(SyncJob, job_id)
+    if job is None:
+        return jsonify({'error': '동기화 작업을 찾을 수 없습니다.'}), 404
+    return jsonify(sync_job_status(job))
+
+@narajangter_bp.route('/sync-jobs/<int:job_id>/resume', methods=['POST'])
+def resume_sync_job(job_id):
+    """중단된 동기화 작업을 누락 페이지부터 재개 (백그라운드 실행)"""
     try:
-        service_key = get_active_service_key()
-        if not service_key:
-            return jsonify({'error': 'API 서비스 키가 설정되지 않았습니다.'}), 400
-        
-        data = request.get_json()
-        start_date = data.get('start_date', (datetime.now() - timedelta(days=30)).strftime('%Y%m%d'))
-        end_date = data.get('end_date', datetime.now().strftime('%Y%m%d'))
+        service_keys, error = check_sync_request()
+        if error:
+            return error
         
-        # API 호출 파라미터
-        params = {
-            'serviceKey': service_key,
-            'type': 'json',
-            'bidNtceBgnDt': start_date + '0000',  # YYYYMMDDHHMM 형식
-            'bidNtceEndDt': end_date + '2359',  # YYYYMMDDHHMM 형식
-            'numOfRows': '100',
-            'pageNo': '1'
-        }
+        job = db.session.get(SyncJob, job_id)
+        if job is None:
+            return jsonify({'error': '동기화 작업을 찾을 수 없습니다.'}), 404
         
-        response = requests.get(BID_NOTICE_API_URL, params=params)
+        live = get_job_queue().get(job_id)
+        if live and live['queue_status'] in ('queued', 'running'):
+            return jsonify({'error': '이미 실행 중인 작업입니다.'}), 409
         
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                items = data.get('response', {}).get('body', {}).get('items', [])
-                
-                if not isinstance(items, list):
-                    items = [items] if items else []
-                
-                synced_count = 0
-                for item in items:
-                    # 중복 체크
-                    existing = BidNotice.query.filter_by(
-                        bid_notice_no=item.get('bidNtceNo'),
-                        bid_notice_ord=item.get('bidNtceOrd')
-                    ).first()
-                    
-                    if not existing:
-                        try:
-                            bid_notice = BidNotice(
-                                bid_notice_no=item.get('bidNtceNo'),
-                                bid_notice_nm=item.get('bidNtceNm'),
-                                bid_notice_ord=item.get('bidNtceOrd', '00'),
-                                dminstt_nm=item.get('dminsttNm'),
-                                rgst_dt=parse_datetime(item.get('rgstDt')),
-                                bid_begin_dt=parse_datetime(item.get('bidBeginDt')),
-                                bid_close_dt=parse_datetime(item.get('bidClseDt')),
-                                openg_dt=parse_datetime(item.get('opengDt')),
-                                presmpt_price=int(item.get('presmptPrce', 0)) if item.get('presmptPrce') else None,
-                                basic_amount=int(item.get('asignBdgtAmt', 0)) if item.get('asignBdgtAmt') else None,
-                                bid_method_nm=item.get('bidMethdNm'),
-                                cntrct_cncls_mthd_nm=item.get('cntrctCnclsMthdNm'),
-                                work_div_nm=item.get('taskClsfcNm')
-                            )
-                            db.session.add(bid_notice)
-                            db.session.flush()  # 즉시 플러시하여 중복 체크
-                            synced_count += 1
-                        except Exception as e:
-                            db.session.rollback()
-                            # 중복이면 건너뛰기
-                            continue
-                
-                db.session.commit()
-                return jsonify({'message': f'{synced_count}건의 입찰공고가 동기화되었습니다.'}), 200
-                
-            except ValueError as e:
-                return jsonify({'error': f'JSON 파싱 오류: {str(e)}'}), 500
-        else:
-            return jsonify({'error': f'API 호출 실패: {response.status_code}'}), 500
-            
+        return enqueue_sync(service_keys, job_id, lambda processor: processor.resume_sync_job(job_id))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/sync-jobs/<int:job_id>/cancel', methods=['POST'])
+def cancel_sync_job(job_id):
+    """실행 중인 동기화 작업 취소 (완료된 페이지까지는 체크포인트로 남음)"""
+    if not get_job_queue().cancel(job_id):
+        return jsonify({'error': '실행 중인 작업이 아닙니다.'}), 409
+    return jsonify({'message': f'작업 #{job_id} 취소를 요청했습니다.'})
+
+@narajangter_bp.route('/sync-watermarks', methods=['GET'])
+def get_sync_watermarks():
+    """증분 동기화 기준점 조회"""
+    try:
+        watermarks = SyncWatermark.query.order_by(SyncWatermark.endpoint).all()
+        return jsonify({'watermarks': [watermark.to_dict() for watermark in watermarks]})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @narajangter_bp.route('/analytics/bid-amount', methods=['GET'])
+@cached_view('bid_notices')
 def get_bid_amount_analytics():
-    """입찰금액 분석 데이터"""
+    """입찰금액 분석 데이터 (수집 시 갱신되는 집계 테이블 조회)"""
     try:
         # 업무구분별 평균 추정가격
-        work_div_stats = db.session.query(
-            BidNotice.work_div_nm,
-            db.func.count(BidNotice.id).label('count'),
-            db.func.avg(BidNotice.presmpt_price).label('avg_price'),
-            db.func.sum(BidNotice.presmpt_price).label('total_price')
-        ).filter(
-            BidNotice.presmpt_price.isnot(None)
-        ).group_by(BidNotice.work_div_nm).all()
+        work_div_stats = read_rollup(db.session, 'rollup_bid_amount_by_work_div')
         
         # 월별 입찰공고 건수 및 금액
-        monthly_stats = db.session.query(
-            db.func.strftime('%Y-%m', BidNotice.rgst_dt).label('month'),
-            db.func.count(BidNotice.id).label('count'),
-            db.func.sum(BidNotice.presmpt_price).label('total_amount')
-        ).filter(
-            BidNotice.rgst_dt.isnot(None),
-            BidNotice.presmpt_price.isnot(None)
-        ).group_by(
-            db.func.strftime('%Y-%m', BidNotice.rgst_dt)
-        ).order_by('month').all()
+        monthly_stats = read_rollup(db.session, 'rollup_bid_amount_by_month')
         
         return jsonify({
             'work_div_stats': [
                 {
-                    'work_div_nm': stat.work_div_nm,
-                    'count': stat.count,
-                    'avg_price': float(stat.avg_price) if stat.avg_price else 0,
-                    'total_price': float(stat.total_price) if stat.total_price else 0
+                    'work_div_nm': stat['group_key'],
+                    'count': stat['row_count'],
+                    'avg_price': stat['total'] / stat['row_count'],
+                    'total_price': stat['total'],
+                    'min_price': stat['min_value'],
+                    'max_price': stat['max_value']
                 }
                 for stat in work_div_stats
             ],
             'monthly_stats': [
                 {
-                    'month': stat.month,
-                    'count': stat.count,
-                    'total_amount': float(stat.total_amount) if stat.total_amount else 0
+                    'month': stat['group_key'],
+                    'count': stat['row_count'],
+                    'total_amount': stat['total'],
+                    'min_amount': stat['min_value'],
+                    'max_amount': stat['max_value']
                 }
                 for stat in monthly_stats
             ]
@@ -285,28 +521,21 @@ def get_bid_amount_analytics():
         return jsonify({'error': str(e)}), 500
 
 @narajangter_bp.route('/analytics/successful-bid-rate', methods=['GET'])
+@cached_view('successful_bids')
 def get_successful_bid_rate_analytics():
-    """낙찰률 분석 데이터"""
+    """낙찰률 분석 데이터 (수집 시 갱신되는 집계 테이블 조회)"""
     try:
         # 업무구분별 평균 낙찰률
-        rate_stats = db.session.query(
-            SuccessfulBid.work_div_nm,
-            db.func.count(SuccessfulBid.id).label('count'),
-            db.func.avg(SuccessfulBid.scsbid_rate).label('avg_rate'),
-            db.func.min(SuccessfulBid.scsbid_rate).label('min_rate'),
-            db.func.max(SuccessfulBid.scsbid_rate).label('max_rate')
-        ).filter(
-            SuccessfulBid.scsbid_rate.isnot(None)
-        ).group_by(SuccessfulBid.work_div_nm).all()
+        rate_stats = read_rollup(db.session, 'rollup_successful_bid_rate_by_work_div')
         
         return jsonify({
             'rate_stats': [
                 {
-                    'work_div_nm': stat.work_div_nm,
-                    'count': stat.count,
-                    'avg_rate': float(stat.avg_rate) if stat.avg_rate else 0,
-                    'min_rate': float(stat.min_rate) if stat.min_rate else 0,
-                    'max_rate': float(stat.max_rate) if stat.max_rate else 0
+                    'work_div_nm': stat['group_key'],
+                    'count': stat['row_count'],
+                    'avg_rate': stat['total'] / stat['row_count'],
+                    'min_rate': stat['min_value'],
+                    'max_rate': stat['max_value']
                 }
                 for stat in rate_stats
             ]
@@ -314,3 +543,164 @@ def get_successful_bid_rate_analytics():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@narajangter_bp.route('/analytics/rollups/check', methods=['GET'])
+def check_analytics_rollups():
+    """집계 테이블과 원본 전체 집계 비교 (어긋난 그룹 목록)"""
+    try:
+        drift = check_rollups(db.session)
+        return jsonify({
+            'consistent': not any(drift.values()),
+            'drift': drift
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/analytics/rollups/rebuild', methods=['POST'])
+def rebuild_analytics_rollups():
+    """집계 테이블 재구축 (원본 테이블 전체 집계)"""
+    try:
+        return jsonify({'message': '집계 테이블 재구축 완료', 'groups': rebuild_rollups(db.session)}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+def snapshot_dir():
+    return current_app.config.get('SNAPSHOT_DIR', DEFAULT_SNAPSHOT_DIR)
+
+@narajangter_bp.route('/snapshots/export', methods=['POST'])
+def export_table_snapshots():
+    """입찰공고/낙찰정보 월별 파티션 Parquet/Arrow 스냅샷 내보내기
+    
+    기본은 증분 (새로 생겼거나 바뀐 월만 기록) - full=true면 전체 월, months를 지정하면 해당 월을 다시 씀
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        results = export_snapshots(
+            db.session,
+            snapshot_dir(),
+            tables=data.get('tables'),
+            snapshot_format=data.get('format', 'parquet'),
+            full=bool(data.get('full', False)),
+            months=data.get('months')
+        )
+        return jsonify({'message': '스냅샷 내보내기 완료', 'results': results}), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except RuntimeError as e:
+        return jsonify({'error': str(e)}), 503
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/snapshots', methods=['GET'])
+def list_table_snapshots():
+    """테이블별 스냅샷 매니페스트 (형식, 컬럼 타입, 월별 건수/파일 크기)"""
+    try:
+        snapshots = {}
+        for table in SNAPSHOT_TABLES:
+            manifest = read_manifest(snapshot_dir(), table)
+            if manifest is not None:
+                manifest['partitions'] = {
+                    month: {key: partition[key] for key in ('rows', 'bytes', 'written_at')}
+                    for month, partition in manifest['partitions'].items()
+                }
+            snapshots[table] = manifest
+        return jsonify({'snapshots': snapshots}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/snapshots/<table>/<month>', methods=['GET'])
+def download_table_snapshot(table, month):
+    """월별 스냅샷 파티션 파일 다운로드"""
+    manifest = read_manifest(snapshot_dir(), table) if table in SNAPSHOT_TABLES else None
+    if manifest is None or month not in manifest['partitions']:
+        return jsonify({'error': '스냅샷 파티션이 없습니다.'}), 404
+    filename = SNAPSHOT_FORMATS[manifest['format']]
+    return send_from_directory(
+        os.path.join(snapshot_dir(), table, f'month={month}'), filename,
+        as_attachment=True, download_name=f'{table}_{month}.{filename.rsplit(".", 1)[1]}'
+    )
+
+
+@narajangter_bp.route('/stats/http-client', methods=['GET'])
+def get_http_client_stats():
+    """공유 HTTP 클라이언트 연결 풀 통계 (async: 동기화 조회 엔진의 aiohttp 요청)"""
+    try:
+        return jsonify(get_http_client().stats()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/stats/upstream-cache', methods=['GET'])
+def get_upstream_cache_stats():
+    """data.go.kr 응답 캐시 적중률 및 저장 현황"""
+    try:
+        cache = get_upstream_cache()
+        if cache is None:
+            return jsonify({'enabled': False}), 200
+        
+        return jsonify({'enabled': True, **cache.stats()}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/stats/count-cache', methods=['GET'])
+def get_count_cache_stats():
+    """목록 건수 캐시 적중률 및 테이블별 세대"""
+    try:
+        return jsonify(get_count_cache().stats()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/stats/response-cache', methods=['GET'])
+def get_response_cache_stats():
+    """조회 응답 캐시 적중률 및 304 응답 수"""
+    try:
+        cache = get_response_cache()
+        if cache is None:
+            return jsonify({'enabled': False}), 200
+        
+        return jsonify({'enabled': True, **cache.stats()}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/stats/shared-cache', methods=['GET'])
+def get_shared_cache_stats():
+    """워커 간 공유 캐시 계층 적중률 및 데이터 세대"""
+    try:
+        cache = get_shared_cache()
+        if cache is None:
+            return jsonify({'enabled': False}), 200
+        
+        generations = dict(zip(DATA_TABLES, cache.generations.snapshot(DATA_TABLES)))
+        return jsonify({'enabled': True, **cache.stats(), 'generations': generations}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/stats/quota', methods=['GET'])
+def get_quota_stats():
+    """활성 서비스키의 일일 호출 한도 사용 현황"""
+    try:
+        service_key = get_active_service_key()
+        if not service_key:
+            return jsonify({'error': 'API 서비스 키가 설정되지 않았습니다.'}), 400
+        
+        return jsonify(get_quota_manager().usage(service_key)), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/stats/keys', methods=['GET'])
+def get_key_pool_stats():
+    """서비스키 풀 키별 잔여 한도, 선택 횟수, 제외 상태"""
+    try:
+        pool = get_key_pool()
+        pool.set_keys(get_active_service_keys())
+        return jsonify({'keys': pool.stats(), 'remaining': pool.remaining()}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@narajangter_bp.route('/stats/circuit-breakers', methods=['GET'])
+def get_circuit_breaker_stats():
+    """엔드포인트별 서킷 브레이커 상태"""
+    try:
+        return jsonify(breaker_stats()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -683,6 +683,32 @@ async function loadApiConfig() {
 }
 
 // 데이터 동기화 함수들
+async function waitForSyncJob(jobId) {
+    // 백그라운드 동기화 작업이 끝날 때까지 진행 상황 조회
+    while (true) {
+        await new Promise(resolve => setTimeout(resolve, 2000));
+        
+        const response = await fetch(`/api/narajangter/sync-jobs/${jobId}`);
+        const job = await response.json();
+        if (!response.ok) {
+            showToast(job.error || '동기화 작업 조회에 실패했습니다.', true);
+            return;
+        }
+        
+        if (job.status === 'completed') {
+            showToast(`${formatNumber(job.inserted_count)}건의 입찰공고가 동기화되었습니다.`);
+            return;
+        }
+        if (job.status === 'failed' || job.status === 'cancelled') {
+            showToast(job.error || '데이터 동기화에 실패했습니다.', true);
+            return;
+        }
+        if (job.progress) {
+            showToast(`동기화 중... ${job.progress.percent}% (${formatNumber(job.progress.fetched)}/${formatNumber(job.progress.total_count)}건)`);
+        }
+    }
+}
+
 async function syncBidNotices() {
     await syncBidNoticesWithDate();
 }
@@ -714,6 +740,11 @@ async function syncBidNoticesWithDate() {
         
         if (response.ok) {
             showToast(data.message);
+            if (data.job_id) {
+                // 작업은 서버에서 계속 진행되므로 화면은 바로 사용 가능하게 둠
+                hideLoading();
+                await waitForSyncJob(data.job_id);
+            }
             loadBidNotices(1);
             loadDashboardData();
         } else {
@@ -8,6 +8,12 @@ import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from .http_client import get_http_client
+from .quota import QuotaExceededError, get_quota_manager
+from .resilience import RetryPolicy, RetryBudget, get_circuit_breaker, get_retry_budget
+from .upstream_cache import cached_response, get_upstream_cache
+from .xml_decoder import decode_response
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -20,7 +26,8 @@ class APIHelper:
     
     DEFAULT_TIMEOUT = 30  # 기본 타임아웃 30초
     MAX_RETRIES = 3      # 최대 재시도 횟수
-    RETRY_DELAY = 2      # 재시도 간격 (초)
+    RETRY_DELAY = 2      # 재시도 기본 간격 (초) - 지수 백오프 + 지터 적용
+    RETRY_POLICY = RetryPolicy(max_attempts=MAX_RETRIES, base_delay=RETRY_DELAY)
     
     @staticmethod
     def call_api(
@@ -28,7 +35,8 @@ class APIHelper:
         params: Dict[str, Any],
         method: str = 'GET',
         timeout: int = None,
-        retry: bool = True
+        retry: bool = True,
+        use_cache: bool = True
     ) -> Optional[requests.Response]:
         """
         API 호출 with 모니터링 및 재시도
@@ -39,22 +47,48 @@ class APIHelper:
             method: HTTP 메소드
             timeout: 타임아웃 (초)
             retry: 재시도 여부
+            use_cache: 응답 캐시 사용 여부 (GET 요청, 캐시가 설정된 경우)
         
         Returns:
             Response 객체 또는 None
         """
         timeout = timeout or APIHelper.DEFAULT_TIMEOUT
-        max_retries = APIHelper.MAX_RETRIES if retry else 1
+        max_retries = APIHelper.RETRY_POLICY.max_attempts if retry else 1
+        client = get_http_client()
+        service_key = params.get('serviceKey') or params.get('ServiceKey')
+        breaker = get_circuit_breaker(url)
+        budget = get_retry_budget()
+        cache = get_upstream_cache() if use_cache and method.upper() == 'GET' else None
+        
+        # 캐시 적중 시 호출 한도를 쓰지 않고 저장된 응답 반환
+        if cache is not None:
+            cached = cache.get(url, params)
+            if cached is not None:
+                logger.info(f"API Cache Hit - URL: {url}")
+                return cached_response(url, *cached)
         
         for attempt in range(max_retries):
+            # 서킷이 열려 있으면 엔드포인트 호출 생략
+            if not breaker.allow_request():
+                logger.warning(f"Circuit open - URL: {url}, retry after {breaker.retry_after():.1f}s")
+                return None
+            
             start_time = time.time()
+            attempt_timeout = APIHelper.RETRY_POLICY.timeout(attempt, timeout)
+            budget.record_request()
             
             try:
+                # 서비스키별 호출 속도 조절 및 일일 한도 차감
+                if service_key:
+                    quota = get_quota_manager()
+                    quota.wait(service_key)
+                    quota.consume(service_key)
+                
                 # API 호출
                 if method.upper() == 'GET':
-                    response = requests.get(url, params=params, timeout=timeout)
+                    response = client.get(url, params=params, timeout=attempt_timeout)
                 elif method.upper() == 'POST':
-                    response = requests.post(url, json=params, timeout=timeout)
+                    response = client.post(url, json=params, timeout=attempt_timeout)
                 else:
                     raise ValueError(f"Unsupported method: {method}")
                 
@@ -69,42 +103,65 @@ class APIHelper:
                 
                 # 성공 응답 체크
                 if response.status_code == 200:
+                    breaker.record_success()
+                    if cache is not None:
+                        cache.put(url, params, response.content, response.headers.get('Content-Type'))
                     return response
                 else:
                     logger.warning(f"API returned non-200 status: {response.status_code}")
                     
                     # 5xx 에러는 재시도
-                    if response.status_code >= 500 and attempt < max_retries - 1:
-                        logger.info(f"Retrying after {APIHelper.RETRY_DELAY}s... (Attempt {attempt + 1}/{max_retries})")
-                        time.sleep(APIHelper.RETRY_DELAY)
-                        continue
+                    if response.status_code >= 500:
+                        breaker.record_failure()
+                        if APIHelper._should_retry(attempt, max_retries, budget):
+                            continue
+                    else:
+                        breaker.record_success()
                     
                     return response
                     
             except requests.exceptions.Timeout:
                 elapsed_time = time.time() - start_time
-                logger.error(f"API Timeout - URL: {url}, Timeout: {timeout}s, Elapsed: {elapsed_time:.2f}s")
+                logger.error(f"API Timeout - URL: {url}, Timeout: {attempt_timeout}s, Elapsed: {elapsed_time:.2f}s")
+                breaker.record_failure()
                 
-                if attempt < max_retries - 1:
-                    logger.info(f"Retrying after timeout... (Attempt {attempt + 1}/{max_retries})")
-                    time.sleep(APIHelper.RETRY_DELAY)
+                if APIHelper._should_retry(attempt, max_retries, budget):
                     continue
+                break
                     
             except requests.exceptions.ConnectionError as e:
                 logger.error(f"Connection Error - URL: {url}, Error: {e}")
+                breaker.record_failure()
                 
-                if attempt < max_retries - 1:
-                    logger.info(f"Retrying after connection error... (Attempt {attempt + 1}/{max_retries})")
-                    time.sleep(APIHelper.RETRY_DELAY)
+                if APIHelper._should_retry(attempt, max_retries, budget):
                     continue
+                break
+                    
+            except QuotaExceededError as e:
+                logger.error(f"Quota Exceeded - URL: {url}, {e}")
+                break
                     
             except Exception as e:
                 logger.error(f"Unexpected Error - URL: {url}, Error: {e}")
                 break
         
-        logger.error(f"API call failed after {max_retries} attempts")
+        logger.error(f"API call failed after {attempt + 1} attempts")
         return None
     
+    @staticmethod
+    def _should_retry(attempt: int, max_retries: int, budget: RetryBudget) -> bool:
+        """남은 시도 횟수와 재시도 예산 확인 후 백오프 대기"""
+        if attempt >= max_retries - 1:
+            return False
+        if not budget.can_retry():
+            logger.warning("Retry budget exhausted - giving up")
+            return False
+        
+        delay = APIHelper.RETRY_POLICY.delay(attempt)
+        logger.info(f"Retrying after {delay:.2f}s... (Attempt {attempt + 1}/{max_retries})")
+        time.sleep(delay)
+        return True
+    
     @staticmethod
     def parse_api_response(response: requests.Response) -> Dict[str, Any]:
         """
@@ -120,6 +177,7 @@ class APIHelper:
             'success': False,
             'data': None,
             'error': None,
+            'result_code': None,
             'total_count': 0,
             'items': []
         }
@@ -129,8 +187,8 @@ class APIHelper:
             return result
         
         try:
-            # JSON 파싱 시도
-            data = response.json()
+            # JSON(orjson 사용 가능 시 orjson) 또는 XML(iterparse) 파싱
+            data = decode_response(response.content)
             
             # 공공데이터 표준 응답 형식 체크
             if 'response' in data:
@@ -139,6 +197,7 @@ class APIHelper:
                 
                 result_code = header.get('resultCode')
                 result_msg = header.get('resultMsg')
+                result['result_code'] = result_code
                 
                 if result_code == '00':
                     # 성공
@@ -161,14 +220,8 @@ class APIHelper:
                 result['success'] = True
                 
         except ValueError as e:
-            # JSON 파싱 실패 - XML 응답일 가능성
-            result['error'] = f"JSON parsing failed: {e}"
-            
-            # XML 응답 체크
-            if response.text.startswith('<?xml'):
-                result['error'] += " (Response is XML format)"
-                # XML 파싱 로직 추가 가능
-            
+            # JSON/XML 형식 오류 (HTML 오류 페이지 등)
+            result['error'] = f"Response parsing failed: {e}"
             logger.error(result['error'])
             
         except Exception as e:
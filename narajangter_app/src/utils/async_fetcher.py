@@ -0,0 +1,586 @@
+"""
+비동기 페이지 조회 엔진
+asyncio + aiohttp 기반 병렬 조회 (동시성 제한, 호스트별 연결 제한, 취소 지원)
+"""
+import queue
+import asyncio
+import logging
+import threading
+from typing import List, Dict, Any, Optional, Iterable, Iterator, AsyncIterator, Tuple, Set
+
+import aiohttp
+
+from .http_client import get_http_client
+from .key_pool import KeyPool, EJECT_RESULT_CODES
+from .quota import QuotaManager, QuotaReservation, QuotaExceededError
+from .resilience import RetryPolicy, RetryBudget, get_circuit_breaker, get_retry_budget
+from .upstream_cache import UpstreamCache
+from .xml_decoder import decode_response
+
+logger = logging.getLogger(__name__)
+
+# 일시적 장애로 간주해 재시도하는 data.go.kr resultCode
+# (01 APPLICATION_ERROR, 02 DB_ERROR, 04 HTTP_ERROR, 05 SERVICETIME_OUT, 99 UNKNOWN_ERROR)
+RETRYABLE_RESULT_CODES = {'01', '02', '04', '05', '99'}
+
+
+class PageFetchError(Exception):
+    """페이지 조회 실패"""
+
+    def __init__(self, message: str, retryable: bool = True, circuit_open: bool = False, rotate_key: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+        self.circuit_open = circuit_open
+        self.rotate_key = rotate_key  # 키를 풀에서 제외했으므로 다른 키로 즉시 재시도
+
+
+def extract_items(body: Optional[Dict]) -> List[Dict]:
+    """응답 body에서 items 목록 추출 (단일 객체 응답 포함)"""
+    if not body:
+        return []
+    items = body.get('items', [])
+    if isinstance(items, list):
+        return items
+    return [items] if items else []
+
+
+class AsyncPageFetcher:
+    """asyncio 기반 페이지 조회 클래스"""
+
+    DEFAULT_CONCURRENCY = 10     # 동시 요청 수
+    DEFAULT_LIMIT_PER_HOST = 10  # 호스트별 최대 연결 수
+    DEFAULT_TIMEOUT = 30         # 요청 타임아웃 (초)
+    DEFAULT_MAX_IN_FLIGHT = 20   # 스트리밍 시 소비 대기 중인 최대 페이지 수
+    DEFAULT_KEY_BLOCK = 20       # 키 풀 사용 시 키별로 한 번에 예약하는 호출 수
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        timeout: int = DEFAULT_TIMEOUT,
+        quota_manager: Optional[QuotaManager] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        cache: Optional[UpstreamCache] = None,
+        key_pool: Optional[KeyPool] = None,
+        key_block: int = DEFAULT_KEY_BLOCK
+    ):
+        self.concurrency = max(1, concurrency)
+        self.limit_per_host = max(1, limit_per_host)
+        self.timeout = timeout
+        self.quota_manager = quota_manager
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget or get_retry_budget()
+        self.cache = cache
+        self.key_pool = key_pool
+        self.key_block = max(1, key_block)
+        self.retry_count = 0
+        self.cache_hits = 0
+        self.total_count = 0
+        self.total_pages = 0
+        self.api_call_count = 0
+        self.failed_pages: List[Tuple[int, int]] = []  # (구간 번호, 페이지 번호)
+        self.windows: List[Dict[str, Any]] = []  # 구간별 전체 건수/페이지 수/실패 페이지
+        self.cancelled = False
+        self.quota_error: Optional[QuotaExceededError] = None
+        self._reservation: Optional[QuotaReservation] = None
+        self._key_reservations: Dict[str, QuotaReservation] = {}  # 키 풀 사용 시 키별 예약 블록
+        self._key_locks: Dict[str, asyncio.Lock] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._main_task: Optional[asyncio.Task] = None
+
+    def create_session(self) -> aiohttp.ClientSession:
+        """연결 제한이 적용된 세션 생성 (공유 HTTP 클라이언트를 통해 만들어 통계에 포함)"""
+        return get_http_client().create_async_session(self.concurrency, self.limit_per_host, self.timeout)
+
+    async def _acquire_call(self, params: Dict) -> None:
+        """호출 속도 조절 및 일일 한도 차감 (한도 초과 시 QuotaExceededError)
+
+        예약분에서 차감하고, 예약이 없거나 소진된 경우에만 스레드에서 DB에 반영 (이벤트 루프를 막지 않음)
+        """
+        service_key = params.get('ServiceKey') or params.get('serviceKey')
+        if self.quota_manager is None or not service_key:
+            return
+
+        delay = self.quota_manager.pace(service_key)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.key_pool is not None:
+            await self._use_key_reservation(service_key)
+        elif self._reservation is None or not self._reservation.use():
+            await asyncio.to_thread(self.quota_manager.consume, service_key)
+
+    async def _use_key_reservation(self, service_key: str) -> None:
+        """키별 예약 블록에서 호출 1회 차감 - 블록이 소진되면 다음 블록 예약 (같은 키는 한 번만 예약)"""
+        reservation = self._key_reservations.get(service_key)
+        if reservation is not None and reservation.use():
+            return
+
+        lock = self._key_locks.setdefault(service_key, asyncio.Lock())
+        async with lock:
+            reservation = self._key_reservations.get(service_key)
+            if reservation is not None and reservation.use():
+                return
+            reservation = await asyncio.to_thread(self._reserve_key_block, service_key, reservation)
+            self._key_reservations[service_key] = reservation
+            reservation.use()
+
+    def _reserve_key_block(self, service_key: str, previous: Optional[QuotaReservation]) -> QuotaReservation:
+        """소진된 블록 정산 후 새 블록 예약 (잔여 한도가 블록보다 적으면 잔여분만, 없으면 QuotaExceededError)"""
+        if previous is not None:
+            previous.release()
+        try:
+            return self.quota_manager.reserve(service_key, self.key_block)
+        except QuotaExceededError as e:
+            if e.remaining <= 0:
+                raise
+            return self.quota_manager.reserve(service_key, e.remaining)
+
+    def _release_reservations(self) -> None:
+        """실사용량 반영 후 남은 예약 반환 (작업 단위 예약 + 키별 예약 블록)"""
+        reservations = list(self._key_reservations.values())
+        if self._reservation is not None:
+            reservations.append(self._reservation)
+        for reservation in reservations:
+            reservation.release()
+        self._reservation = None
+        self._key_reservations = {}
+        self._key_locks = {}
+
+    async def _request_page(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Dict,
+        page_no: int,
+        attempt: int = 0
+    ) -> Dict:
+        """단일 페이지 1회 조회 - 성공 시 응답 body, 실패 시 PageFetchError"""
+        params_copy = params.copy()
+        params_copy['pageNo'] = str(page_no)
+
+        # 캐시 적중 시 호출 한도/서킷 상태와 관계없이 바로 반환
+        # (캐시는 디스크 SQLite이므로 이벤트 루프를 막지 않도록 스레드에서 조회/저장)
+        cached = await asyncio.to_thread(self.cache.get, url, params_copy) if self.cache is not None else None
+        if cached is not None:
+            try:
+                self.cache_hits += 1
+                return decode_response(cached[0])['response']['body']
+            except (ValueError, KeyError, TypeError):
+                logger.warning(f"Page {page_no}: 캐시 응답 형식 오류 - 다시 조회")
+
+        breaker = get_circuit_breaker(url)
+        if not breaker.allow_request():
+            raise PageFetchError("서킷 차단 중", circuit_open=True)
+
+        timeout = self.retry_policy.timeout(attempt, self.timeout)
+
+        # 키 풀이 있으면 호출마다 풀에서 키 선택 (사용 가능한 키가 없으면 QuotaExceededError)
+        service_key = None
+        try:
+            if self.key_pool is not None:
+                service_key = await asyncio.to_thread(self.key_pool.acquire)  # 주기적 가중치 갱신에 DB 조회
+                params_copy['serviceKey' if 'serviceKey' in params_copy else 'ServiceKey'] = service_key
+                try:
+                    await self._acquire_call(params_copy)
+                except QuotaExceededError as e:
+                    self.key_pool.eject(service_key, str(e))
+                    raise PageFetchError(f"서비스키 한도 소진: {e}", rotate_key=True)
+            else:
+                await self._acquire_call(params)
+        except BaseException:
+            # 호출하지 못했으므로 반개방 탐색 슬롯을 돌려줌 (그대로 두면 서킷이 반개방에 고정됨)
+            breaker.release_probe()
+            raise
+        self.retry_budget.record_request()
+        try:
+            async with session.get(url, params=params_copy, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                self.api_call_count += 1
+
+                if response.status != 200:
+                    retryable = response.status >= 500 or response.status == 429
+                    if retryable:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                    raise PageFetchError(f"HTTP {response.status}", retryable=retryable)
+
+                content = await response.read()
+                content_type = response.headers.get('Content-Type')
+                data = decode_response(content)
+        except asyncio.TimeoutError:
+            breaker.record_failure()
+            raise PageFetchError(f"타임아웃 ({timeout:.0f}s)")
+        except aiohttp.ClientError as e:
+            breaker.record_failure()
+            raise PageFetchError(str(e))
+        except ValueError as e:
+            breaker.record_success()
+            raise PageFetchError(f"응답 파싱 실패: {e}")
+
+        breaker.record_success()
+        try:
+            header = data['response']['header']
+            if header['resultCode'] == '00':
+                if self.cache is not None:
+                    await asyncio.to_thread(self.cache.put, url, params_copy, content, content_type)
+                return data['response']['body']
+        except (KeyError, TypeError):
+            raise PageFetchError("응답 형식 오류", retryable=False)
+
+        result_code = header.get('resultCode')
+        if service_key is not None and result_code in EJECT_RESULT_CODES:
+            self.key_pool.eject(service_key, f"{result_code} {header.get('resultMsg') or EJECT_RESULT_CODES[result_code]}")
+            raise PageFetchError(f"API Error ({result_code}): {header.get('resultMsg')}", rotate_key=True)
+        raise PageFetchError(
+            f"API Error ({result_code}): {header.get('resultMsg')}",
+            retryable=result_code in RETRYABLE_RESULT_CODES
+        )
+
+    def _retry_delay(self, url: str, error: 'PageFetchError', attempt: int) -> Optional[float]:
+        """재시도 대기 시간 - 재시도 불가 시 None"""
+        if error.rotate_key:
+            return 0.0
+        if not error.retryable or attempt + 1 >= self.retry_policy.max_attempts:
+            return None
+        # 서킷 차단으로 호출하지 않은 경우는 재시도 예산을 쓰지 않음
+        if not error.circuit_open and not self.retry_budget.can_retry():
+            return None
+        return max(self.retry_policy.delay(attempt), get_circuit_breaker(url).retry_after())
+
+    async def fetch_page(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Dict,
+        page_no: int
+    ) -> Optional[Dict]:
+        """단일 페이지 조회 (백오프 재시도 포함) - 성공 시 응답 body 반환"""
+        attempt = 0
+        while True:
+            try:
+                return await self._request_page(session, url, params, page_no, attempt)
+            except PageFetchError as e:
+                delay = self._retry_delay(url, e, attempt)
+                if delay is None:
+                    logger.error(f"Page {page_no}: {e}")
+                    return None
+                logger.warning(f"Page {page_no}: {e} - {delay:.1f}s 후 재시도 ({attempt + 1}/{self.retry_policy.max_attempts})")
+                self.retry_count += 1
+                if not e.rotate_key:
+                    attempt += 1
+                await asyncio.sleep(delay)
+
+    async def iter_requests(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        requests: Iterable[Tuple[Any, Dict, int]],
+        max_in_flight: int = 0
+    ) -> AsyncIterator[Tuple[Any, int, Optional[Dict]]]:
+        """(tag, params, page_no) 요청을 병렬 조회하며 완료 순서대로 (tag, page_no, body) 반환
+
+        여러 기간 구간의 페이지를 하나의 작업 풀에서 함께 조회할 때 사용.
+        실패한 요청은 백오프 후 큐 뒤쪽에 다시 넣어 다른 요청 조회를 막지 않고,
+        재시도를 모두 소진한 요청만 body=None으로 반환.
+        max_in_flight > 0 이면 소비되지 않은 결과가 그 수에 도달할 때 조회를 멈춤
+        """
+        pending: asyncio.Queue = asyncio.Queue()
+        for request in requests:
+            pending.put_nowait(request)
+
+        total = pending.qsize()
+        if total == 0:
+            return
+
+        loop = asyncio.get_running_loop()
+        results: asyncio.Queue = asyncio.Queue(maxsize=max_in_flight)
+        attempts: Dict[Tuple[Any, int], int] = {}
+        requeue_handles: List[asyncio.TimerHandle] = []
+
+        async def worker():
+            while True:
+                request = await pending.get()
+                tag, params, page_no = request
+                attempt = attempts.get((tag, page_no), 0)
+                try:
+                    body = await self._request_page(session, url, params, page_no, attempt)
+                except asyncio.CancelledError:
+                    raise
+                except PageFetchError as e:
+                    delay = self._retry_delay(url, e, attempt)
+                    if delay is not None:
+                        attempts[(tag, page_no)] = attempt if e.rotate_key else attempt + 1
+                        self.retry_count += 1
+                        logger.warning(f"Page {page_no}: {e} - {delay:.1f}s 후 재조회 ({attempt + 1}/{self.retry_policy.max_attempts})")
+                        requeue_handles.append(loop.call_later(delay, pending.put_nowait, request))
+                        continue
+                    logger.error(f"Page {page_no}: {e}")
+                    body = None
+                except QuotaExceededError as e:
+                    self.quota_error = e
+                    logger.error(f"Page {page_no}: {e}")
+                    body = None
+                except Exception as e:
+                    logger.error(f"Page {page_no} 처리 오류: {e}")
+                    body = None
+                await results.put((tag, page_no, body))
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(self.concurrency, total))]
+        try:
+            for _ in range(total):
+                yield await results.get()
+        finally:
+            for handle in requeue_handles:
+                handle.cancel()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def iter_pages(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Dict,
+        pages: Iterable[int],
+        max_in_flight: int = 0
+    ) -> AsyncIterator[Tuple[int, Optional[Dict]]]:
+        """페이지를 병렬 조회하며 완료 순서대로 (page_no, body) 반환"""
+        requests = ((None, params, page_no) for page_no in pages)
+        async for _, page_no, body in self.iter_requests(session, url, requests, max_in_flight):
+            yield page_no, body
+
+    async def iter_windows(
+        self,
+        url: str,
+        params_list: List[Dict],
+        max_pages: int = None,
+        max_in_flight: int = 0,
+        known_windows: Optional[List[Optional[Tuple[int, int]]]] = None,
+        completed: Optional[Dict[int, Set[int]]] = None
+    ) -> AsyncIterator[Tuple[int, int, List[Dict]]]:
+        """여러 조회 구간을 하나의 작업 풀에서 병렬 조회하며 (구간 번호, page_no, items) 반환
+
+        각 구간의 첫 페이지로 전체 건수를 확인한 뒤 모든 구간의 나머지 페이지를
+        함께 큐에 넣어 구간 수와 관계없이 동시성 한도까지 채워 조회.
+        max_pages는 구간별 최대 페이지 수.
+        재개 시 known_windows로 구간별 (전체 건수, 페이지 수)를 넘기면 첫 페이지 확인을
+        생략하고, completed에 있는 {구간 번호: 페이지 번호 집합}은 다시 조회하지 않음
+        """
+        known_windows = known_windows or []
+        completed = completed or {}
+        self.windows = [
+            {'total_count': 0, 'total_pages': 0, 'failed_pages': []}
+            for _ in params_list
+        ]
+        async with self.create_session() as session:
+            try:
+                probe = [
+                    index for index in range(len(params_list))
+                    if index >= len(known_windows) or known_windows[index] is None
+                ]
+                first_pages = await asyncio.gather(*[
+                    self.fetch_page(session, url, params_list[index], 1) for index in probe
+                ])
+                probed = dict(zip(probe, first_pages))
+
+                remaining = []
+                for index, params in enumerate(params_list):
+                    window = self.windows[index]
+                    if index in probed:
+                        if not probed[index]:
+                            window['failed_pages'].append(1)
+                            self.failed_pages.append((index, 1))
+                            continue
+                        window['total_count'] = int(probed[index].get('totalCount', 0) or 0)
+                        num_rows = int(params.get('numOfRows', 100))
+                        total_pages = (window['total_count'] + num_rows - 1) // num_rows
+                        if max_pages:
+                            total_pages = min(total_pages, max_pages)
+                        first_page = 2
+                    else:
+                        window['total_count'], total_pages = known_windows[index]
+                        first_page = 1
+                    window['total_pages'] = total_pages
+
+                    done = completed.get(index, set())
+                    remaining.extend(
+                        (index, params, page_no) for page_no in range(first_page, total_pages + 1)
+                        if page_no not in done
+                    )
+
+                self.total_count = sum(window['total_count'] for window in self.windows)
+                self.total_pages = sum(window['total_pages'] for window in self.windows)
+                logger.info(
+                    f"전체 {self.total_count}건, {self.total_pages}페이지 중 {len(remaining) + len(probed)}페이지 조회 "
+                    f"(구간 {len(params_list)}개, 동시성 {self.concurrency})"
+                )
+
+                for index, first_page in probed.items():
+                    if first_page and 1 not in completed.get(index, set()):
+                        yield index, 1, extract_items(first_page)
+
+                # 나머지 페이지 호출 수를 미리 예약 (캐시된 페이지 제외) - 한도 부족 시 작업 중단
+                if params_list:
+                    uncached = await asyncio.to_thread(self._uncached_count, url, remaining)
+                    await asyncio.to_thread(self._reserve_calls, params_list[0], uncached)
+
+                async for index, page_no, body in self.iter_requests(session, url, remaining, max_in_flight):
+                    if body is None:
+                        self.windows[index]['failed_pages'].append(page_no)
+                        self.failed_pages.append((index, page_no))
+                        continue
+                    yield index, page_no, extract_items(body)
+            except QuotaExceededError as e:
+                self.quota_error = e
+                logger.error(f"호출 한도 부족으로 조회 중단: {e}")
+            except asyncio.CancelledError:
+                self.cancelled = True
+                logger.warning("조회 취소됨")
+            finally:
+                # 실행당 한 번 - 취소/aclose 중에도 확실히 정산하도록 동기 호출
+                self._release_reservations()
+
+        if self.failed_pages:
+            logger.warning(f"실패한 페이지 {len(self.failed_pages)}개: {sorted(self.failed_pages)[:20]}")
+
+    async def iter_all_pages(
+        self,
+        url: str,
+        params: Dict,
+        max_pages: int = None,
+        max_in_flight: int = 0
+    ) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """첫 페이지로 전체 건수 확인 후 나머지 페이지를 병렬 조회하며 (page_no, items) 반환"""
+        async for _, page_no, items in self.iter_windows(url, [params], max_pages, max_in_flight):
+            yield page_no, items
+
+    async def fetch_all_pages_async(
+        self,
+        url: str,
+        params: Dict,
+        max_pages: int = None
+    ) -> List[Dict]:
+        """모든 페이지 조회 결과를 하나의 목록으로 반환"""
+        all_items: List[Dict] = []
+
+        async for page_no, items in self.iter_all_pages(url, params, max_pages):
+            all_items.extend(items)
+
+            # 진행 상황 로깅
+            if page_no % 10 == 0:
+                logger.info(f"진행: {len(all_items)}/{self.total_count}건 조회 완료")
+
+        logger.info(f"조회 완료: 총 {len(all_items)}건")
+        return all_items
+
+    def _uncached_count(self, url: str, requests: List[Tuple[Any, Dict, int]]) -> int:
+        if self.cache is None:
+            return len(requests)
+        cached = self.cache.contains_many(url, [{**params, 'pageNo': str(page_no)} for _, params, page_no in requests])
+        return cached.count(False)
+
+    def _reserve_calls(self, params: Dict, calls: int) -> None:
+        service_key = params.get('ServiceKey') or params.get('serviceKey')
+        if self.quota_manager is None or not service_key or calls <= 0 or self.key_pool is not None:
+            return
+        self._reservation = self.quota_manager.reserve(service_key, calls)
+
+    def fetch_all_pages(self, url: str, params: Dict, max_pages: int = None) -> List[Dict]:
+        """동기 코드에서 호출하는 진입점 (자체 이벤트 루프에서 실행)"""
+        return asyncio.run(self._run(self.fetch_all_pages_async(url, params, max_pages)))
+
+    def stream_pages(
+        self,
+        url: str,
+        params: Dict,
+        max_pages: int = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ) -> Iterator[Tuple[int, List[Dict]]]:
+        """백그라운드 스레드에서 조회하며 완료된 페이지를 (page_no, items)로 순차 반환
+
+        소비되지 않은 페이지는 최대 max_in_flight개까지만 메모리에 유지되고,
+        소비자가 느리면 조회가 대기함 (호출 스레드에서 DB 작업 가능)
+        """
+        for _, page_no, items in self.stream_windows(url, [params], max_pages, max_in_flight):
+            yield page_no, items
+
+    def stream_windows(
+        self,
+        url: str,
+        params_list: List[Dict],
+        max_pages: int = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        known_windows: Optional[List[Optional[Tuple[int, int]]]] = None,
+        completed: Optional[Dict[int, Set[int]]] = None
+    ) -> Iterator[Tuple[int, int, List[Dict]]]:
+        """stream_pages의 다중 구간 버전 - (구간 번호, page_no, items)로 순차 반환"""
+        max_in_flight = max(1, max_in_flight)
+        output: queue.Queue = queue.Queue(maxsize=max_in_flight)
+        done = object()
+        errors: List[BaseException] = []
+
+        async def produce():
+            # 버퍼는 output 큐가 담당하므로 이벤트 루프 쪽 결과 큐는 최소로 유지
+            try:
+                async for page in self.iter_windows(
+                    url, params_list, max_pages, max_in_flight=1,
+                    known_windows=known_windows, completed=completed
+                ):
+                    await asyncio.to_thread(output.put, page)
+            except asyncio.CancelledError:
+                # 가득 찬 출력 큐를 기다리는 중 취소 - 오류가 아닌 취소로 처리
+                self.cancelled = True
+                logger.warning("조회 취소됨")
+
+        def run():
+            try:
+                asyncio.run(self._run(produce()))
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                output.put(done)
+
+        thread = threading.Thread(target=run, name='page-stream', daemon=True)
+        thread.start()
+        try:
+            while True:
+                page = output.get()
+                if page is done:
+                    break
+                yield page
+        finally:
+            if thread.is_alive():
+                # 소비 중단 시 조회 취소 후 대기 중인 생산자가 끝날 때까지 버퍼 비움
+                self.cancel()
+                while output.get() is not done:
+                    pass
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+    async def _run(self, coro) -> Any:
+        self._loop = asyncio.get_running_loop()
+        self._main_task = asyncio.current_task()
+        try:
+            if self.cancelled:
+                coro.close()
+                return []
+            return await coro
+        except asyncio.CancelledError:
+            # cancel()로 취소된 실행은 예외 대신 취소 상태로 종료
+            self.cancelled = True
+            logger.warning("조회 취소됨")
+            return []
+        finally:
+            self._loop = None
+            self._main_task = None
+
+    def cancel(self) -> None:
+        """진행 중인 조회 취소 (다른 스레드에서 호출 가능)"""
+        self.cancelled = True
+        loop, task = self._loop, self._main_task
+        if loop is not None and task is not None:
+            loop.call_soon_threadsafe(task.cancel)
@@ -2,253 +2,595 @@
 배치 처리 최적화 모듈
 대용량 데이터 동기화를 위한 효율적인 처리
 """
-import requests
 import time
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple
 from datetime import datetime, timedelta
-import concurrent.futures
-from sqlalchemy import text
+from sqlalchemy import text, bindparam
+
+from .async_fetcher import AsyncPageFetcher
+from .date_windows import DateWindow, plan_windows
+from .generations import get_data_generations
+from .key_pool import KeyPool
+from .quota import QuotaManager, get_quota_manager
+from .row_transform import BID_NOTICE_TRANSFORMER, SUCCESSFUL_BID_TRANSFORMER
+from .resilience import RetryPolicy
+from .upstream_cache import UpstreamCache, get_upstream_cache
+from .sync_jobs import SyncJobStore, STATUS_RUNNING, STATUS_COMPLETED, STATUS_FAILED, STATUS_CANCELLED
+from .watermark import WatermarkStore, next_window, DEFAULT_OVERLAP_MINUTES, DEFAULT_INITIAL_DAYS
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+BID_NOTICE_API_URL = "http://apis.data.go.kr/1230000/ao/PubDataOpnStdService/getDataSetOpnStdBidPblancInfo"
+SUCCESSFUL_BID_API_URL = "http://apis.data.go.kr/1230000/ao/PubDataOpnStdService/getDataSetOpnStdScsbidInfo"
+
+# upsert 기준 자연키 (유니크 인덱스명, 공고번호 컬럼, 차수 컬럼)
+BID_NOTICE_KEY = ('uq_bid_notice_key', 'bid_notice_no', 'bid_notice_ord')
+SUCCESSFUL_BID_KEY = ('uq_sb_bid_notice_key', 'bid_notice_no', 'bid_notice_ord')
+
+
+def to_db_value(value: Any) -> Any:
+    """text() 바인딩용 값 변환 - 일시는 ORM(SQLite DateTime)과 같은 'YYYY-MM-DD HH:MM:SS.ffffff' 문자열로 저장
+    
+    sqlite3 기본 변환은 마이크로초가 0이면 생략해, ORM이 바인딩한 값과 문자열 비교 결과가 어긋남
+    (커서 페이지네이션 경계 행 중복, 같은 시각 행 정렬 오류)
+    """
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S.%f')
+    return value
+
 class BatchProcessor:
     """배치 처리 최적화 클래스"""
     
-    def __init__(self, db, service_key: str):
+    DEFAULT_CHUNK_SIZE = 500  # 스트리밍 삽입 단위 (건)
+    
+    _ensured_keys: Set[Tuple[str, str]] = set()  # 유니크 인덱스를 확인한 (DB, 테이블)
+    
+    def __init__(
+        self,
+        db,
+        service_key: str,
+        quota_manager: Optional[QuotaManager] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[UpstreamCache] = None,
+        key_pool: Optional[KeyPool] = None
+    ):
         self.db = db
         self.service_key = service_key
+        self.key_pool = key_pool  # 있으면 호출마다 풀에서 키를 골라 사용 (service_key는 기본값)
+        self.quota_manager = quota_manager or get_quota_manager()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache if cache is not None else get_upstream_cache()
         self.api_call_count = 0
+        self.updated_count = 0
+        self.fetched_count = 0   # 진행 중인 동기화의 조회 건수
+        self.inserted_count = 0  # 진행 중인 동기화의 삽입 건수
+        self.failed_pages: List[Tuple[int, int]] = []  # (구간 번호, 페이지 번호)
+        self.fetcher: Optional[AsyncPageFetcher] = None
+        self.cancelled = False
         self.start_time = time.time()
     
-    def fetch_page(self, url: str, params: Dict, page_no: int) -> Optional[Dict]:
-        """단일 페이지 데이터 조회"""
-        params_copy = params.copy()
-        params_copy['pageNo'] = str(page_no)
-        
-        try:
-            response = requests.get(url, params=params_copy, timeout=30)
-            self.api_call_count += 1
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    if 'response' in data and data['response']['header']['resultCode'] == '00':
-                        return data['response']['body']
-                except:
-                    logger.error(f"Page {page_no}: JSON 파싱 실패")
-            else:
-                logger.error(f"Page {page_no}: HTTP {response.status_code}")
-        except Exception as e:
-            logger.error(f"Page {page_no}: {e}")
-        
-        return None
-    
     def fetch_all_pages_parallel(
         self, 
         url: str, 
         params: Dict, 
-        max_workers: int = 5,
+        max_workers: int = AsyncPageFetcher.DEFAULT_CONCURRENCY,
         max_pages: int = None
     ) -> List[Dict]:
-        """병렬로 모든 페이지 데이터 조회"""
-        
-        # 첫 페이지로 전체 건수 확인
-        first_page = self.fetch_page(url, params, 1)
-        if not first_page:
-            return []
-        
-        total_count = first_page.get('totalCount', 0)
-        num_rows = int(params.get('numOfRows', 100))
-        total_pages = (total_count + num_rows - 1) // num_rows
-        
-        if max_pages:
-            total_pages = min(total_pages, max_pages)
-        
-        logger.info(f"전체 {total_count}건, {total_pages}페이지 조회 시작")
-        
-        all_items = []
-        
-        # 첫 페이지 데이터 추가
-        items = first_page.get('items', [])
-        if isinstance(items, list):
-            all_items.extend(items)
-        elif items:
-            all_items.append(items)
-        
-        # 나머지 페이지 병렬 조회
-        if total_pages > 1:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {
-                    executor.submit(self.fetch_page, url, params, page): page 
-                    for page in range(2, total_pages + 1)
-                }
-                
-                for future in concurrent.futures.as_completed(futures):
-                    page_no = futures[future]
-                    try:
-                        result = future.result()
-                        if result:
-                            items = result.get('items', [])
-                            if isinstance(items, list):
-                                all_items.extend(items)
-                            elif items:
-                                all_items.append(items)
-                            
-                            # 진행 상황 로깅
-                            if len(all_items) % 500 == 0:
-                                logger.info(f"진행: {len(all_items)}/{total_count}건 조회 완료")
-                    except Exception as e:
-                        logger.error(f"Page {page_no} 처리 오류: {e}")
-        
-        logger.info(f"조회 완료: 총 {len(all_items)}건")
+        """비동기 엔진으로 모든 페이지 데이터 조회"""
+        
+        self.fetcher = AsyncPageFetcher(
+            concurrency=max_workers,
+            limit_per_host=max_workers,
+            quota_manager=self.quota_manager,
+            retry_policy=self.retry_policy,
+            cache=self.cache,
+            key_pool=self.key_pool
+        )
+        all_items = self.fetcher.fetch_all_pages(url, params, max_pages=max_pages)
+        self.api_call_count += self.fetcher.api_call_count
+        self.failed_pages = list(self.fetcher.failed_pages)
+        
         return all_items
     
-    def bulk_insert_bid_notices(self, items: List[Dict]) -> int:
-        """입찰공고 대량 삽입 (중복 체크 포함)"""
+    def cancel(self):
+        """진행 중인 페이지 조회 취소 (조회 시작 전이면 시작하지 않음)"""
+        self.cancelled = True
+        if self.fetcher:
+            self.fetcher.cancel()
+    
+    def stream_insert(
+        self,
+        url: str,
+        params: Dict,
+        insert_fn: Callable[[List[Dict]], int],
+        max_workers: int = AsyncPageFetcher.DEFAULT_CONCURRENCY,
+        max_pages: int = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_in_flight: int = AsyncPageFetcher.DEFAULT_MAX_IN_FLIGHT
+    ) -> Tuple[int, int]:
+        """조회→변환→삽입 스트리밍 파이프라인
         
-        if not items:
-            return 0
+        완료된 페이지를 chunk_size 단위로 모아 즉시 삽입하므로 조회와 삽입이 겹치고,
+        메모리에는 최대 max_in_flight 페이지와 한 개 청크만 유지됨
         
-        # 기존 데이터의 bid_notice_no 조회
-        existing_query = text("""
-            SELECT bid_notice_no, bid_notice_ord 
-            FROM bid_notices
-        """)
+        Returns:
+            (조회 건수, 삽입 건수)
+        """
+        return self.stream_insert_windows(
+            url, [params], insert_fn, max_workers, max_pages, chunk_size, max_in_flight
+        )
+    
+    def stream_insert_windows(
+        self,
+        url: str,
+        params_list: List[Dict],
+        insert_fn: Callable[[List[Dict]], int],
+        max_workers: int = AsyncPageFetcher.DEFAULT_CONCURRENCY,
+        max_pages: int = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_in_flight: int = AsyncPageFetcher.DEFAULT_MAX_IN_FLIGHT,
+        known_windows: Optional[List[Optional[Tuple[int, int]]]] = None,
+        completed: Optional[Dict[int, Set[int]]] = None,
+        checkpoint_fn: Optional[Callable[[List[Tuple[int, int]], int, int], None]] = None
+    ) -> Tuple[int, int]:
+        """여러 조회 구간을 하나의 작업 풀에서 병렬 조회하며 청크 단위로 삽입
         
-        existing_records = self.db.session.execute(existing_query).fetchall()
-        existing_keys = {(row[0], row[1]) for row in existing_records}
+        max_pages는 구간별 최대 페이지 수.
+        checkpoint_fn은 청크 삽입 후 (삽입된 (구간 번호, page_no) 목록, 조회 건수, 삽입 건수)로 호출되고,
+        known_windows/completed는 이전 실행에서 완료된 페이지를 건너뛸 때 사용
         
-        # 새로운 데이터 준비
-        new_records = []
-        update_records = []
+        Returns:
+            (조회 건수, 삽입 건수)
+        """
+        self.fetcher = AsyncPageFetcher(
+            concurrency=max_workers,
+            limit_per_host=max_workers,
+            quota_manager=self.quota_manager,
+            retry_policy=self.retry_policy,
+            cache=self.cache,
+            key_pool=self.key_pool
+        )
+        if self.cancelled:
+            self.fetcher.cancel()
         
-        for item in items:
-            key = (item.get('bidNtceNo'), item.get('bidNtceOrd', '00'))
-            
-            record = {
-                'bid_notice_no': item.get('bidNtceNo'),
-                'bid_notice_nm': item.get('bidNtceNm', '')[:500],
-                'bid_notice_ord': item.get('bidNtceOrd', '00'),
-                'dminstt_nm': item.get('dminsttNm', '')[:200],
-                'rgst_dt': self._parse_datetime(item.get('rgstDt')),
-                'bid_begin_dt': self._parse_datetime(item.get('bidBeginDt')),
-                'bid_close_dt': self._parse_datetime(item.get('bidClseDt')),
-                'openg_dt': self._parse_datetime(item.get('opengDt')),
-                'presmpt_price': self._parse_int(item.get('presmptPrce')),
-                'basic_amount': self._parse_int(item.get('asignBdgtAmt')),
-                'bid_method_nm': item.get('bidMethdNm', '')[:100],
-                'cntrct_cncls_mthd_nm': item.get('cntrctCnclsMthdNm', '')[:100],
-                'work_div_nm': item.get('taskClsfcNm', '')[:50],
-                'created_at': datetime.utcnow()
-            }
+        fetched_count = 0
+        inserted_count = 0
+        self.fetched_count = 0
+        self.inserted_count = 0
+        chunk: List[Dict] = []
+        chunk_pages: List[Tuple[int, int]] = []
+        
+        def flush() -> int:
+            inserted = insert_fn(chunk) if chunk else 0
+            if checkpoint_fn is not None and chunk_pages:
+                checkpoint_fn(chunk_pages, len(chunk), inserted)
+            return inserted
+        
+        try:
+            pages = self.fetcher.stream_windows(
+                url, params_list, max_pages, max_in_flight,
+                known_windows=known_windows, completed=completed
+            )
+            for index, page_no, items in pages:
+                fetched_count += len(items)
+                self.fetched_count = fetched_count
+                chunk.extend(items)
+                chunk_pages.append((index, page_no))
+                
+                if len(chunk) >= chunk_size:
+                    inserted_count += flush()
+                    self.inserted_count = inserted_count
+                    chunk = []
+                    chunk_pages = []
+                    logger.info(f"진행: {fetched_count}/{self.fetcher.total_count}건 조회, {inserted_count}건 삽입")
             
-            if key not in existing_keys:
-                new_records.append(record)
-            else:
-                # 업데이트 로직 (필요시)
-                pass
+            inserted_count += flush()
+            self.inserted_count = inserted_count
+        finally:
+            self.api_call_count += self.fetcher.api_call_count
+            self.failed_pages = list(self.fetcher.failed_pages)
+        
+        return fetched_count, inserted_count
+    
+    def bulk_insert_bid_notices(self, items: List[Dict]) -> int:
+        """입찰공고 대량 upsert ((bid_notice_no, bid_notice_ord) 기준)
+        
+        신규 공고는 삽입하고, 기존 공고는 내용이 바뀐 경우에만 갱신함.
+        기존 키 확인은 배치 안의 키만 조회하므로 테이블 크기와 무관함
+        
+        Returns:
+            신규 삽입 건수 (갱신 건수는 self.updated_count에 누적)
+        """
+        records = BID_NOTICE_TRANSFORMER.transform_many(items)
+        return self._upsert_batches('bid_notices', BID_NOTICE_KEY, records)
+    
+    def bulk_insert_successful_bids(self, items: List[Dict]) -> int:
+        """낙찰정보 대량 upsert ((bid_notice_no, bid_notice_ord) 기준)
+        
+        Returns:
+            신규 삽입 건수 (갱신 건수는 self.updated_count에 누적)
+        """
+        records = SUCCESSFUL_BID_TRANSFORMER.transform_many(items)
+        return self._upsert_batches('successful_bids', SUCCESSFUL_BID_KEY, records)
+    
+    def _upsert_batches(self, table: str, key: Tuple[str, str, str], records: List[Dict[str, Any]]) -> int:
+        """배치 단위 INSERT ... ON CONFLICT DO UPDATE 후 커밋 (SQLite는 한 번에 999개 변수 제한)
+        
+        key는 (유니크 인덱스명, 키 컬럼1, 키 컬럼2). 같은 배치 안의 중복 키는 마지막 항목만 반영하고,
+        created_at은 최초 삽입 시각을 유지함
+        """
+        if not records:
+            return 0
+        
+        index_name, no_column, ord_column = key
+        self.ensure_unique_key(table, key)
+        
+        # 배치 내 중복 키 제거 (마지막 항목 우선), 일시는 ORM과 같은 저장 형식으로 변환
+        records = [
+            {column: to_db_value(value) for column, value in r.items()}
+            for r in {(r[no_column], r[ord_column]): r for r in records}.values()
+        ]
+        
+        columns = list(records[0].keys())
+        update_columns = [c for c in columns if c not in (no_column, ord_column, 'created_at')]
+        upsert_query = text(f"""
+            INSERT INTO {table} ({', '.join(columns)})
+            VALUES ({', '.join(':' + c for c in columns)})
+            ON CONFLICT ({no_column}, {ord_column}) DO UPDATE SET
+                {', '.join(f'{c} = excluded.{c}' for c in update_columns)}
+            WHERE {' OR '.join(f'{table}.{c} IS NOT excluded.{c}' for c in update_columns)}
+        """)
+        existing_query = text(f"""
+            SELECT {no_column}, {ord_column} FROM {table}
+            WHERE {no_column} IN :keys
+        """).bindparams(bindparam('keys', expanding=True))
         
-        # 대량 삽입
         inserted_count = 0
-        if new_records:
-            try:
-                # 배치 단위로 삽입 (SQLite는 한 번에 999개 제한)
-                batch_size = 500
-                for i in range(0, len(new_records), batch_size):
-                    batch = new_records[i:i + batch_size]
-                    
-                    insert_query = text("""
-                        INSERT INTO bid_notices (
-                            bid_notice_no, bid_notice_nm, bid_notice_ord, dminstt_nm,
-                            rgst_dt, bid_begin_dt, bid_close_dt, openg_dt,
-                            presmpt_price, basic_amount, bid_method_nm,
-                            cntrct_cncls_mthd_nm, work_div_nm, created_at
-                        ) VALUES (
-                            :bid_notice_no, :bid_notice_nm, :bid_notice_ord, :dminstt_nm,
-                            :rgst_dt, :bid_begin_dt, :bid_close_dt, :openg_dt,
-                            :presmpt_price, :basic_amount, :bid_method_nm,
-                            :cntrct_cncls_mthd_nm, :work_div_nm, :created_at
-                        )
-                    """)
-                    
-                    self.db.session.execute(insert_query, batch)
-                    inserted_count += len(batch)
-                    
-                    if inserted_count % 1000 == 0:
-                        logger.info(f"삽입 진행: {inserted_count}건")
+        updated_count = 0
+        try:
+            batch_size = 500
+            for i in range(0, len(records), batch_size):
+                batch = records[i:i + batch_size]
                 
-                self.db.session.commit()
-                logger.info(f"✅ {inserted_count}건 신규 삽입 완료")
+                # 배치에 포함된 키만 조회해 신규/갱신 건수 구분
+                existing = set(self.db.session.execute(
+                    existing_query, {'keys': list({r[no_column] for r in batch})}
+                ).fetchall())
+                new_count = sum(1 for r in batch if (r[no_column], r[ord_column]) not in existing)
                 
-            except Exception as e:
-                self.db.session.rollback()
-                logger.error(f"대량 삽입 실패: {e}")
-                raise
+                changed = self.db.session.execute(upsert_query, batch).rowcount
+                inserted_count += new_count
+                updated_count += max(0, changed - new_count)
+            
+            self.db.session.commit()
+            self.updated_count += updated_count
+            if inserted_count or updated_count:
+                get_data_generations().bump(table)  # 건수/응답 캐시 무효화
+            logger.info(f"✅ {table}: {inserted_count}건 신규 삽입, {updated_count}건 갱신")
+            
+        except Exception as e:
+            self.db.session.rollback()
+            logger.error(f"대량 upsert 실패: {e}")
+            raise
         
         return inserted_count
     
+    def ensure_unique_key(self, table: str, key: Tuple[str, str, str]) -> None:
+        """upsert 대상 키의 유니크 인덱스 확인 및 생성 (프로세스당 테이블별 1회)"""
+        index_name, no_column, ord_column = key
+        cache_key = (str(self.db.engine.url), table)
+        if cache_key in BatchProcessor._ensured_keys:
+            return
+        
+        columns = []
+        for index in self.db.session.execute(text(f"PRAGMA index_list({table})")).mappings():
+            if not index['unique']:
+                continue
+            index_columns = [row[2] for row in self.db.session.execute(text(f"PRAGMA index_info('{index['name']}')"))]
+            columns.append(index_columns)
+        
+        if [no_column] in columns:
+            logger.warning(
+                f"{table}.{no_column} 단일 유니크 제약이 남아 있어 차수가 다른 공고를 저장할 수 없습니다. "
+                f"add_indexes.py로 마이그레이션하세요"
+            )
+        if [no_column, ord_column] not in columns:
+            self.db.session.execute(text(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {table}({no_column}, {ord_column})"
+            ))
+            self.db.session.commit()
+            logger.info(f"유니크 인덱스 생성: {index_name}")
+        
+        BatchProcessor._ensured_keys.add(cache_key)
+    
     def sync_bid_notices_optimized(
         self,
         start_date: str,
         end_date: str,
-        max_pages: int = None
+        max_pages: int = None,
+        max_workers: int = AsyncPageFetcher.DEFAULT_CONCURRENCY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_in_flight: int = AsyncPageFetcher.DEFAULT_MAX_IN_FLIGHT,
+        job_id: Optional[int] = None
     ) -> Dict[str, Any]:
-        """최적화된 입찰공고 동기화"""
+        """최적화된 입찰공고 동기화 (조회와 삽입을 스트리밍으로 병행)
         
-        url = "http://apis.data.go.kr/1230000/ao/PubDataOpnStdService/getDataSetOpnStdBidPblancInfo"
+        조회 기간 제한(31일)을 넘는 기간은 구간으로 나눠 함께 병렬 조회하고
+        결과를 하나의 동기화 결과로 합침 (max_pages는 구간별 적용).
+        start_date/end_date는 YYYYMMDD 또는 시각을 포함한 YYYYMMDDHHMM.
+        실행마다 동기화 작업 기록을 남기며, job_id를 넘기면 해당 작업의 누락 페이지만 조회
+        """
+        return self._sync_windows(
+            'bid_notice', BID_NOTICE_API_URL, ('bidNtceBgnDt', 'bidNtceEndDt'),
+            start_date, end_date,
+            self.bulk_insert_bid_notices,
+            max_pages, max_workers, chunk_size, max_in_flight, job_id
+        )
+    
+    def sync_successful_bids_optimized(
+        self,
+        start_date: str,
+        end_date: str,
+        max_pages: int = None,
+        max_workers: int = AsyncPageFetcher.DEFAULT_CONCURRENCY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_in_flight: int = AsyncPageFetcher.DEFAULT_MAX_IN_FLIGHT,
+        job_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """최적화된 낙찰정보 동기화 (개찰일시 기준)
         
-        params = {
-            'ServiceKey': self.service_key,
-            'type': 'json',
-            'bidNtceBgnDt': start_date + '0000',
-            'bidNtceEndDt': end_date + '2359',
-            'numOfRows': '100'
-        }
+        조회 기간 제한(7일)에 맞춰 구간을 나눠 병렬 조회하며, 나머지 동작은
+        sync_bid_notices_optimized와 같음
+        """
+        return self._sync_windows(
+            'successful_bid', SUCCESSFUL_BID_API_URL, ('opengBgnDt', 'opengEndDt'),
+            start_date, end_date,
+            self.bulk_insert_successful_bids,
+            max_pages, max_workers, chunk_size, max_in_flight, job_id
+        )
+    
+    def _sync_windows(
+        self,
+        endpoint: str,
+        url: str,
+        date_params: Tuple[str, str],
+        start_date: str,
+        end_date: str,
+        insert_fn: Callable[[List[Dict]], int],
+        max_pages: Optional[int],
+        max_workers: int,
+        chunk_size: int,
+        max_in_flight: int,
+        job_id: Optional[int]
+    ) -> Dict[str, Any]:
+        """구간 분할 → 병렬 조회 → 청크 삽입 → 작업 기록 공통 처리"""
+        self.start_time = time.time()
+        windows = plan_windows(endpoint, start_date, end_date)
+        begin_time = start_date[8:12] or '0000'
+        end_time = end_date[8:12] or '2359'
+        params_list = [
+            self._window_params(
+                window,
+                date_params,
+                begin_time if index == 0 else '0000',
+                end_time if index == len(windows) - 1 else '2359'
+            )
+            for index, window in enumerate(windows)
+        ]
+        
+        logger.info(f"동기화 시작 ({endpoint}): {start_date} ~ {end_date} ({len(windows)}개 구간)")
+        updated_before = self.updated_count
         
-        logger.info(f"동기화 시작: {start_date} ~ {end_date}")
+        # 작업 기록 - 재개 시 이전 실행의 구간 정보와 완료 페이지 사용
+        jobs = SyncJobStore(self.db)
+        if job_id is None:
+            job_id = jobs.create(endpoint, start_date, end_date)
+        job = jobs.get(job_id)
+        known_windows = job['windows']
+        completed = jobs.completed_pages(job_id)
+        jobs.set_status(job_id, STATUS_RUNNING)
         
-        # 병렬로 모든 페이지 조회
-        all_items = self.fetch_all_pages_parallel(url, params, max_pages=max_pages)
+        def checkpoint(pages: List[Tuple[int, int]], fetched: int, inserted: int) -> None:
+            nonlocal known_windows
+            if self._windows_incomplete(known_windows, len(params_list)):
+                known_windows = self._known_windows()
+                jobs.set_windows(job_id, known_windows)
+            jobs.checkpoint(job_id, pages, fetched, inserted)
         
-        # 대량 삽입
-        inserted_count = self.bulk_insert_bid_notices(all_items)
+        # 병렬 조회 + 청크 단위 삽입
+        try:
+            fetched_count, inserted_count = self.stream_insert_windows(
+                url,
+                params_list,
+                insert_fn,
+                max_workers=max_workers,
+                max_pages=max_pages,
+                chunk_size=chunk_size,
+                max_in_flight=max_in_flight,
+                known_windows=known_windows,
+                completed=completed,
+                checkpoint_fn=checkpoint
+            )
+        except BaseException as e:
+            # 작업 기록이 running으로 남지 않도록 예외 종류와 관계없이 실패 처리
+            jobs.set_status(job_id, STATUS_FAILED, str(e) or type(e).__name__)
+            raise
         
         # 통계
         elapsed_time = time.time() - self.start_time
         
+        quota_error = self.fetcher.quota_error if self.fetcher else None
+        cancelled = bool(self.fetcher and self.fetcher.cancelled)
+        
+        if self._windows_incomplete(known_windows, len(params_list)):
+            jobs.set_windows(job_id, self._known_windows())
+        if cancelled:
+            jobs.set_status(job_id, STATUS_CANCELLED)
+        elif quota_error is not None:
+            jobs.set_status(job_id, STATUS_FAILED, str(quota_error))
+        elif self.failed_pages:
+            jobs.set_status(job_id, STATUS_FAILED, f"실패한 페이지 {len(self.failed_pages)}개")
+        else:
+            jobs.set_status(job_id, STATUS_COMPLETED)
+        
         result = {
-            'success': True,
-            'total_fetched': len(all_items),
+            'success': not self.failed_pages and quota_error is None and not cancelled,
+            'job_id': job_id,
+            'total_fetched': fetched_count,
             'inserted': inserted_count,
-            'duplicates': len(all_items) - inserted_count,
+            'updated': self.updated_count - updated_before,
+            'duplicates': fetched_count - inserted_count - (self.updated_count - updated_before),
             'api_calls': self.api_call_count,
+            'cache_hits': self.fetcher.cache_hits if self.fetcher else 0,
+            'failed_pages': sorted(self.failed_pages),
+            'retries': self.fetcher.retry_count if self.fetcher else 0,
+            'cancelled': cancelled,
+            'quota_remaining': self.key_pool.remaining() if self.key_pool else self.quota_manager.remaining(self.service_key),
             'elapsed_time': round(elapsed_time, 2),
-            'items_per_second': round(len(all_items) / elapsed_time, 2) if elapsed_time > 0 else 0
+            'items_per_second': round(fetched_count / elapsed_time, 2) if elapsed_time > 0 else 0,
+            'windows': self._window_report(windows)
         }
         
+        if quota_error is not None:
+            result['error'] = str(quota_error)
+            result['retry_after'] = quota_error.retry_after
+        
         logger.info(f"동기화 완료: {result}")
         return result
     
-    def _parse_datetime(self, date_str: str) -> Optional[datetime]:
-        """날짜 문자열 파싱"""
-        if not date_str:
-            return None
-        try:
-            if len(date_str) == 12:
-                return datetime.strptime(date_str, '%Y%m%d%H%M')
-            elif len(date_str) == 8:
-                return datetime.strptime(date_str, '%Y%m%d')
-        except:
-            pass
-        return None
-    
-    def _parse_int(self, value: Any) -> Optional[int]:
-        """정수 파싱"""
-        if value is None:
-            return None
-        try:
-            return int(value)
-        except:
-            return None
\ No newline at end of file
+    def sync_bid_notices_incremental(
+        self,
+        now: Optional[datetime] = None,
+        overlap_minutes: int = DEFAULT_OVERLAP_MINUTES,
+        initial_days: int = DEFAULT_INITIAL_DAYS,
+        job_id: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """기준점 이후 변경분만 조회하는 증분 동기화
+        
+        마지막 성공 구간 이후(overlap_minutes만큼 겹쳐서)부터 현재까지만 조회하고,
+        실패 페이지 없이 끝난 경우에만 기준점을 갱신함.
+        job_id를 넘기면 해당 작업에 미리 기록된 구간을 조회 (중단된 작업 재개 시 누락 페이지만 조회)
+        """
+        jobs = SyncJobStore(self.db)
+        if job_id is not None:
+            job = jobs.get(job_id)
+            if job is None:
+                raise ValueError(f"동기화 작업이 없습니다: {job_id}")
+            window_start, window_end = job['window_start'], job['window_end']
+        else:
+            window_start, window_end = self.next_incremental_window(now, overlap_minutes, initial_days)
+            job_id = jobs.create('bid_notice', window_start, window_end, incremental=True)
+        
+        result = self.sync_bid_notices_optimized(window_start, window_end, job_id=job_id, **kwargs)
+        result['incremental'] = True
+        result['window_start'] = window_start
+        result['window_end'] = window_end
+        
+        if result['success'] and not result['cancelled']:
+            WatermarkStore(self.db).advance('bid_notice', window_start, window_end, self._max_bid_notice_rgst_dt(window_end))
+        else:
+            logger.warning("동기화가 완료되지 않아 기준점을 유지합니다")
+        
+        return result
+    
+    def next_incremental_window(
+        self,
+        now: Optional[datetime] = None,
+        overlap_minutes: int = DEFAULT_OVERLAP_MINUTES,
+        initial_days: int = DEFAULT_INITIAL_DAYS
+    ) -> Tuple[str, str]:
+        """다음 증분 동기화 구간 (YYYYMMDDHHMM, YYYYMMDDHHMM)"""
+        watermark = WatermarkStore(self.db).get('bid_notice')
+        return next_window(watermark, now or datetime.now(), overlap_minutes, initial_days)
+    
+    def progress(self) -> Dict[str, Any]:
+        """진행 중인 동기화 상황 (다른 스레드에서 조회 가능)"""
+        fetcher = self.fetcher
+        elapsed_time = time.time() - self.start_time
+        total_count = fetcher.total_count if fetcher else 0
+        return {
+            'total_count': total_count,
+            'total_pages': fetcher.total_pages if fetcher else 0,
+            'api_calls': fetcher.api_call_count if fetcher else self.api_call_count,
+            'fetched': self.fetched_count,
+            'inserted': self.inserted_count,
+            'failed_pages': len(fetcher.failed_pages) if fetcher else 0,
+            'percent': round(self.fetched_count * 100 / total_count, 1) if total_count else 0,
+            'elapsed_time': round(elapsed_time, 2),
+            'items_per_second': round(self.fetched_count / elapsed_time, 2) if elapsed_time > 0 else 0
+        }
+    
+    def _max_bid_notice_rgst_dt(self, window_end: str) -> Optional[datetime]:
+        """구간 종료 시각 이전의 최신 등록일시"""
+        limit = datetime.strptime(window_end, '%Y%m%d%H%M').replace(second=59, microsecond=999999)
+        value = self.db.session.execute(
+            text("SELECT MAX(rgst_dt) FROM bid_notices WHERE rgst_dt <= :limit"),
+            {'limit': to_db_value(limit)}
+        ).scalar()
+        if value is None or isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(str(value))
+    
+    def _window_params(
+        self,
+        window: DateWindow,
+        date_params: Tuple[str, str],
+        begin_time: str = '0000',
+        end_time: str = '2359'
+    ) -> Dict[str, str]:
+        """구간 조회 파라미터 (date_params: 시작/종료 일시 파라미터명)"""
+        return {
+            'ServiceKey': self.service_key,
+            'type': 'json',
+            date_params[0]: window.start + begin_time,
+            date_params[1]: window.end + end_time,
+            'numOfRows': '100'
+        }
+    
+    def resume_sync_job(self, job_id: int, **kwargs) -> Dict[str, Any]:
+        """중단된 동기화 작업을 완료되지 않은 페이지부터 재개 (증분 작업은 완료 시 기준점도 갱신)"""
+        job = SyncJobStore(self.db).get(job_id)
+        if job is None:
+            raise ValueError(f"동기화 작업이 없습니다: {job_id}")
+        if job['incremental'] and job['endpoint'] == 'bid_notice':
+            logger.info(f"증분 동기화 작업 {job_id} 재개: 완료 {job['completed_pages']}/{job['total_pages']}페이지")
+            return self.sync_bid_notices_incremental(job_id=job_id, **kwargs)
+        sync = {
+            'bid_notice': self.sync_bid_notices_optimized,
+            'successful_bid': self.sync_successful_bids_optimized
+        }.get(job['endpoint'])
+        if sync is None:
+            raise ValueError(f"재개할 수 없는 작업입니다: {job['endpoint']}")
+        
+        logger.info(f"동기화 작업 {job_id} 재개: 완료 {job['completed_pages']}/{job['total_pages']}페이지")
+        return sync(job['window_start'], job['window_end'], job_id=job_id, **kwargs)
+    
+    @staticmethod
+    def _windows_incomplete(known_windows: Optional[List[Optional[Tuple[int, int]]]], count: int) -> bool:
+        return known_windows is None or len(known_windows) < count or None in known_windows
+    
+    def _known_windows(self) -> List[Optional[Tuple[int, int]]]:
+        """조회한 구간별 (전체 건수, 페이지 수) - 첫 페이지 조회에 실패한 구간은 None"""
+        return [
+            None if 1 in window['failed_pages'] and window['total_pages'] == 0
+            else (window['total_count'], window['total_pages'])
+            for window in (self.fetcher.windows if self.fetcher else [])
+        ]
+    
+    def _window_report(self, windows: List[DateWindow]) -> List[Dict[str, Any]]:
+        """구간별 조회 결과"""
+        fetched_windows = self.fetcher.windows if self.fetcher else []
+        report = []
+        for index, window in enumerate(windows):
+            stats = fetched_windows[index] if index < len(fetched_windows) else {}
+            report.append({
+                'start_date': window.start,
+                'end_date': window.end,
+                'total_count': stats.get('total_count', 0),
+                'pages': stats.get('total_pages', 0),
+                'failed_pages': sorted(stats.get('failed_pages', []))
+            })
+        return report
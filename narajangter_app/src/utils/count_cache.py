@@ -0,0 +1,190 @@
+"""
+목록 건수 캐시 모듈
+필터 조합별 COUNT 결과를 동기화 세대(generation) 단위로 캐시하고,
+인덱스로 처리되지 않는 필터(부분 문자열 검색 등)는 id 구간 표본으로 추정한 건수를 반환
+"""
+import time
+import random
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import func, or_
+
+from .generations import DataGenerations, get_data_generations, is_known
+from .shared_cache import get_shared_cache
+
+logger = logging.getLogger(__name__)
+
+
+class CountCache:
+    """(테이블, 세대, 필터) → (건수, 정확 여부) 캐시
+
+    세대는 수집으로 테이블 내용이 바뀔 때 올라가는 공유 데이터 세대(generations 모듈)를 사용하고,
+    다른 프로세스가 DB를 바꾸는 경우에 대비해 항목은 ttl 초가 지나면 다시 계산
+    """
+
+    DEFAULT_TTL = 300              # 캐시 항목 최대 보관 시간 (초)
+    DEFAULT_MAX_ENTRIES = 1024     # 캐시 최대 항목 수 (LRU)
+    DEFAULT_SAMPLE_ROWS = 20000    # 추정 시 표본 행 수 - 테이블이 이보다 작으면 정확히 셈
+    DEFAULT_SAMPLE_WINDOWS = 20    # 표본 id 구간 수
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        sample_rows: int = DEFAULT_SAMPLE_ROWS,
+        sample_windows: int = DEFAULT_SAMPLE_WINDOWS,
+        generations: Optional[DataGenerations] = None
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.sample_rows = sample_rows
+        self.sample_windows = sample_windows
+        self.hits = 0
+        self.misses = 0
+        self.exact_counts = 0
+        self.estimates = 0
+        self._generations = generations
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[tuple, Tuple[int, bool, float]]' = OrderedDict()
+
+    @property
+    def generations(self) -> DataGenerations:
+        """지정하지 않았으면 공유 데이터 세대 (공유 캐시 설정 후에도 같은 세대를 보도록 매번 조회)"""
+        return self._generations or get_data_generations()
+
+    def generation(self, table: str) -> int:
+        return self.generations.get(table)
+
+    def invalidate(self, table: str) -> int:
+        """테이블 세대 증가 (이전 세대 건수는 폐기) - 새 세대 번호 반환"""
+        generation = self.generations.bump(table)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == table]:
+                del self._entries[key]
+        return generation
+
+    def count(
+        self,
+        query,
+        model,
+        filters: Dict[str, Any],
+        exact_filters: Iterable[str] = (),
+        force_exact: bool = False
+    ) -> Tuple[int, bool]:
+        """필터가 적용된 query의 (건수, 정확 여부)
+
+        filters는 적용된 필터 이름 → 값 (빈 값 제외), exact_filters는 인덱스로 처리되어
+        정확히 세어도 되는 필터 이름. 그 밖의 필터가 있으면 force_exact가 아닌 한 추정치
+        """
+        table = model.__tablename__
+        filters = {name: value for name, value in filters.items() if value not in (None, '')}
+        exact_shape = force_exact or set(filters) <= set(exact_filters)
+        # 세대는 계산 전에 고정 - 계산 중 동기화가 커밋되면 이전 세대 결과는 저장하지 않음
+        key = (table, self.generation(table), tuple(sorted(filters.items())))
+
+        cached = self._get(key)
+        if cached is None:
+            cached = self._get_shared(key)
+        if cached is not None and (cached[1] or not exact_shape):
+            return cached
+
+        if exact_shape:
+            result = (query.order_by(None).count(), True)
+        else:
+            result = self._estimate(query, model, filters)
+        with self._lock:
+            if result[1]:
+                self.exact_counts += 1
+            else:
+                self.estimates += 1
+        self._put(key, result)
+        shared = get_shared_cache()
+        if shared is not None and is_known(key[1:2]):
+            shared.set_json('count', key[1:2], (key[0], key[2]), list(result))
+        return result
+
+    def _get_shared(self, key: tuple) -> Optional[Tuple[int, bool]]:
+        """다른 워커가 같은 세대에 계산한 건수 (공유 캐시를 켠 경우)"""
+        shared = get_shared_cache()
+        value = shared.get_json('count', key[1:2], (key[0], key[2])) if shared is not None else None
+        if value is None:
+            return None
+        result = (int(value[0]), bool(value[1]))
+        self._put(key, result)
+        return result
+
+    def _estimate(self, query, model, filters: Dict[str, Any]) -> Tuple[int, bool]:
+        """전체 건수 × (id 구간 표본 중 필터 일치 비율)"""
+        table = model.__tablename__
+        total, _ = self.count(model.query, model, {})
+        if total <= self.sample_rows:
+            return query.order_by(None).count(), True
+
+        session = query.session
+        low, high = session.query(func.min(model.id), func.max(model.id)).one()
+        width = max(1, self.sample_rows // self.sample_windows)
+        # 같은 필터에는 같은 표본을 사용해 추정치가 요청마다 흔들리지 않도록 함
+        rng = random.Random(repr((table, sorted(filters.items()))))
+        starts = sorted(rng.randint(low, max(low, high - width + 1)) for _ in range(self.sample_windows))
+        windows = or_(*[model.id.between(start, start + width - 1) for start in starts])
+
+        sampled = session.query(func.count(model.id)).filter(windows).scalar()
+        matched = query.filter(windows).order_by(None).count()
+        return (round(matched * total / sampled) if sampled else 0), False
+
+    def _get(self, key: tuple) -> Optional[Tuple[int, bool]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] + self.ttl > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], entry[1]
+            self.misses += 1
+            return None
+
+    def _put(self, key: tuple, result: Tuple[int, bool]) -> None:
+        with self._lock:
+            if key[1] != self.generations.get(key[0]):
+                return
+            self._entries[key] = (result[0], result[1], time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'exact_counts': self.exact_counts,
+                'estimates': self.estimates,
+                'entries': len(self._entries),
+                'generations': self.generations.stats()
+            }
+
+
+_cache: Optional[CountCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_count_cache() -> CountCache:
+    """프로세스 공유 건수 캐시 조회"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CountCache()
+    return _cache
+
+
+def configure_count_cache(**kwargs) -> CountCache:
+    """공유 건수 캐시 재생성"""
+    global _cache
+    with _cache_lock:
+        _cache = CountCache(**kwargs)
+    return _cache
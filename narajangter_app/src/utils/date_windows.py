@@ -0,0 +1,63 @@
+"""
+조회 기간 분할 모듈
+엔드포인트별 최대 조회 기간 제한에 맞춰 요청 기간을 여러 구간으로 분할
+"""
+from typing import List, NamedTuple
+from datetime import datetime, timedelta
+
+# 엔드포인트별 1회 조회 최대 기간 (일, 시작일·종료일 포함)
+ENDPOINT_WINDOW_DAYS = {
+    'bid_notice': 31,      # 입찰공고: 1개월
+    'successful_bid': 7,   # 낙찰정보: 1주일
+}
+
+
+class DateWindow(NamedTuple):
+    """조회 구간 (YYYYMMDD, 종료일 포함)"""
+    start: str
+    end: str
+
+    @property
+    def days(self) -> int:
+        start = datetime.strptime(self.start, '%Y%m%d')
+        end = datetime.strptime(self.end, '%Y%m%d')
+        return (end - start).days + 1
+
+
+def split_date_range(start_date: str, end_date: str, max_days: int) -> List[DateWindow]:
+    """기간을 최대 max_days일 단위 구간으로 분할
+
+    Args:
+        start_date: 시작일 (YYYYMMDD)
+        end_date: 종료일 (YYYYMMDD)
+        max_days: 구간별 최대 일수
+
+    Returns:
+        시작일 순으로 정렬된 구간 목록
+    """
+    if max_days < 1:
+        raise ValueError(f"max_days는 1 이상이어야 합니다: {max_days}")
+
+    try:
+        start = datetime.strptime(start_date[:8], '%Y%m%d')
+        end = datetime.strptime(end_date[:8], '%Y%m%d')
+    except ValueError:
+        raise ValueError(f"날짜 형식 오류 (YYYYMMDD): {start_date} ~ {end_date}")
+
+    if end < start:
+        raise ValueError(f"종료일이 시작일보다 빠릅니다: {start_date} ~ {end_date}")
+
+    windows = []
+    step = timedelta(days=max_days)
+    while start <= end:
+        window_end = min(end, start + step - timedelta(days=1))
+        windows.append(DateWindow(start.strftime('%Y%m%d'), window_end.strftime('%Y%m%d')))
+        start = window_end + timedelta(days=1)
+    return windows
+
+
+def plan_windows(endpoint: str, start_date: str, end_date: str) -> List[DateWindow]:
+    """엔드포인트 조회 기간 제한에 맞춘 구간 목록"""
+    if endpoint not in ENDPOINT_WINDOW_DAYS:
+        raise ValueError(f"알 수 없는 엔드포인트: {endpoint}")
+    return split_date_range(start_date, end_date, ENDPOINT_WINDOW_DAYS[endpoint])
@@ -0,0 +1,79 @@
+"""
+대량 내보내기 모듈
+DB 커서에서 읽은 행(tuple)을 ORM 객체 없이 NDJSON/CSV 청크로 변환해 스트리밍 응답으로 전송
+(한 번에 batch_size 행만 메모리에 유지)
+"""
+import io
+import csv
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence
+
+from . import json_codec
+
+DEFAULT_BATCH_SIZE = 2000  # 청크당 행 수 (DB fetch 단위와 같음)
+
+# 형식 → (Content-Type, 파일 확장자)
+EXPORT_FORMATS = {
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+}
+
+UTF8_BOM = '\ufeff'  # Excel에서 한글 CSV가 깨지지 않도록 붙이는 BOM
+
+
+def _batched(rows: Iterable[Sequence[Any]], batch_size: int) -> Iterator[List[Sequence[Any]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_ndjson(
+    rows: Iterable[Sequence[Any]],
+    columns: Sequence[str],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """행 → 한 줄에 JSON 객체 하나 (일시는 ISO 8601, to_dict()와 같은 키)"""
+    dumps = json_codec.dumps
+    columns = tuple(columns)
+    for batch in _batched(rows, batch_size):
+        yield b''.join([dumps(dict(zip(columns, row))) + b'\n' for row in batch])
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def iter_csv(
+    rows: Iterable[Sequence[Any]],
+    columns: Sequence[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    bom: bool = True
+) -> Iterator[bytes]:
+    """행 → 헤더 포함 CSV (NULL은 빈 칸, 일시는 ISO 8601)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\r\n')
+    if bom:
+        buffer.write(UTF8_BOM)
+    writer.writerow(columns)
+
+    for batch in _batched(rows, batch_size):
+        writer.writerows([[_csv_value(value) for value in row] for row in batch])
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():  # 행이 없으면 헤더만
+        yield buffer.getvalue().encode('utf-8')
+
+
+EXPORTERS: Dict[str, Callable[..., Iterator[bytes]]] = {
+    'ndjson': iter_ndjson,
+    'csv': iter_csv,
+}
@@ -0,0 +1,124 @@
+"""
+전문 검색 인덱스 모듈
+입찰공고명/수요기관명을 SQLite FTS5(trigram 토크나이저) 외부 콘텐츠 테이블로 색인하고
+트리거로 원본 테이블과 동기화 - 한글 부분 문자열 검색을 LIKE '%...%' 전체 스캔 없이 처리
+"""
+import logging
+import threading
+import weakref
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy import Float, Integer, bindparam, text
+
+logger = logging.getLogger(__name__)
+
+MIN_TRIGRAM_LENGTH = 3  # trigram 색인으로 찾을 수 있는 최소 검색어 길이 (더 짧으면 LIKE 검색)
+
+
+def phrase(keyword: str) -> Optional[str]:
+    """검색어 → FTS5 문자열 (trigram에서는 부분 문자열 일치) - 너무 짧으면 None"""
+    keyword = (keyword or '').strip()
+    if len(keyword) < MIN_TRIGRAM_LENGTH:
+        return None
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+class FullTextIndex:
+    """원본 테이블의 텍스트 컬럼에 대한 FTS5 trigram 색인 (content=원본 테이블)"""
+
+    def __init__(self, table: str, columns: Iterable[str], id_column: str = 'id'):
+        self.table = table
+        self.columns = tuple(columns)
+        self.id_column = id_column
+        self.fts_table = f'{table}_fts'
+        self._lock = threading.Lock()
+        self._ensured: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()  # 엔진 → 사용 가능 여부
+
+    def _ddl(self) -> Dict[str, str]:
+        """색인 테이블과 INSERT/DELETE/UPDATE 트리거 DDL (이름 → SQL)"""
+        columns = ', '.join(self.columns)
+        new_values = ', '.join(f'new.{c}' for c in self.columns)
+        old_values = ', '.join(f'old.{c}' for c in self.columns)
+        delete_old = (
+            f"INSERT INTO {self.fts_table}({self.fts_table}, rowid, {columns}) "
+            f"VALUES ('delete', old.{self.id_column}, {old_values});"
+        )
+        insert_new = f"INSERT INTO {self.fts_table}(rowid, {columns}) VALUES (new.{self.id_column}, {new_values});"
+        return {
+            self.fts_table: (
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.fts_table} USING fts5("
+                f"{columns}, content='{self.table}', content_rowid='{self.id_column}', tokenize='trigram')"
+            ),
+            f'{self.fts_table}_ai': (
+                f"CREATE TRIGGER IF NOT EXISTS {self.fts_table}_ai AFTER INSERT ON {self.table} BEGIN "
+                f"{insert_new} END"
+            ),
+            f'{self.fts_table}_ad': (
+                f"CREATE TRIGGER IF NOT EXISTS {self.fts_table}_ad AFTER DELETE ON {self.table} BEGIN "
+                f"{delete_old} END"
+            ),
+            f'{self.fts_table}_au': (
+                f"CREATE TRIGGER IF NOT EXISTS {self.fts_table}_au AFTER UPDATE OF {columns} ON {self.table} BEGIN "
+                f"{delete_old} {insert_new} END"
+            ),
+        }
+
+    def ensure(self, session) -> bool:
+        """색인과 트리거 확인 및 생성 (DB당 1회) - FTS5/trigram을 지원하지 않으면 False
+
+        색인이 없었거나 트리거가 빠져 있었으면(테이블 재생성 마이그레이션 등) 원본 테이블에서 재구축
+        """
+        engine = session.get_bind()
+        if engine in self._ensured:
+            return self._ensured[engine]
+
+        with self._lock:
+            if engine in self._ensured:
+                return self._ensured[engine]
+
+            ddl = self._ddl()
+            try:
+                existing: Set[str] = {
+                    row[0] for row in session.execute(
+                        text("SELECT name FROM sqlite_master WHERE name IN :names").bindparams(
+                            bindparam('names', expanding=True)
+                        ),
+                        {'names': list(ddl)}
+                    )
+                }
+                if existing != set(ddl):
+                    for sql in ddl.values():
+                        session.execute(text(sql))
+                    self.rebuild(session)
+                    logger.info(f"전문 검색 색인 생성: {self.fts_table} ({', '.join(self.columns)})")
+                available = True
+            except Exception as e:
+                session.rollback()
+                logger.warning(f"전문 검색 색인을 사용할 수 없어 LIKE 검색을 사용합니다: {e}")
+                available = False
+
+            self._ensured[engine] = available
+            return available
+
+    def rebuild(self, session) -> None:
+        """원본 테이블 전체로 색인 재구축"""
+        session.execute(text(f"INSERT INTO {self.fts_table}({self.fts_table}) VALUES ('rebuild')"))
+        session.commit()
+
+    def match_expression(self, terms: Dict[str, str]) -> Optional[str]:
+        """{컬럼: 검색어} → 컬럼별 부분 문자열 조건을 AND로 묶은 MATCH 식 (색인으로 찾을 수 없는 검색어는 제외)"""
+        parts = []
+        for column, keyword in terms.items():
+            quoted = phrase(keyword)
+            if column in self.columns and quoted is not None:
+                parts.append(f'{column} : {quoted}')
+        return ' AND '.join(parts) or None
+
+    def matches(self, expression: str):
+        """MATCH 식에 일치하는 (id, rank) 서브쿼리 - rank는 bm25 (작을수록 관련도 높음)"""
+        return text(
+            f"SELECT rowid AS id, rank FROM {self.fts_table} WHERE {self.fts_table} MATCH :expression"
+        ).bindparams(expression=expression).columns(id=Integer, rank=Float).subquery(f'{self.fts_table}_match')
+
+
+BID_NOTICE_FTS = FullTextIndex('bid_notices', ('bid_notice_nm', 'dminstt_nm'))
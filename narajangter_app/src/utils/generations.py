@@ -0,0 +1,73 @@
+"""
+데이터 세대 모듈
+수집으로 테이블 내용이 바뀔 때마다 올리는 테이블별 세대 번호 - 건수/응답 캐시의 무효화 기준
+"""
+import secrets
+import itertools
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+# 세대를 알 수 없을 때(공유 백엔드 장애) 쓰는 음수 세대 - 프로세스별 임의 기준값에서 매번 새 값을 발급해
+# 어떤 캐시 항목의 세대와도 같지 않음 (캐시 미적중 강제)
+_unknown_base = secrets.randbits(40) << 20
+_unknown_counter = itertools.count(1)
+
+
+def unknown_generation() -> int:
+    """다시 쓰이지 않는 음수 세대 (캐시 조회는 항상 미적중)"""
+    return -(_unknown_base + next(_unknown_counter))
+
+
+def is_known(generation: Tuple[int, ...]) -> bool:
+    """캐시에 저장해도 되는 세대인지 (unknown_generation이 섞여 있으면 False)"""
+    return all(value >= 0 for value in generation)
+
+
+class DataGenerations:
+    """테이블별 세대 번호 (프로세스 내 공유)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generations: Dict[str, int] = {}
+
+    def get(self, table: str) -> int:
+        with self._lock:
+            return self._generations.get(table, 0)
+
+    def snapshot(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        """여러 테이블의 세대를 한 번에 조회"""
+        with self._lock:
+            return tuple(self._generations.get(table, 0) for table in tables)
+
+    def bump(self, table: str) -> int:
+        """테이블 세대 증가 - 새 세대 번호 반환"""
+        with self._lock:
+            generation = self._generations.get(table, 0) + 1
+            self._generations[table] = generation
+            return generation
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._generations)
+
+
+_generations: Optional[DataGenerations] = None
+_generations_lock = threading.Lock()
+
+
+def get_data_generations() -> DataGenerations:
+    """프로세스 공유 데이터 세대 조회"""
+    global _generations
+    if _generations is None:
+        with _generations_lock:
+            if _generations is None:
+                _generations = DataGenerations()
+    return _generations
+
+
+def configure_data_generations(generations: Optional[DataGenerations] = None) -> DataGenerations:
+    """공유 데이터 세대 교체 (None이면 프로세스 내 세대로 재생성)"""
+    global _generations
+    with _generations_lock:
+        _generations = generations or DataGenerations()
+    return _generations
@@ -0,0 +1,191 @@
+"""
+응답 캐시 모듈
+조회 API의 렌더링된 응답을 (엔드포인트, 정규화된 쿼리 파라미터) 기준 LRU에 데이터 세대와 함께 저장하고,
+본문 해시 ETag로 If-None-Match 요청에 304를 반환 - 동기화가 없는 동안 조회 요청은 DB를 거치지 않음
+"""
+import time
+import hashlib
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from flask import current_app, make_response, request
+
+from .generations import get_data_generations, is_known
+from .shared_cache import get_shared_cache
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    mimetype: str
+    etag: str
+    generation: Tuple[int, ...]
+    stored_at: float
+
+
+class ResponseCache:
+    """크기 제한이 있는 렌더링 응답 LRU
+
+    항목은 의존 테이블의 데이터 세대가 바뀌면 무효가 되고, 다른 프로세스가 DB를 바꾸는 경우에
+    대비해 ttl 초가 지나도 다시 렌더링 (본문이 같으면 ETag도 같아 클라이언트는 계속 304)
+    """
+
+    DEFAULT_MAX_ENTRIES = 512             # 최대 항목 수
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024  # 본문 합계 최대 크기
+    DEFAULT_TTL = 300                     # 항목 최대 보관 시간 (초)
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: float = DEFAULT_TTL
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.stores = 0
+        self.evictions = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[tuple, CachedResponse]' = OrderedDict()
+
+    @staticmethod
+    def make_etag(body: bytes) -> str:
+        return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    def get(self, key: tuple, generation: Tuple[int, ...]) -> Optional[CachedResponse]:
+        """현재 세대의 만료되지 않은 응답 - 없으면 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.generation == generation and entry.stored_at + self.ttl > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple, generation: Tuple[int, ...], body: bytes, mimetype: str) -> CachedResponse:
+        """응답 저장 (최대 크기를 넘는 본문은 ETag만 계산하고 저장하지 않음)"""
+        entry = CachedResponse(body, mimetype, self.make_etag(body), generation, time.monotonic())
+        if len(body) > self.max_bytes:
+            return entry
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.body)
+            self._entries[key] = entry
+            self._size += len(body)
+            self.stores += 1
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+                self.evictions += 1
+        return entry
+
+    def record_not_modified(self) -> None:
+        with self._lock:
+            self.not_modified += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'not_modified': self.not_modified,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'size_bytes': self._size,
+                'max_bytes': self.max_bytes
+            }
+
+
+def cached_view(*tables: str):
+    """GET 조회 뷰 데코레이터 - tables는 응답이 의존하는 테이블 (해당 테이블 세대가 바뀌면 다시 렌더링)
+
+    200 응답만 캐시하고 ETag와 Cache-Control: no-cache(매번 재검증)를 붙임 (캐시를 끄면 ETag/304만 적용)
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != 'GET':
+                return view(*args, **kwargs)
+
+            cache = get_response_cache()
+            key = (request.endpoint, tuple(sorted(request.args.items(multi=True))))
+            generation = get_data_generations().snapshot(tables)
+            entry = cache.get(key, generation) if cache is not None else None
+            status = 'HIT'
+            if entry is None:
+                entry = _get_shared(cache, key, generation)
+                status = 'SHARED'
+            if entry is None:
+                rendered = make_response(view(*args, **kwargs))
+                if rendered.status_code != 200:
+                    return rendered
+                body = rendered.get_data()
+                if cache is not None and is_known(generation):
+                    entry = cache.put(key, generation, body, rendered.mimetype)
+                else:
+                    entry = CachedResponse(body, rendered.mimetype, ResponseCache.make_etag(body), generation, 0.0)
+                if is_known(generation):
+                    _put_shared(key, entry)
+                status = 'MISS'
+
+            response = current_app.response_class(entry.body, mimetype=entry.mimetype)
+            response.set_etag(entry.etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            response.headers['X-Response-Cache'] = status
+            response.make_conditional(request)
+            if response.status_code == 304 and cache is not None:
+                cache.record_not_modified()
+            return response
+        return wrapper
+    return decorator
+
+
+def _get_shared(cache: Optional[ResponseCache], key: tuple, generation: Tuple[int, ...]) -> Optional[CachedResponse]:
+    """다른 워커가 같은 세대에 렌더링한 응답 (공유 캐시를 켠 경우, 로컬 캐시에도 저장)"""
+    shared = get_shared_cache()
+    value = shared.get('response', generation, key) if shared is not None else None
+    if value is None:
+        return None
+    mimetype, _, body = value.partition(b'\n')
+    if cache is not None:
+        return cache.put(key, generation, body, mimetype.decode())
+    return CachedResponse(body, mimetype.decode(), ResponseCache.make_etag(body), generation, 0.0)
+
+
+def _put_shared(key: tuple, entry: CachedResponse) -> None:
+    shared = get_shared_cache()
+    if shared is not None:
+        shared.set('response', entry.generation, key, entry.mimetype.encode() + b'\n' + entry.body)
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """프로세스 공유 응답 캐시 조회 (configure_response_cache로 켜지 않았으면 None)"""
+    return _cache
+
+
+def configure_response_cache(enabled: bool = True, **kwargs) -> Optional[ResponseCache]:
+    """공유 응답 캐시 설정 변경 (enabled=False면 캐시 미사용)"""
+    global _cache
+    with _cache_lock:
+        _cache = ResponseCache(**kwargs) if enabled else None
+    return _cache
@@ -0,0 +1,206 @@
+"""
+공유 HTTP 클라이언트
+keep-alive 연결 풀을 재사용하여 API 호출마다 발생하는 TCP/DNS 핸드셰이크 비용 제거
+(비동기 조회 엔진의 aiohttp 세션도 여기서 만들어 요청/연결 통계를 함께 집계)
+"""
+import time
+import logging
+import threading
+from typing import Dict, Any, Optional, Union, Tuple
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class HTTPClient:
+    """연결 풀 기반 HTTP 클라이언트"""
+
+    DEFAULT_POOL_SIZE = 10         # 호스트별 최대 유지 연결 수
+    DEFAULT_POOL_CONNECTIONS = 4   # 연결 풀을 유지할 호스트 수
+    DEFAULT_TIMEOUT = 30           # 기본 타임아웃 (초)
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        timeout: Timeout = DEFAULT_TIMEOUT
+    ):
+        self.pool_size = pool_size
+        self.pool_connections = pool_connections
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_size
+        )
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._error_count = 0
+        self._total_elapsed = 0.0
+        self._async_sessions = 0
+        self._async_request_count = 0
+        self._async_error_count = 0
+        self._async_total_elapsed = 0.0
+        self._async_connections = 0
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[Timeout] = None,
+        **kwargs
+    ) -> requests.Response:
+        """연결 풀을 통한 요청 (timeout 미지정 시 기본값 적용)"""
+        start_time = time.time()
+        try:
+            response = self.session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+        except requests.exceptions.RequestException:
+            with self._lock:
+                self._request_count += 1
+                self._error_count += 1
+                self._total_elapsed += time.time() - start_time
+            raise
+
+        with self._lock:
+            self._request_count += 1
+            self._total_elapsed += time.time() - start_time
+        return response
+
+    def get(self, url: str, params: Dict[str, Any] = None, timeout: Optional[Timeout] = None, **kwargs) -> requests.Response:
+        return self.request('GET', url, params=params, timeout=timeout, **kwargs)
+
+    def post(self, url: str, json: Any = None, timeout: Optional[Timeout] = None, **kwargs) -> requests.Response:
+        return self.request('POST', url, json=json, timeout=timeout, **kwargs)
+
+    def create_async_session(
+        self,
+        limit: int,
+        limit_per_host: int,
+        timeout: Optional[Timeout] = None
+    ) -> aiohttp.ClientSession:
+        """비동기 조회 엔진용 aiohttp 세션 (이벤트 루프에 묶이므로 실행마다 생성)
+
+        요청 수/응답 시간/새 연결 수는 stats()['async']에 합산됨
+        """
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._on_async_request_start)
+        trace.on_request_end.append(self._on_async_request_end)
+        trace.on_request_exception.append(self._on_async_request_exception)
+        trace.on_connection_create_end.append(self._on_async_connection_created)
+
+        timeout = self.timeout if timeout is None else timeout
+        if isinstance(timeout, tuple):
+            client_timeout = aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+        else:
+            client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host, ttl_dns_cache=300)
+        with self._lock:
+            self._async_sessions += 1
+        return aiohttp.ClientSession(connector=connector, timeout=client_timeout, trace_configs=[trace])
+
+    async def _on_async_request_start(self, session, context, params) -> None:
+        context.start_time = time.time()
+
+    def _record_async_request(self, context, error: bool) -> None:
+        with self._lock:
+            self._async_request_count += 1
+            self._async_error_count += error
+            self._async_total_elapsed += time.time() - context.start_time
+
+    async def _on_async_request_end(self, session, context, params) -> None:
+        self._record_async_request(context, error=False)
+
+    async def _on_async_request_exception(self, session, context, params) -> None:
+        self._record_async_request(context, error=True)
+
+    async def _on_async_connection_created(self, session, context, params) -> None:
+        with self._lock:
+            self._async_connections += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """요청 수, 평균 응답 시간, 호스트별 연결 풀 현황"""
+        pools = []
+        pool_manager = self.adapter.poolmanager
+        for key in list(pool_manager.pools.keys()):
+            pool = pool_manager.pools.get(key)
+            if pool is None:
+                continue
+            pools.append({
+                'host': f"{pool.scheme}://{pool.host}:{pool.port}",
+                'connections_created': pool.num_connections,
+                'requests': pool.num_requests,
+                'idle_connections': pool.pool.qsize() if pool.pool is not None else 0,
+                'max_size': pool.pool.maxsize if pool.pool is not None else self.pool_size
+            })
+
+        with self._lock:
+            request_count = self._request_count
+            error_count = self._error_count
+            total_elapsed = self._total_elapsed
+            async_requests = self._async_request_count
+            async_stats = {
+                'sessions': self._async_sessions,
+                'requests': async_requests,
+                'errors': self._async_error_count,
+                'avg_response_time': round(self._async_total_elapsed / async_requests, 4) if async_requests else 0,
+                'connections_created': self._async_connections,
+                'connection_reuse_rate': (
+                    round(1 - self._async_connections / async_requests, 4) if async_requests else 0
+                )
+            }
+
+        connections_created = sum(p['connections_created'] for p in pools)
+        return {
+            'pool_size': self.pool_size,
+            'pool_connections': self.pool_connections,
+            'timeout': self.timeout,
+            'requests': request_count,
+            'errors': error_count,
+            'avg_response_time': round(total_elapsed / request_count, 4) if request_count else 0,
+            'connections_created': connections_created,
+            'connection_reuse_rate': round(1 - connections_created / request_count, 4) if request_count else 0,
+            'pools': pools,
+            'async': async_stats
+        }
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_client: Optional[HTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """프로세스 공유 HTTP 클라이언트 조회"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HTTPClient()
+    return _client
+
+
+def configure_http_client(
+    pool_size: int = HTTPClient.DEFAULT_POOL_SIZE,
+    pool_connections: int = HTTPClient.DEFAULT_POOL_CONNECTIONS,
+    timeout: Timeout = HTTPClient.DEFAULT_TIMEOUT
+) -> HTTPClient:
+    """공유 클라이언트 설정 변경 (기존 연결 풀은 닫힘)"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = HTTPClient(pool_size=pool_size, pool_connections=pool_connections, timeout=timeout)
+        logger.info(f"HTTP 클라이언트 설정: pool_size={pool_size}, timeout={timeout}")
+    return _client
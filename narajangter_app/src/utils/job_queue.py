@@ -0,0 +1,144 @@
+"""
+백그라운드 작업 큐 모듈
+동기화 작업을 워커 스레드 풀에서 실행하고 진행 상황/결과를 조회
+"""
+import time
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Optional, Callable, List
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+ERROR = 'error'
+
+
+class JobQueue:
+    """스레드 풀 기반 작업 큐 (작업마다 Flask 앱 컨텍스트에서 실행)"""
+
+    DEFAULT_WORKERS = 2      # 동시에 실행할 동기화 작업 수
+    MAX_HISTORY = 100        # 상태를 보관할 최근 작업 수
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, max_history: int = MAX_HISTORY):
+        self.max_workers = max(1, max_workers)
+        self.max_history = max_history
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='sync-job')
+        self._lock = threading.Lock()
+        self._jobs: 'OrderedDict[Any, Dict[str, Any]]' = OrderedDict()
+
+    def submit(
+        self,
+        job_id: Any,
+        app,
+        fn: Callable[[], Any],
+        progress: Optional[Callable[[], Dict[str, Any]]] = None,
+        cancel: Optional[Callable[[], None]] = None
+    ) -> Future:
+        """작업 등록 - fn은 워커 스레드에서 app 컨텍스트 안에서 실행됨
+
+        progress는 실행 중 진행 상황을, cancel은 취소 요청을 처리하는 콜백
+        """
+        entry = {
+            'status': QUEUED,
+            'submitted_at': time.time(),
+            'started_at': None,
+            'finished_at': None,
+            'result': None,
+            'error': None,
+            'progress': progress,
+            'cancel': cancel
+        }
+        with self._lock:
+            self._jobs[job_id] = entry
+            self._jobs.move_to_end(job_id)
+            while len(self._jobs) > self.max_history:
+                oldest_id, oldest = next(iter(self._jobs.items()))
+                if oldest['status'] in (QUEUED, RUNNING):
+                    break
+                self._jobs.pop(oldest_id)
+
+        def run():
+            entry['status'] = RUNNING
+            entry['started_at'] = time.time()
+            try:
+                with app.app_context():
+                    entry['result'] = fn()
+                entry['status'] = DONE
+            except BaseException as e:
+                # CancelledError 등 Exception이 아닌 예외도 종료 상태로 기록 (RUNNING으로 남지 않도록)
+                logger.exception(f"작업 {job_id} 실패")
+                entry['error'] = str(e) or type(e).__name__
+                entry['status'] = ERROR
+            finally:
+                entry['finished_at'] = time.time()
+
+        logger.info(f"작업 {job_id} 등록 (대기 {self.pending_count()}건)")
+        return self._executor.submit(run)
+
+    def get(self, job_id: Any) -> Optional[Dict[str, Any]]:
+        """작업 상태 스냅샷 (이 프로세스에서 등록하지 않은 작업은 None)"""
+        with self._lock:
+            entry = self._jobs.get(job_id)
+        if entry is None:
+            return None
+
+        now = time.time()
+        snapshot = {
+            'queue_status': entry['status'],
+            'queued_seconds': round((entry['started_at'] or now) - entry['submitted_at'], 2),
+            'running_seconds': round((entry['finished_at'] or now) - entry['started_at'], 2) if entry['started_at'] else 0,
+            'error': entry['error']
+        }
+        if entry['status'] == RUNNING and entry['progress'] is not None:
+            snapshot['progress'] = entry['progress']()
+        if entry['result'] is not None:
+            snapshot['result'] = entry['result']
+        return snapshot
+
+    def cancel(self, job_id: Any) -> bool:
+        """실행 중인 작업 취소 요청"""
+        with self._lock:
+            entry = self._jobs.get(job_id)
+        if entry is None or entry['status'] not in (QUEUED, RUNNING) or entry['cancel'] is None:
+            return False
+        entry['cancel']()
+        return True
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(1 for entry in self._jobs.values() if entry['status'] in (QUEUED, RUNNING))
+
+    def job_ids(self) -> List[Any]:
+        with self._lock:
+            return list(self._jobs.keys())
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """프로세스 공유 작업 큐 조회"""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = JobQueue()
+    return _queue
+
+
+def configure_job_queue(**kwargs) -> JobQueue:
+    """공유 작업 큐 설정 변경 (기존 큐는 실행 중 작업 완료 후 종료)"""
+    global _queue
+    with _queue_lock:
+        if _queue is not None:
+            _queue.shutdown(wait=False)
+        _queue = JobQueue(**kwargs)
+    return _queue
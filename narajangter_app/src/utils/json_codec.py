@@ -0,0 +1,141 @@
+"""
+JSON 직렬화 모듈
+orjson이 설치되어 있으면 사용하고 없으면 표준 json으로 대체
+(data.go.kr 응답 파싱과 Flask API 응답 직렬화에 공통 사용)
+"""
+import json
+import logging
+import threading
+from decimal import Decimal
+from datetime import date, datetime, time
+from typing import Any, Callable, Optional, Union
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _default(obj: Any) -> Any:
+    """기본 지원 외 타입 변환 (날짜는 ISO 8601 문자열)"""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"JSON 직렬화를 지원하지 않는 타입: {type(obj).__name__}")
+
+
+class JSONCodec:
+    """JSON 직렬화 백엔드 (loads / dumps)"""
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[bytes, str]], Any],
+        dumps: Callable[[Any, bool, bool], bytes]
+    ):
+        self.name = name
+        self._loads = loads
+        self._dumps = dumps
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        """JSON 파싱 (형식 오류 시 ValueError)"""
+        return self._loads(data)
+
+    def dumps(self, obj: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+        """UTF-8 JSON 직렬화 (datetime/date는 ISO 8601)"""
+        return self._dumps(obj, sort_keys, indent)
+
+
+def _stdlib_dumps(obj: Any, sort_keys: bool, indent: bool) -> bytes:
+    return json.dumps(
+        obj,
+        default=_default,
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+        indent=2 if indent else None,
+        separators=None if indent else (',', ':')
+    ).encode('utf-8')
+
+
+STDLIB_CODEC = JSONCodec('json', json.loads, _stdlib_dumps)
+
+if orjson is not None:
+    def _orjson_dumps(obj: Any, sort_keys: bool, indent: bool) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_default, option=option)
+        except orjson.JSONEncodeError:
+            # 64비트 범위를 넘는 정수 등 orjson 미지원 값은 표준 json으로 처리
+            return _stdlib_dumps(obj, sort_keys, indent)
+
+    ORJSON_CODEC: Optional[JSONCodec] = JSONCodec('orjson', orjson.loads, _orjson_dumps)
+else:
+    ORJSON_CODEC = None
+
+CODECS = {codec.name: codec for codec in (STDLIB_CODEC, ORJSON_CODEC) if codec is not None}
+
+
+_codec: JSONCodec = ORJSON_CODEC or STDLIB_CODEC
+_codec_lock = threading.Lock()
+
+
+def get_json_codec() -> JSONCodec:
+    """프로세스 공유 JSON 백엔드 조회"""
+    return _codec
+
+
+def configure_json_codec(backend: Optional[str] = None) -> JSONCodec:
+    """공유 JSON 백엔드 변경 (None이면 사용 가능한 가장 빠른 백엔드)"""
+    global _codec
+    if backend is not None and backend not in CODECS:
+        raise ValueError(f"사용할 수 없는 JSON 백엔드: {backend} (가능: {', '.join(CODECS)})")
+    with _codec_lock:
+        _codec = CODECS[backend] if backend else (ORJSON_CODEC or STDLIB_CODEC)
+    logger.info(f"JSON 백엔드: {_codec.name}")
+    return _codec
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    return _codec.loads(data)
+
+
+def dumps(obj: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+    return _codec.dumps(obj, sort_keys, indent)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """공유 JSON 백엔드를 사용하는 Flask JSON provider
+
+    키 순서는 to_dict() 정의 순서를 유지하고 한글은 이스케이프하지 않음
+    """
+
+    sort_keys = False
+    ensure_ascii = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            kwargs.setdefault('default', _default)
+            return super().dumps(obj, **kwargs)
+        return get_json_codec().dumps(obj, self.sort_keys).decode('utf-8')
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return get_json_codec().loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = get_json_codec().dumps(obj, self.sort_keys, indent) + b'\n'
+        return self._app.response_class(body, mimetype=self.mimetype)
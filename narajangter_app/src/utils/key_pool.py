@@ -0,0 +1,162 @@
+"""
+서비스키 풀 모듈
+여러 서비스키를 잔여 호출 한도 비례 가중 라운드로빈으로 배분하고,
+인증/한도 오류가 난 키는 한도 초기화 시각까지 제외
+"""
+import time
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Iterable
+
+from .quota import QuotaManager, QuotaExceededError, get_quota_manager
+
+logger = logging.getLogger(__name__)
+
+# 키를 풀에서 제외하는 data.go.kr resultCode
+EJECT_RESULT_CODES = {
+    '20': 'SERVICE_ACCESS_DENIED_ERROR',
+    '22': 'LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR',
+    '30': 'SERVICE_KEY_IS_NOT_REGISTERED_ERROR',
+    '31': 'DEADLINE_HAS_EXPIRED_ERROR',
+    '32': 'UNREGISTERED_IP_ERROR',
+}
+
+
+class KeyPool:
+    """서비스키 풀 (스무스 가중 라운드로빈, 가중치 = 오늘 잔여 호출 수)"""
+
+    WEIGHT_REFRESH = 5.0  # 잔여 한도 가중치 갱신 주기 (초)
+
+    def __init__(self, keys: Iterable[str] = (), quota_manager: Optional[QuotaManager] = None):
+        self.quota_manager = quota_manager or get_quota_manager()
+        self._lock = threading.Lock()
+        self._keys: List[str] = []
+        self._weights: Dict[str, int] = {}
+        self._current: Dict[str, float] = {}
+        self._ejected: Dict[str, Dict[str, Any]] = {}
+        self._selected: Dict[str, int] = {}
+        self._refreshed_at = 0.0
+        self.set_keys(keys)
+
+    @property
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._keys)
+
+    def set_keys(self, keys: Iterable[str]) -> None:
+        """풀 구성 변경 (남아 있는 키의 제외 상태와 선택 횟수는 유지)"""
+        keys = list(dict.fromkeys(key for key in keys if key))
+        with self._lock:
+            self._keys = keys
+            self._current = {key: self._current.get(key, 0.0) for key in keys}
+            self._ejected = {key: info for key, info in self._ejected.items() if key in keys}
+            self._selected = {key: self._selected.get(key, 0) for key in keys}
+            self._refreshed_at = 0.0
+
+    def acquire(self) -> str:
+        """다음 호출에 사용할 키 - 사용 가능한 키가 없으면 QuotaExceededError"""
+        with self._lock:
+            self._refresh_weights()
+            candidates = [key for key in self._keys if self._weights.get(key, 0) > 0 and not self._is_ejected(key)]
+            if not candidates:
+                raise QuotaExceededError(
+                    f"사용 가능한 서비스키가 없습니다 (전체 {len(self._keys)}개)",
+                    remaining=0,
+                    retry_after=self._retry_after()
+                )
+
+            total = 0
+            best = None
+            for key in candidates:
+                self._current[key] += self._weights[key]
+                total += self._weights[key]
+                if best is None or self._current[key] > self._current[best]:
+                    best = key
+            self._current[best] -= total
+            self._selected[best] += 1
+            return best
+
+    def eject(self, key: str, reason: str, seconds: Optional[float] = None) -> None:
+        """키를 풀에서 제외 (기본: 한도 초기화 시각까지)"""
+        seconds = self.quota_manager.seconds_until_reset() if seconds is None else seconds
+        with self._lock:
+            if key not in self._keys or self._is_ejected(key):
+                return
+            self._ejected[key] = {'reason': reason, 'until': time.time() + seconds}
+            remaining = sum(1 for k in self._keys if not self._is_ejected(k))
+        logger.warning(f"서비스키 {QuotaManager.key_id(key)} 제외: {reason} (사용 가능 {remaining}개)")
+
+    def restore(self, key: str) -> None:
+        with self._lock:
+            self._ejected.pop(key, None)
+
+    def is_available(self, key: str) -> bool:
+        with self._lock:
+            return key in self._keys and not self._is_ejected(key)
+
+    def remaining(self) -> int:
+        """제외되지 않은 키의 잔여 호출 수 합계"""
+        return sum(self.quota_manager.remaining(key) for key in self.keys if self.is_available(key))
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """키별 잔여 한도/선택 횟수/제외 상태 (키 원문은 노출하지 않음)"""
+        now = time.time()
+        result = []
+        for key in self.keys:
+            with self._lock:
+                ejected = self._ejected.get(key) if self._is_ejected(key) else None
+                selected = self._selected.get(key, 0)
+            result.append({
+                'key_id': QuotaManager.key_id(key),
+                'remaining': self.quota_manager.remaining(key),
+                'selected': selected,
+                'ejected': ejected is not None,
+                'reason': ejected['reason'] if ejected else None,
+                'ejected_for': round(ejected['until'] - now) if ejected else 0
+            })
+        return result
+
+    def _is_ejected(self, key: str) -> bool:
+        info = self._ejected.get(key)
+        if info is None:
+            return False
+        if info['until'] <= time.time():
+            del self._ejected[key]
+            return False
+        return True
+
+    def _refresh_weights(self) -> None:
+        now = time.monotonic()
+        if now - self._refreshed_at < self.WEIGHT_REFRESH and self._weights.keys() >= set(self._keys):
+            return
+        self._weights = {key: self.quota_manager.remaining(key) for key in self._keys}
+        self._refreshed_at = now
+
+    def _retry_after(self) -> int:
+        now = time.time()
+        waits = [info['until'] - now for info in self._ejected.values()]
+        if len(waits) < len(self._keys):
+            return self.quota_manager.seconds_until_reset()
+        return max(1, int(min(waits)))
+
+
+_pool: Optional[KeyPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_key_pool() -> KeyPool:
+    """프로세스 공유 서비스키 풀 조회 (동시에 실행되는 동기화 작업이 제외 상태를 공유)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = KeyPool()
+    return _pool
+
+
+def configure_key_pool(keys: Iterable[str] = (), **kwargs) -> KeyPool:
+    """공유 서비스키 풀 재생성"""
+    global _pool
+    with _pool_lock:
+        _pool = KeyPool(keys, **kwargs)
+    return _pool
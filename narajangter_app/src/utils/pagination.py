@@ -0,0 +1,62 @@
+"""
+커서(keyset) 페이지네이션 모듈
+OFFSET/COUNT 없이 마지막 행의 (정렬 일시, id)를 담은 불투명 커서 다음부터 조회해
+페이지 깊이와 상관없이 일정한 시간에 목록을 가져옴
+"""
+import base64
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import tuple_
+
+from . import json_codec
+
+MAX_PER_PAGE = 1000  # 커서 모드 페이지당 최대 건수
+
+
+def encode_cursor(sort_value: Optional[datetime], row_id: int) -> str:
+    """(정렬 일시, id) → URL-safe base64 커서 문자열"""
+    payload = [sort_value.isoformat() if sort_value is not None else None, row_id]
+    return base64.urlsafe_b64encode(json_codec.dumps(payload)).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """커서 문자열 → (정렬 일시, id) - 형식 오류는 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        sort_value, row_id = json_codec.loads(raw)
+        if type(row_id) is not int:
+            raise TypeError('id')
+        return (datetime.fromisoformat(sort_value) if sort_value is not None else None), row_id
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor!r}") from e
+
+
+def keyset_page(query, sort_column, id_column, limit: int, cursor: Optional[str] = None) -> Tuple[List[Any], Optional[str]]:
+    """(sort_column DESC, id DESC) 순서로 커서 다음 limit건과 다음 페이지 커서 (마지막 페이지면 None)
+
+    정렬 일시가 NULL인 행은 OFFSET 방식과 같이 맨 뒤에 id 역순으로 이어지며,
+    (정렬 일시, id) 행 값 비교로 정렬 일시 인덱스(+rowid) 범위 검색을 사용
+    """
+    sort_value, row_id = decode_cursor(cursor) if cursor else (None, None)
+    items: List[Any] = []
+
+    # 1) 정렬 일시가 있는 행 - 커서가 이미 NULL 구간이면 건너뜀
+    if row_id is None or sort_value is not None:
+        dated = query.filter(sort_column.isnot(None))
+        if row_id is not None:
+            dated = dated.filter(tuple_(sort_column, id_column) < tuple_(sort_value, row_id))
+        items = dated.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1).all()
+
+    # 2) 정렬 일시가 NULL인 행
+    if len(items) <= limit:
+        undated = query.filter(sort_column.is_(None))
+        if sort_value is None and row_id is not None:
+            undated = undated.filter(id_column < row_id)
+        items += undated.order_by(id_column.desc()).limit(limit + 1 - len(items)).all()
+
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    last = items[-1]
+    return items, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
@@ -0,0 +1,253 @@
+"""
+API 호출 한도 관리 모듈
+서비스키별 일일 호출 한도(개발계정 10,000회/일) 추적 및 토큰 버킷 기반 호출 속도 조절
+"""
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Iterator, Tuple
+from datetime import datetime, timedelta, timezone
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))  # data.go.kr 호출 한도는 한국시간 자정에 초기화
+# 사용량 DB 위치 (QUOTA_DB_PATH 환경변수로 변경)
+DEFAULT_DB_PATH = os.environ.get('QUOTA_DB_PATH') or os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), 'database', 'quota.db'
+)
+
+
+class QuotaExceededError(Exception):
+    """일일 호출 한도 초과"""
+
+    def __init__(self, message: str, remaining: int = 0, retry_after: int = 0):
+        super().__init__(message)
+        self.remaining = remaining
+        self.retry_after = retry_after
+
+
+class QuotaReservation:
+    """작업 단위 호출 예약 - 예약 수량 내에서는 DB 접근 없이 호출 차감"""
+
+    def __init__(self, manager: 'QuotaManager', key_id: str, day: str, calls: int):
+        self.manager = manager
+        self.key_id = key_id
+        self.day = day
+        self.calls = calls
+        self.used = 0
+        self.released = False
+        self._lock = threading.Lock()
+
+    def use(self, calls: int = 1) -> bool:
+        """예약분에서 호출 차감 (예약 소진 시 False)"""
+        with self._lock:
+            if self.released or self.used + calls > self.calls:
+                return False
+            self.used += calls
+            return True
+
+    def release(self) -> None:
+        """실사용량 반영 후 미사용 예약분 반환"""
+        with self._lock:
+            if self.released:
+                return
+            self.released = True
+            used = self.used
+        self.manager._settle(self.key_id, self.day, self.calls, used)
+
+    def __enter__(self) -> 'QuotaReservation':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+class QuotaManager:
+    """서비스키별 일일 호출 한도 관리 클래스"""
+
+    DEFAULT_DAILY_LIMIT = 10000   # 개발계정 일일 호출 한도
+    DEFAULT_RATE = 10.0           # 초당 호출 수
+    DEFAULT_BURST = 10            # 순간 최대 호출 수
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        daily_limit: int = DEFAULT_DAILY_LIMIT,
+        rate_per_second: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST
+    ):
+        self.db_path = db_path
+        self.daily_limit = daily_limit
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self._memory_conn = sqlite3.connect(db_path, check_same_thread=False) if db_path == ':memory:' else None
+
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS api_quota_usage (
+                    key_id TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    used INTEGER NOT NULL DEFAULT 0,
+                    reserved INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (key_id, day)
+                )
+            """)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if self._memory_conn is not None:
+            with self._lock, self._memory_conn:
+                yield self._memory_conn
+            return
+
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def key_id(service_key: str) -> str:
+        """서비스키 식별자 (키 원문은 저장하지 않음)"""
+        return hashlib.sha256(service_key.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def today() -> str:
+        return datetime.now(KST).strftime('%Y%m%d')
+
+    @staticmethod
+    def seconds_until_reset() -> int:
+        now = datetime.now(KST)
+        tomorrow = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return int((tomorrow - now).total_seconds()) + 1
+
+    def _ensure_row(self, conn: sqlite3.Connection, key_id: str, day: str) -> None:
+        conn.execute(
+            "INSERT OR IGNORE INTO api_quota_usage (key_id, day, used, reserved) VALUES (?, ?, 0, 0)",
+            (key_id, day)
+        )
+
+    def usage(self, service_key: str) -> Dict[str, Any]:
+        """오늘 사용량 및 잔여 호출 수"""
+        key_id = self.key_id(service_key)
+        day = self.today()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT used, reserved FROM api_quota_usage WHERE key_id = ? AND day = ?",
+                (key_id, day)
+            ).fetchone()
+        used, reserved = row if row else (0, 0)
+        return {
+            'key_id': key_id,
+            'day': day,
+            'daily_limit': self.daily_limit,
+            'used': used,
+            'reserved': reserved,
+            'remaining': max(0, self.daily_limit - used - reserved),
+            'resets_in': self.seconds_until_reset()
+        }
+
+    def remaining(self, service_key: str) -> int:
+        return self.usage(service_key)['remaining']
+
+    def consume(self, service_key: str, calls: int = 1) -> None:
+        """예약 없이 호출 차감 (한도 초과 시 QuotaExceededError)"""
+        key_id = self.key_id(service_key)
+        day = self.today()
+        with self._connect() as conn:
+            self._ensure_row(conn, key_id, day)
+            cursor = conn.execute(
+                """
+                UPDATE api_quota_usage SET used = used + ?
+                WHERE key_id = ? AND day = ? AND used + reserved + ? <= ?
+                """,
+                (calls, key_id, day, calls, self.daily_limit)
+            )
+            if cursor.rowcount == 0:
+                self._raise_exceeded(conn, key_id, day, calls)
+
+    def reserve(self, service_key: str, calls: int) -> QuotaReservation:
+        """작업에 필요한 호출 수를 미리 예약 (부족 시 QuotaExceededError)"""
+        key_id = self.key_id(service_key)
+        day = self.today()
+        with self._connect() as conn:
+            self._ensure_row(conn, key_id, day)
+            cursor = conn.execute(
+                """
+                UPDATE api_quota_usage SET reserved = reserved + ?
+                WHERE key_id = ? AND day = ? AND used + reserved + ? <= ?
+                """,
+                (calls, key_id, day, calls, self.daily_limit)
+            )
+            if cursor.rowcount == 0:
+                self._raise_exceeded(conn, key_id, day, calls)
+        return QuotaReservation(self, key_id, day, calls)
+
+    def _settle(self, key_id: str, day: str, reserved: int, used: int) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE api_quota_usage
+                SET used = used + ?, reserved = MAX(0, reserved - ?)
+                WHERE key_id = ? AND day = ?
+                """,
+                (used, reserved, key_id, day)
+            )
+
+    def _raise_exceeded(self, conn: sqlite3.Connection, key_id: str, day: str, calls: int) -> None:
+        row = conn.execute(
+            "SELECT used, reserved FROM api_quota_usage WHERE key_id = ? AND day = ?",
+            (key_id, day)
+        ).fetchone()
+        remaining = max(0, self.daily_limit - row[0] - row[1]) if row else self.daily_limit
+        message = f"일일 호출 한도 초과: 요청 {calls}회, 잔여 {remaining}회"
+        logger.warning(message)
+        raise QuotaExceededError(message, remaining=remaining, retry_after=self.seconds_until_reset())
+
+    def pace(self, service_key: str) -> float:
+        """토큰 버킷 - 다음 호출 전 대기해야 할 시간(초) 반환"""
+        key_id = self.key_id(service_key)
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(key_id, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - last) * self.rate_per_second) - 1
+            self._buckets[key_id] = (tokens, now)
+        return 0.0 if tokens >= 0 else -tokens / self.rate_per_second
+
+    def wait(self, service_key: str) -> None:
+        """동기 호출용 속도 조절"""
+        delay = self.pace(service_key)
+        if delay > 0:
+            time.sleep(delay)
+
+
+_manager: Optional[QuotaManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_quota_manager() -> QuotaManager:
+    """프로세스 공유 호출 한도 관리자 조회"""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = QuotaManager()
+    return _manager
+
+
+def configure_quota_manager(**kwargs) -> QuotaManager:
+    """공유 호출 한도 관리자 설정 변경"""
+    global _manager
+    with _manager_lock:
+        _manager = QuotaManager(**kwargs)
+    return _manager
@@ -0,0 +1,196 @@
+"""
+API 호출 복원력 모듈
+지수 백오프 + 지터 재시도, 재시도 예산, 엔드포인트별 서킷 브레이커
+"""
+import time
+import random
+import logging
+import threading
+from typing import Dict, Any
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """지수 백오프 재시도 정책 (full jitter, 시도마다 타임아웃 증가)"""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        timeout_multiplier: float = 1.5,
+        max_timeout: float = 60.0
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.timeout_multiplier = timeout_multiplier
+        self.max_timeout = max_timeout
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째 실패(0부터) 후 대기 시간"""
+        backoff = min(self.max_delay, self.base_delay * (self.multiplier ** attempt))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def timeout(self, attempt: int, base_timeout: float) -> float:
+        """attempt번째 시도(0부터)의 타임아웃 - 느린 응답에 점진적으로 여유 부여"""
+        return min(self.max_timeout, base_timeout * (self.timeout_multiplier ** attempt))
+
+
+class RetryBudget:
+    """재시도 예산 - 최근 요청 대비 재시도 비율을 제한해 장애 시 재시도 폭주 방지"""
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 60.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._requests = 0
+        self._retries = 0
+
+    def _roll(self, now: float) -> None:
+        if now - self._window_start >= self.window:
+            self._window_start = now
+            self._requests = 0
+            self._retries = 0
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._roll(time.monotonic())
+            self._requests += 1
+
+    def can_retry(self) -> bool:
+        """재시도 가능 여부 (가능하면 예산 차감)"""
+        with self._lock:
+            self._roll(time.monotonic())
+            allowed = max(self.min_retries, int(self._requests * self.ratio))
+            if self._retries >= allowed:
+                return False
+            self._retries += 1
+            return True
+
+
+class CircuitBreaker:
+    """연속 실패 시 일정 시간 호출을 차단하는 서킷 브레이커"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.open_count = 0
+        self.rejected_count = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 - 반개방 상태에서는 탐색 요청 하나만 허용"""
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected_count += 1
+            return False
+
+    def release_probe(self) -> None:
+        """허용받은 요청을 보내지 못한 경우 반개방 탐색 슬롯 반환 (호출 한도 초과 등)"""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probe_in_flight = False
+
+    def retry_after(self) -> float:
+        """차단 해제(반개방)까지 남은 시간(초)"""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"Circuit closed: {self.name}")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            self._failures += 1
+            if state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if state != self.OPEN:
+                    self.open_count += 1
+                    logger.warning(f"Circuit opened: {self.name} ({self._failures} consecutive failures)")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            return {
+                'name': self.name,
+                'state': state,
+                'consecutive_failures': self._failures,
+                'open_count': self.open_count,
+                'rejected': self.rejected_count
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_retry_budget = RetryBudget()
+
+
+def endpoint_name(url: str) -> str:
+    """쿼리스트링을 제외한 엔드포인트 식별자"""
+    parts = urlsplit(url)
+    return f"{parts.netloc}{parts.path}"
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """엔드포인트별 공유 서킷 브레이커 조회"""
+    name = endpoint_name(url)
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(name, CircuitBreaker(name))
+    return breaker
+
+
+def get_retry_budget() -> RetryBudget:
+    """프로세스 공유 재시도 예산"""
+    return _retry_budget
+
+
+def breaker_stats() -> Dict[str, Any]:
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {'circuit_breakers': [breaker.stats() for breaker in breakers]}
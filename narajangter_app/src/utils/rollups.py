@@ -0,0 +1,244 @@
+"""
+분석 집계 테이블 모듈
+업무구분별/월별 건수·합계·최소·최대를 집계 테이블에 저장하고 원본 테이블 트리거로 갱신
+(수집 upsert와 같은 트랜잭션에서 반영되어 분석 API는 GROUP BY 없이 집계 테이블만 조회)
+"""
+import logging
+import threading
+import weakref
+from typing import Any, Dict, List, NamedTuple
+
+from sqlalchemy import bindparam, text
+
+from .generations import get_data_generations
+
+logger = logging.getLogger(__name__)
+
+
+class Rollup(NamedTuple):
+    """집계 정의 - key/condition은 '{row}'(new/old/원본 테이블명)에 대한 SQL 식"""
+    name: str          # 집계 테이블명
+    source: str        # 원본 테이블명
+    key: str           # 그룹 키 식 (NULL 그룹은 NULL_GROUP_KEY로 저장)
+    value: str         # 집계 대상 컬럼
+    condition: str     # 집계에 포함할 행 조건
+    columns: tuple     # 트리거를 발생시키는 원본 컬럼 (키/값/조건에 쓰인 컬럼)
+    group_filter: str  # 원본 테이블에서 그룹 하나를 고르는 조건 ('{key}'는 그룹 키) - 최소/최대 재계산용
+    integer: bool = False  # 정수 컬럼 집계 (REAL로 저장한 합계/최소/최대를 조회 시 정수로 변환)
+
+
+# NULL 그룹 키 - 빈 BLOB은 어떤 문자열과도 같지 않아 ''(빈 업무구분) 그룹과 구분됨 (조회 시 None)
+NULL_GROUP_KEY = b''
+
+ROLLUPS = (
+    Rollup(
+        name='rollup_bid_amount_by_work_div',
+        source='bid_notices',
+        key="IFNULL({row}.work_div_nm, X'')",
+        value='presmpt_price',
+        condition='{row}.presmpt_price IS NOT NULL',
+        columns=('work_div_nm', 'presmpt_price'),
+        group_filter="(work_div_nm = {key} OR (work_div_nm IS NULL AND {key} = X''))",
+        integer=True,
+    ),
+    Rollup(
+        name='rollup_bid_amount_by_month',
+        source='bid_notices',
+        key="strftime('%Y-%m', {row}.rgst_dt)",
+        value='presmpt_price',
+        condition='{row}.rgst_dt IS NOT NULL AND {row}.presmpt_price IS NOT NULL',
+        columns=('rgst_dt', 'presmpt_price'),
+        group_filter="rgst_dt >= {key} || '-01' AND rgst_dt < date({key} || '-01', '+1 month')",
+        integer=True,
+    ),
+    Rollup(
+        name='rollup_successful_bid_rate_by_work_div',
+        source='successful_bids',
+        key="IFNULL({row}.work_div_nm, X'')",
+        value='scsbid_rate',
+        condition='{row}.scsbid_rate IS NOT NULL',
+        columns=('work_div_nm', 'scsbid_rate'),
+        group_filter="(work_div_nm = {key} OR (work_div_nm IS NULL AND {key} = X''))",
+    ),
+)
+
+ROLLUPS_BY_NAME = {rollup.name: rollup for rollup in ROLLUPS}
+
+
+def _ddl(rollup: Rollup) -> Dict[str, str]:
+    """집계 테이블과 INSERT/DELETE/UPDATE 트리거 DDL (이름 → SQL)"""
+    table, source, value = rollup.name, rollup.source, rollup.value
+
+    def add(row: str) -> str:
+        return (
+            f"INSERT INTO {table} (group_key, row_count, total, min_value, max_value) "
+            f"SELECT {rollup.key.format(row=row)}, 1, {row}.{value}, {row}.{value}, {row}.{value} "
+            f"WHERE {rollup.condition.format(row=row)} "
+            f"ON CONFLICT (group_key) DO UPDATE SET "
+            f"row_count = row_count + 1, total = total + excluded.total, "
+            f"min_value = MIN(min_value, excluded.min_value), max_value = MAX(max_value, excluded.max_value);"
+        )
+
+    def remove(row: str) -> str:
+        key = rollup.key.format(row=row)
+        condition = rollup.condition.format(row=row)
+        group = f"{rollup.group_filter.format(key=key)} AND {rollup.condition.format(row=source)}"
+        # 최소/최대값을 가진 행이 빠질 때만 그룹을 다시 계산
+        return (
+            f"UPDATE {table} SET row_count = row_count - 1, total = total - {row}.{value} "
+            f"WHERE group_key = {key} AND {condition}; "
+            f"UPDATE {table} SET "
+            f"min_value = (SELECT MIN({value}) FROM {source} WHERE {group}), "
+            f"max_value = (SELECT MAX({value}) FROM {source} WHERE {group}) "
+            f"WHERE group_key = {key} AND {condition} AND ({row}.{value} <= min_value OR {row}.{value} >= max_value); "
+            f"DELETE FROM {table} WHERE group_key = {key} AND row_count <= 0;"
+        )
+
+    return {
+        table: (
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            f"group_key TEXT PRIMARY KEY, row_count INTEGER NOT NULL, total REAL NOT NULL, "
+            f"min_value REAL, max_value REAL)"
+        ),
+        f'{table}_ai': f"CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {source} BEGIN {add('new')} END",
+        f'{table}_ad': f"CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {source} BEGIN {remove('old')} END",
+        f'{table}_au': (
+            f"CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE OF {', '.join(rollup.columns)} ON {source} "
+            f"BEGIN {remove('old')} {add('new')} END"
+        ),
+    }
+
+
+def _aggregate_sql(rollup: Rollup) -> str:
+    """원본 테이블 전체 GROUP BY 집계 (재구축/검증용)"""
+    key = rollup.key.format(row=rollup.source)
+    value = rollup.value
+    return (
+        f"SELECT {key} AS group_key, COUNT(*) AS row_count, SUM({value}) AS total, "
+        f"MIN({value}) AS min_value, MAX({value}) AS max_value "
+        f"FROM {rollup.source} WHERE {rollup.condition.format(row=rollup.source)} GROUP BY {key}"
+    )
+
+
+_ensured: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()  # 엔진 → 확인 완료
+_ensure_lock = threading.Lock()
+
+
+def ensure_rollups(session) -> None:
+    """집계 테이블과 트리거 확인 및 생성 (엔진당 1회)
+
+    새로 만들었거나 트리거가 빠져 있던 집계(원본 테이블 재생성 마이그레이션 등)와
+    정의가 바뀐 집계(이전 버전의 그룹 키 식 등)는 다시 만들고 원본에서 재구축
+    """
+    engine = session.get_bind()
+    if engine in _ensured:
+        return
+
+    with _ensure_lock:
+        if engine in _ensured:
+            return
+
+        stale = []
+        for rollup in ROLLUPS:
+            ddl = _ddl(rollup)
+            existing = dict(
+                session.execute(
+                    text("SELECT name, sql FROM sqlite_master WHERE name IN :names").bindparams(
+                        bindparam('names', expanding=True)
+                    ),
+                    {'names': list(ddl)}
+                ).fetchall()
+            )
+            # sqlite_master에는 IF NOT EXISTS를 뺀 CREATE 문이 저장됨
+            expected = {name: sql.replace(' IF NOT EXISTS', '', 1) for name, sql in ddl.items()}
+            if existing != expected:
+                for name in existing:
+                    kind = 'TABLE' if name == rollup.name else 'TRIGGER'
+                    session.execute(text(f"DROP {kind} IF EXISTS {name}"))
+                for sql in ddl.values():
+                    session.execute(text(sql))
+                stale.append(rollup.name)
+        session.commit()
+
+        if stale:
+            _rebuild(session, stale)
+        _ensured[engine] = True
+
+
+def rebuild_rollups(session, names: List[str] = None) -> Dict[str, int]:
+    """집계 테이블을 원본 테이블 전체 집계로 다시 채움 (집계 테이블명 → 그룹 수) - 어긋난 집계 복구용"""
+    ensure_rollups(session)
+    return _rebuild(session, names)
+
+
+def _rebuild(session, names: List[str] = None) -> Dict[str, int]:
+    result = {}
+    for rollup in ROLLUPS:
+        if names is not None and rollup.name not in names:
+            continue
+        session.execute(text(f"DELETE FROM {rollup.name}"))
+        session.execute(text(
+            f"INSERT INTO {rollup.name} (group_key, row_count, total, min_value, max_value) "
+            f"SELECT * FROM ({_aggregate_sql(rollup)})"
+        ))
+        result[rollup.name] = session.execute(text(f"SELECT COUNT(*) FROM {rollup.name}")).scalar()
+    session.commit()
+    for source in {rollup.source for rollup in ROLLUPS if rollup.name in result}:
+        get_data_generations().bump(source)  # 이전 집계로 렌더링된 응답 캐시 무효화
+    logger.info(f"집계 테이블 재구축: {result}")
+    return result
+
+
+def _public_row(rollup: Rollup, row) -> Dict[str, Any]:
+    """조회용 행 - NULL 그룹 키는 None, 정수 컬럼 집계는 정수 (원본 GROUP BY 결과와 같은 형태)"""
+    row = dict(row)
+    if row['group_key'] == NULL_GROUP_KEY:
+        row['group_key'] = None
+    if rollup.integer:
+        for field in ('total', 'min_value', 'max_value'):
+            if row[field] is not None:
+                row[field] = int(row[field])
+    return row
+
+
+def _group_order(key: Any) -> tuple:
+    """NULL 그룹을 앞에 두는 정렬 기준"""
+    return (key is not None, key or '')
+
+
+def _close(stored: Any, actual: Any, tolerance: float) -> bool:
+    """REAL 합계의 누적 오차를 허용한 비교"""
+    if stored is None or actual is None:
+        return stored is actual
+    return abs(stored - actual) <= tolerance * max(1.0, abs(actual))
+
+
+def check_rollups(session, tolerance: float = 1e-6) -> Dict[str, List[Dict[str, Any]]]:
+    """집계 테이블과 원본 전체 집계를 비교해 어긋난 그룹 목록 반환 (집계 테이블명 → 차이)"""
+    ensure_rollups(session)
+    drift = {}
+    for rollup in ROLLUPS:
+        stored = {row['group_key']: row for row in (
+            _public_row(rollup, row) for row in session.execute(text(f"SELECT * FROM {rollup.name}")).mappings()
+        )}
+        actual = {row['group_key']: row for row in (
+            _public_row(rollup, row) for row in session.execute(text(_aggregate_sql(rollup))).mappings()
+        )}
+        differences = []
+        for key in sorted(set(stored) | set(actual), key=_group_order):
+            a, b = stored.get(key), actual.get(key)
+            same = a is not None and b is not None and a['row_count'] == b['row_count'] and all(
+                _close(a[field], b[field], tolerance) for field in ('total', 'min_value', 'max_value')
+            )
+            if not same:
+                differences.append({'group_key': key, 'stored': a, 'actual': b})
+        drift[rollup.name] = differences
+    return drift
+
+
+def read_rollup(session, name: str) -> List[Dict[str, Any]]:
+    """집계 테이블 조회 (NULL 그룹(None) 다음 group_key 순 - group_key/row_count/total/min_value/max_value)"""
+    rollup = ROLLUPS_BY_NAME[name]  # 알 수 없는 집계는 KeyError
+    ensure_rollups(session)
+    rows = session.execute(text(f"SELECT * FROM {rollup.name} ORDER BY group_key = X'' DESC, group_key")).mappings()
+    return [_public_row(rollup, row) for row in rows]
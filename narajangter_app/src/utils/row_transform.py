@@ -0,0 +1,163 @@
+"""
+수집 행 변환 모듈
+API 응답 항목(camelCase) → DB 행(snake_case) 매핑을 필드 표로 정의하고,
+표를 한 번만 컴파일한 변환 함수로 모든 수집 경로에서 공유
+"""
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+STR = 'str'
+DATETIME = 'datetime'
+INT = 'int'
+FLOAT = 'float'
+
+
+class Field(NamedTuple):
+    """DB 컬럼 ← API 필드 매핑 (sources는 앞에서부터 값이 있는 필드 사용)"""
+    column: str
+    sources: Tuple[str, ...]
+    kind: str = STR
+    max_length: Optional[int] = None
+    default: Optional[str] = None
+
+
+BID_NOTICE_FIELDS = (
+    Field('bid_notice_no', ('bidNtceNo',)),
+    Field('bid_notice_nm', ('bidNtceNm',), max_length=500, default=''),
+    Field('bid_notice_ord', ('bidNtceOrd',), default='00'),
+    Field('dminstt_nm', ('dminsttNm',), max_length=200, default=''),
+    Field('rgst_dt', ('rgstDt',), DATETIME),
+    Field('bid_begin_dt', ('bidBeginDt',), DATETIME),
+    Field('bid_close_dt', ('bidClseDt',), DATETIME),
+    Field('openg_dt', ('opengDt',), DATETIME),
+    Field('presmpt_price', ('presmptPrce',), INT),
+    Field('basic_amount', ('asignBdgtAmt',), INT),
+    Field('bid_method_nm', ('bidMethdNm',), max_length=100, default=''),
+    Field('cntrct_cncls_mthd_nm', ('cntrctCnclsMthdNm',), max_length=100, default=''),
+    Field('work_div_nm', ('taskClsfcNm',), max_length=50, default=''),
+)
+
+SUCCESSFUL_BID_FIELDS = (
+    Field('bid_notice_no', ('bidNtceNo',)),
+    Field('bid_notice_ord', ('bidNtceOrd',), default='00'),
+    Field('openg_dt', ('opengDt',), DATETIME),
+    Field('scsbid_corp_nm', ('scsbidCorpNm', 'scsbidCpnyNm'), max_length=200, default=''),
+    Field('scsbid_amount', ('scsbidAmt',), INT),
+    Field('presmpt_price', ('presmptPrce',), INT),
+    Field('scsbid_rate', ('scsbidRate',), FLOAT),
+    Field('work_div_nm', ('taskClsfcNm',), max_length=50, default=''),
+)
+
+
+def parse_compact_datetime(value: Any) -> Optional[datetime]:
+    """YYYYMMDDHHMM / YYYYMMDD (또는 YYYY-MM-DD HH:MM[:SS]) 문자열을 자릿수 슬라이싱으로 파싱
+
+    strptime 대신 고정 위치 슬라이싱을 사용하고, 형식이 맞지 않거나 존재하지 않는 날짜는 None
+    """
+    if not value:
+        return None
+    value = str(value).strip()
+    length = len(value)
+    try:
+        if length == 12 and value.isdecimal():
+            return datetime(int(value[:4]), int(value[4:6]), int(value[6:8]), int(value[8:10]), int(value[10:12]))
+        if length == 8 and value.isdecimal():
+            return datetime(int(value[:4]), int(value[4:6]), int(value[6:8]))
+        if length in (16, 19) and value[4] == '-' and value[7] == '-' and value[13] == ':':
+            second = int(value[17:19]) if length == 19 else 0
+            return datetime(
+                int(value[:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), second
+            )
+    except ValueError:
+        pass
+    return None
+
+
+def parse_int(value: Any) -> Optional[int]:
+    """정수 파싱 - 숫자만 있는 문자열은 문자 검사로 바로 변환하고, 나머지는 기존 int() 변환과 같은 결과
+    ('1000.0'/'1000.5'처럼 소수점이 있거나 숫자가 아니면 None)
+    """
+    if value is None or type(value) is int:
+        return value
+    if type(value) is str and value.isdecimal():
+        return int(value)
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def parse_float(value: Any) -> Optional[float]:
+    """실수 파싱 - 기존 float() 변환과 같은 결과 (빈 값이나 숫자가 아니면 None)"""
+    if value is None or type(value) is float:
+        return value
+    if value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RowTransformer:
+    """필드 표를 컴파일한 행 변환기
+
+    필드마다 분기하지 않도록 표에서 변환 함수 소스를 만들어 한 번 컴파일하고,
+    반복되는 일시 문자열은 memo_size 크기의 memo로 재사용
+    """
+
+    DEFAULT_MEMO_SIZE = 16384  # 일시 memo 최대 항목 수 (가득 차면 비움)
+
+    def __init__(self, fields: Iterable[Field], required: str = 'bidNtceNo', memo_size: int = DEFAULT_MEMO_SIZE):
+        self.fields = tuple(fields)
+        self.required = required
+        self.memo_size = memo_size
+        self.columns = [field.column for field in self.fields] + ['created_at']
+        self._memo: Dict[str, Optional[datetime]] = {}
+        self._transform = self._compile()
+
+    def _compile(self) -> Callable[[Dict[str, Any], datetime], Dict[str, Any]]:
+        converters = {DATETIME: 'parse_datetime', INT: 'parse_int', FLOAT: 'parse_float'}
+        lines = ['def transform(item, created_at):', '    get = item.get', '    return {']
+        for field in self.fields:
+            value = ' or '.join(f'get({source!r})' for source in field.sources)
+            if field.kind in converters:
+                expr = f'{converters[field.kind]}({value})'
+            else:
+                if field.default is not None:
+                    value = f'({value} or {field.default!r})'
+                expr = f'{value}[:{field.max_length}]' if field.max_length else value
+            lines.append(f'        {field.column!r}: {expr},')
+        lines += ["        'created_at': created_at,", '    }']
+
+        namespace = {'parse_datetime': self.parse_datetime, 'parse_int': parse_int, 'parse_float': parse_float}
+        exec(compile('\n'.join(lines), f'<RowTransformer {self.columns[0]}>', 'exec'), namespace)
+        return namespace['transform']
+
+    def parse_datetime(self, value: Any) -> Optional[datetime]:
+        """memo를 거친 parse_compact_datetime"""
+        if not value:
+            return None
+        memo = self._memo
+        parsed = memo.get(value, memo)
+        if parsed is memo:
+            if len(memo) >= self.memo_size:
+                memo.clear()
+            parsed = memo[value] = parse_compact_datetime(value)
+        return parsed
+
+    def transform(self, item: Dict[str, Any], created_at: Optional[datetime] = None) -> Dict[str, Any]:
+        """API 응답 항목 1건을 DB 행으로 변환"""
+        return self._transform(item, created_at or datetime.utcnow())
+
+    def transform_many(self, items: Iterable[Dict[str, Any]], created_at: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """필수 필드가 있는 항목만 변환 (created_at은 배치 전체 공통)"""
+        transform = self._transform
+        created_at = created_at or datetime.utcnow()
+        required = self.required
+        return [transform(item, created_at) for item in items if item.get(required)]
+
+
+BID_NOTICE_TRANSFORMER = RowTransformer(BID_NOTICE_FIELDS)
+SUCCESSFUL_BID_TRANSFORMER = RowTransformer(SUCCESSFUL_BID_FIELDS)
@@ -0,0 +1,244 @@
+"""
+공유 캐시 모듈
+여러 Flask 워커가 조회 응답/건수 캐시와 데이터 세대를 공유하도록 Redis(또는 테스트용 메모리) 백엔드에
+네임스페이스 키로 저장 - 키에 데이터 세대가 들어가 동기화 후 이전 세대 값은 TTL로 자연 만료
+"""
+import time
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from . import json_codec
+from .generations import DataGenerations, configure_data_generations, unknown_generation
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis 미설치 환경
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryBackend:
+    """프로세스 내 메모리 백엔드 (테스트/단일 워커용 Redis 대체)"""
+
+    name = 'memory'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+    def _live(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return entry[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._live(key)
+
+    def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        with self._lock:
+            return [self._live(key) for key in keys]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl if ttl else None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = int(self._live(key) or 0) + 1
+            self._data[key] = (str(value).encode(), None)
+            return value
+
+
+class RedisBackend:
+    """Redis 백엔드 (redis 패키지 필요)"""
+
+    name = 'redis'
+
+    def __init__(self, url: str, socket_timeout: float = 0.5):
+        if redis is None:
+            raise RuntimeError("redis 패키지가 설치되지 않았습니다 (pip install redis)")
+        self.client = redis.Redis.from_url(url, socket_timeout=socket_timeout, socket_connect_timeout=socket_timeout)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return self.client.mget(keys)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self.client.set(key, value, ex=int(ttl) if ttl else None)
+
+    def incr(self, key: str) -> int:
+        return self.client.incr(key)
+
+
+class SharedGenerations(DataGenerations):
+    """백엔드에 저장하는 테이블별 데이터 세대 (모든 워커가 같은 값을 봄)
+
+    백엔드 오류 시에는 매번 새 음수 세대(unknown_generation)를 반환해 장애 동안 캐시를 쓰지 않음
+    (프로세스 내 세대는 다른 워커의 세대와 맞지 않아 이전 항목을 최신으로 오인할 수 있음).
+    장애 중 올리지 못한 세대는 백엔드가 복구되면 다시 올려 다른 워커의 캐시도 무효화
+    """
+
+    def __init__(self, backend, namespace: str):
+        super().__init__()
+        self.backend = backend
+        self.namespace = namespace
+        self._pending: Set[str] = set()  # 장애로 올리지 못한 테이블
+        self._tables: Set[str] = set()   # 조회/증가한 테이블 (stats용)
+
+    def _key(self, table: str) -> str:
+        return f'{self.namespace}:generation:{table}'
+
+    def get(self, table: str) -> int:
+        return self.snapshot((table,))[0]
+
+    def snapshot(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        tables = tuple(tables)
+        if not tables:
+            return ()
+        self._tables.update(tables)
+        try:
+            self._flush_pending()
+            return tuple(int(value or 0) for value in self.backend.mget([self._key(table) for table in tables]))
+        except Exception as e:
+            logger.warning(f"공유 데이터 세대 조회 실패 - 캐시 미사용: {e}")
+            return tuple(unknown_generation() for _ in tables)
+
+    def bump(self, table: str) -> int:
+        self._tables.add(table)
+        try:
+            self._flush_pending()
+            return self.backend.incr(self._key(table))
+        except Exception as e:
+            with self._lock:
+                self._pending.add(table)
+            logger.warning(f"공유 데이터 세대 증가 실패 - 복구 후 반영: {e}")
+            return unknown_generation()
+
+    def _flush_pending(self) -> None:
+        """장애 중 올리지 못한 세대 반영 (실패하면 예외 - 남은 테이블은 다음 호출에서 다시 시도)"""
+        if not self._pending:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, set()
+        try:
+            while pending:
+                table = next(iter(pending))
+                self.backend.incr(self._key(table))
+                pending.discard(table)
+        finally:
+            if pending:
+                with self._lock:
+                    self._pending |= pending
+
+    def stats(self) -> Dict[str, int]:
+        tables = tuple(sorted(self._tables))
+        return dict(zip(tables, self.snapshot(tables)))
+
+
+class SharedCache:
+    """네임스페이스 키/값 캐시 - 키는 '{namespace}:{종류}:{세대}:{요청 해시}'"""
+
+    DEFAULT_NAMESPACE = 'narajangter'
+    DEFAULT_TTL = 300  # 기본 보관 시간 (초)
+
+    def __init__(self, backend, namespace: str = DEFAULT_NAMESPACE, ttl: float = DEFAULT_TTL):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self.generations = SharedGenerations(backend, namespace)
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def key(self, kind: str, generation: Tuple[int, ...], parts: Any) -> str:
+        digest = hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=16).hexdigest()
+        return f"{self.namespace}:{kind}:{'.'.join(map(str, generation))}:{digest}"
+
+    def get(self, kind: str, generation: Tuple[int, ...], parts: Any) -> Optional[bytes]:
+        """저장된 값 (없거나 백엔드 오류면 None)"""
+        try:
+            value = self.backend.get(self.key(kind, generation, parts))
+        except Exception as e:
+            self._record('errors')
+            logger.warning(f"공유 캐시 조회 실패: {e}")
+            return None
+        self._record('hits' if value is not None else 'misses')
+        return value
+
+    def set(self, kind: str, generation: Tuple[int, ...], parts: Any, value: bytes, ttl: Optional[float] = None) -> None:
+        try:
+            self.backend.set(self.key(kind, generation, parts), value, ttl or self.ttl)
+        except Exception as e:
+            self._record('errors')
+            logger.warning(f"공유 캐시 저장 실패: {e}")
+
+    def get_json(self, kind: str, generation: Tuple[int, ...], parts: Any) -> Any:
+        value = self.get(kind, generation, parts)
+        return json_codec.loads(value) if value is not None else None
+
+    def set_json(self, kind: str, generation: Tuple[int, ...], parts: Any, value: Any, ttl: Optional[float] = None) -> None:
+        self.set(kind, generation, parts, json_codec.dumps(value), ttl)
+
+    def _record(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': self.backend.name,
+                'namespace': self.namespace,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'errors': self.errors
+            }
+
+
+_cache: Optional[SharedCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """프로세스 공유 캐시 계층 조회 (configure_shared_cache로 켜지 않았으면 None)"""
+    return _cache
+
+
+def configure_shared_cache(
+    url: Optional[str] = None,
+    backend=None,
+    enabled: bool = True,
+    **kwargs
+) -> Optional[SharedCache]:
+    """공유 캐시 계층 설정 - url(redis://...) 또는 backend를 지정, 둘 다 없으면 미사용
+
+    공유 캐시를 켜면 데이터 세대도 백엔드에 저장해 모든 워커가 같은 세대로 캐시를 무효화함.
+    Redis에 연결할 수 없거나 redis 패키지가 없으면 경고 후 프로세스 내 캐시만 사용
+    """
+    global _cache
+    with _cache_lock:
+        _cache = None
+        if enabled and backend is None and url:
+            try:
+                backend = RedisBackend(url)
+                backend.client.ping()
+            except Exception as e:
+                logger.warning(f"공유 캐시(Redis)를 사용할 수 없어 프로세스 내 캐시만 사용합니다: {e}")
+                backend = None
+        if enabled and backend is not None:
+            _cache = SharedCache(backend, **kwargs)
+            logger.info(f"공유 캐시 사용: {backend.name} ({_cache.namespace})")
+        configure_data_generations(_cache.generations if _cache is not None else None)
+    return _cache
@@ -0,0 +1,268 @@
+"""
+컬럼형 스냅샷 모듈
+입찰공고/낙찰정보 테이블을 월별 파티션(Hive 형식 month=YYYY-MM) Parquet/Arrow 파일로 내보내
+분석 도구가 필요한 컬럼과 월만 읽도록 함 - 테이블별 매니페스트에 파티션 서명(건수, 최대 id,
+컬럼 체크섬)을 기록해 다음 실행에서는 새로 생겼거나 내용이 바뀐 월만 다시 씀
+(pyarrow 필요 - 없으면 내보내기 시 RuntimeError)
+"""
+import os
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, MetaData, Numeric, Table, select, text
+
+from . import json_codec
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow 미설치 환경
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotTable(NamedTuple):
+    """스냅샷 대상 - 파티션 컬럼의 연-월로 파일을 나눔"""
+    table: str
+    partition_column: str
+
+
+SNAPSHOT_TABLES = {
+    'bid_notices': SnapshotTable('bid_notices', 'rgst_dt'),
+    'successful_bids': SnapshotTable('successful_bids', 'openg_dt'),
+}
+
+# 형식 → 파티션 파일명
+SNAPSHOT_FORMATS = {
+    'parquet': 'data.parquet',
+    'arrow': 'data.arrow',
+}
+
+NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'  # 파티션 컬럼이 NULL인 행 (pyarrow/Spark의 Hive 기본값)
+MANIFEST_FILE = '_manifest.json'
+DEFAULT_BATCH_SIZE = 10000  # 레코드 배치당 행 수 (DB fetch 단위와 같음)
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise RuntimeError("pyarrow 패키지가 설치되지 않았습니다 (pip install pyarrow)")
+
+
+def reflect_table(session, name: str) -> Table:
+    """DB 스키마에서 테이블 정의 조회 (선언된 컬럼 타입으로 Arrow 스키마를 만들기 위함)"""
+    return Table(name, MetaData(), autoload_with=session.connection())
+
+
+def arrow_type_name(column) -> str:
+    """SQL 컬럼 타입 → Arrow 타입 이름 (매니페스트 기록/스키마 변경 감지용)"""
+    column_type = column.type
+    if isinstance(column_type, Boolean):
+        return 'bool'
+    if isinstance(column_type, Integer):
+        return 'int64'
+    if isinstance(column_type, (Float, Numeric)):
+        return 'double'
+    if isinstance(column_type, DateTime):
+        return 'timestamp[us]'
+    if isinstance(column_type, Date):
+        return 'date32'
+    return 'string'
+
+
+def arrow_schema(table: Table):
+    _require_pyarrow()
+    types = {
+        'bool': pa.bool_(),
+        'int64': pa.int64(),
+        'double': pa.float64(),
+        'timestamp[us]': pa.timestamp('us'),
+        'date32': pa.date32(),
+        'string': pa.string(),
+    }
+    return pa.schema([
+        pa.field(column.name, types[arrow_type_name(column)], nullable=column.nullable)
+        for column in table.columns
+    ])
+
+
+def _checksum_expression(column) -> str:
+    """컬럼 값이 바뀌면 달라지는 월별 합계 식 (upsert로 기존 행이 갱신된 월 감지용)"""
+    name = column.name
+    type_name = arrow_type_name(column)
+    if type_name in ('bool', 'int64', 'double'):
+        return f'total({name})'
+    if type_name in ('timestamp[us]', 'date32'):
+        return f'total(julianday({name}))'
+    return f'total(length({name}) + unicode({name}) + unicode(substr({name}, -1)))'
+
+
+def partition_signatures(session, table: Table, partition_column: str) -> Dict[str, Dict[str, Any]]:
+    """월별 파티션 서명 {month: {'rows', 'max_id', 'checksum'}} - 원본 테이블 한 번 스캔
+    
+    월은 저장된 일시 문자열의 앞 7자리 (파티션 파일을 채우는 문자열 범위 조건과 같은 기준)
+    """
+    checksums = ', '.join(_checksum_expression(column) for column in table.columns)
+    result = session.execute(text(f"""
+        SELECT substr({partition_column}, 1, 7) AS month, COUNT(*), MAX(id), {checksums}
+        FROM {table.name}
+        GROUP BY month
+    """))
+    return {
+        month or NULL_PARTITION: {'rows': rows, 'max_id': max_id, 'checksum': list(checksum)}
+        for month, rows, max_id, *checksum in result
+    }
+
+
+def _partition_filter(partition_column: str, month: str):
+    """한 달치 행 조건 - 저장된 일시 문자열 범위 비교로 파티션 컬럼 인덱스 사용"""
+    if month == NULL_PARTITION:
+        return text(f'{partition_column} IS NULL')
+    year, number = (int(part) for part in month.split('-'))
+    end = f'{year + 1:04d}-01' if number == 12 else f'{year:04d}-{number + 1:02d}'
+    return text(f'{partition_column} >= :start AND {partition_column} < :end').bindparams(start=month, end=end)
+
+
+def _record_batches(session, table: Table, partition_column: str, month: str, schema, batch_size: int) -> Iterator[Any]:
+    statement = select(*table.columns).where(_partition_filter(partition_column, month)).order_by(table.c.id)
+    result = session.execute(statement.execution_options(yield_per=batch_size))
+    for rows in result.partitions(batch_size):
+        columns = list(zip(*rows))
+        yield pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+            schema=schema
+        )
+
+
+def _write_partition(path: str, snapshot_format: str, schema, batches: Iterable[Any]) -> int:
+    """파티션 파일을 임시 파일에 쓴 뒤 교체 (쓰는 중인 파일을 분석 도구가 읽지 않도록)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = path + '.tmp'
+    rows = 0
+    if snapshot_format == 'parquet':
+        with pq.ParquetWriter(temporary, schema, compression='zstd') as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    else:
+        with pa.OSFile(temporary, 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    os.replace(temporary, path)
+    return rows
+
+
+def read_manifest(output_dir: str, table: str) -> Optional[Dict[str, Any]]:
+    path = os.path.join(output_dir, table, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return json_codec.loads(f.read())
+
+
+def _write_manifest(output_dir: str, table: str, manifest: Dict[str, Any]) -> None:
+    path = os.path.join(output_dir, table, MANIFEST_FILE)
+    with open(path + '.tmp', 'wb') as f:
+        f.write(json_codec.dumps(manifest))
+    os.replace(path + '.tmp', path)
+
+
+def partition_path(output_dir: str, table: str, month: str, snapshot_format: str) -> str:
+    return os.path.join(output_dir, table, f'month={month}', SNAPSHOT_FORMATS[snapshot_format])
+
+
+def export_snapshot(
+    session,
+    output_dir: str,
+    table: str,
+    snapshot_format: str = 'parquet',
+    full: bool = False,
+    months: Optional[Sequence[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Dict[str, Any]:
+    """테이블 하나를 월별 파티션 파일로 내보내기
+
+    기본은 증분 - 매니페스트의 서명과 달라진 월(새 월 포함)만 다시 쓰고, 행이 모두 사라진 월은 삭제.
+    full=True거나 형식/스키마가 바뀌었으면 전체 월을 다시 씀. months를 지정하면 해당 월만 강제로 다시 씀
+    """
+    _require_pyarrow()
+    if table not in SNAPSHOT_TABLES:
+        raise ValueError(f"스냅샷 대상이 아닌 테이블입니다: {table}")
+    if snapshot_format not in SNAPSHOT_FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {snapshot_format} ({', '.join(SNAPSHOT_FORMATS)})")
+
+    partition_column = SNAPSHOT_TABLES[table].partition_column
+    source = reflect_table(session, table)
+    schema = arrow_schema(source)
+    columns = [[column.name, arrow_type_name(column)] for column in source.columns]
+
+    previous = read_manifest(output_dir, table)
+    if previous is None or previous.get('format') != snapshot_format or previous.get('columns') != columns:
+        full = True
+    partitions = {} if full else dict(previous['partitions'])
+
+    signatures = partition_signatures(session, source, partition_column)
+    forced = set(months or ())
+    written, removed = [], []
+
+    for month in sorted(signatures):
+        signature = signatures[month]
+        stored = partitions.get(month)
+        if stored is not None and month not in forced and all(stored[k] == v for k, v in signature.items()):
+            continue
+        path = partition_path(output_dir, table, month, snapshot_format)
+        rows = _write_partition(
+            path, snapshot_format, schema,
+            _record_batches(session, source, partition_column, month, schema, batch_size)
+        )
+        if rows != signature['rows']:
+            logger.warning(f"{table} {month} 파티션: 일시 형식이 다른 행이 있어 {signature['rows']}건 중 {rows}건만 기록")
+        partitions[month] = dict(signature, bytes=os.path.getsize(path), written_at=datetime.now().isoformat())
+        written.append(month)
+
+    # 행이 모두 사라진 월과 형식이 바뀌어 쓰지 않게 된 이전 파일 정리
+    for month in sorted(previous['partitions'] if previous else ()):
+        if month in signatures and previous['format'] == snapshot_format:
+            continue
+        path = partition_path(output_dir, table, month, previous['format'])
+        if os.path.exists(path):
+            os.remove(path)
+        if month not in signatures:
+            partitions.pop(month, None)
+            removed.append(month)
+
+    manifest = {
+        'table': table,
+        'format': snapshot_format,
+        'partition_column': partition_column,
+        'columns': columns,
+        'rows': sum(partition['rows'] for partition in partitions.values()),
+        'partitions': partitions,
+        'updated_at': datetime.now().isoformat()
+    }
+    os.makedirs(os.path.join(output_dir, table), exist_ok=True)
+    _write_manifest(output_dir, table, manifest)
+    logger.info(f"📦 {table} 스냅샷: {len(written)}개 월 기록, {len(removed)}개 월 삭제, 전체 {manifest['rows']}건")
+
+    return {
+        'table': table,
+        'format': snapshot_format,
+        'written': written,
+        'removed': removed,
+        'unchanged': len(partitions) - len(written),
+        'rows': manifest['rows']
+    }
+
+
+def export_snapshots(
+    session,
+    output_dir: str,
+    tables: Optional[Sequence[str]] = None,
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """여러 테이블 스냅샷 내보내기 (tables 미지정 시 전체 대상)"""
+    return [export_snapshot(session, output_dir, table, **kwargs) for table in (tables or SNAPSHOT_TABLES)]
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+data.go.kr 대체 스텁 서버
+입찰공고/낙찰정보 API 형식의 페이지 응답을 합성 데이터 또는 녹화된 응답으로 제공
+(네트워크·호출 한도 없이 수집 처리량 측정 및 회귀 테스트용)
+
+사용 예:
+    python narajangter_app/src/utils/stub_server.py --port 8089 --total-count 31691 --latency 0.2
+"""
+import json
+import time
+import random
+import argparse
+import threading
+from datetime import datetime, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, List, Optional, Set
+from urllib.parse import urlparse, parse_qs
+from xml.etree import ElementTree as ET
+
+# 엔드포인트별 경로 이름과 조회 시작일시 파라미터
+ENDPOINTS = {
+    'bid_notice': ('getDataSetOpnStdBidPblancInfo', 'bidNtceBgnDt'),
+    'successful_bid': ('getDataSetOpnStdScsbidInfo', 'opengBgnDt'),
+}
+
+DEMAND_AGENCIES = ['조달청', '서울특별시', '한국전력공사', '국방부', '경기도']
+WORK_DIVISIONS = ['용역', '물품', '공사', '외자']
+
+
+def synthetic_bid_notice(index: int, begin: datetime) -> Dict[str, Any]:
+    """합성 입찰공고 항목 (조회 시작일시 + index분에 등록)"""
+    rgst_dt = begin + timedelta(minutes=index)
+    close_dt = rgst_dt + timedelta(days=10)
+    return {
+        'bidNtceNo': f"{begin:%Y%m%d}{index:04d}",
+        'bidNtceOrd': '00',
+        'bidNtceNm': f'테스트 공고 {index}',
+        'dminsttNm': DEMAND_AGENCIES[index % len(DEMAND_AGENCIES)],
+        'rgstDt': f"{rgst_dt:%Y%m%d%H%M}",
+        'bidBeginDt': f"{rgst_dt + timedelta(days=1):%Y%m%d%H%M}",
+        'bidClseDt': f"{close_dt:%Y%m%d%H%M}",
+        'opengDt': f"{close_dt + timedelta(hours=1):%Y%m%d%H%M}",
+        'presmptPrce': str(1000000 + index),
+        'asignBdgtAmt': str(1100000 + index),
+        'bidMethdNm': '전자입찰',
+        'cntrctCnclsMthdNm': '제한경쟁',
+        'taskClsfcNm': WORK_DIVISIONS[index % len(WORK_DIVISIONS)]
+    }
+
+
+def synthetic_successful_bid(index: int, begin: datetime) -> Dict[str, Any]:
+    """합성 낙찰정보 항목 (조회 시작일시 + index분에 개찰)"""
+    return {
+        'bidNtceNo': f"{begin:%Y%m%d}{index:04d}",
+        'bidNtceOrd': '00',
+        'opengDt': f"{begin + timedelta(minutes=index):%Y%m%d%H%M}",
+        'scsbidCorpNm': f'낙찰업체 {index}',
+        'scsbidAmt': str(900000 + index),
+        'presmptPrce': str(1000000 + index),
+        'scsbidRate': f"{80 + (index % 200) / 10:.3f}",
+        'taskClsfcNm': WORK_DIVISIONS[index % len(WORK_DIVISIONS)]
+    }
+
+
+SYNTHESIZERS = {
+    'bid_notice': synthetic_bid_notice,
+    'successful_bid': synthetic_successful_bid,
+}
+
+
+def load_fixture(path: str) -> List[Dict[str, Any]]:
+    """녹화된 응답(JSON) 또는 항목 목록 파일 로드"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return data
+    items = data.get('response', {}).get('body', {}).get('items', [])
+    if isinstance(items, dict):
+        items = items.get('item', [])
+    return items if isinstance(items, list) else [items]
+
+
+class StubConfig:
+    """스텁 서버 동작 설정 (실행 중 변경 가능)"""
+
+    def __init__(
+        self,
+        total_count: int = 1000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        result_code: str = '00',
+        fixtures: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        rejected_keys: Optional[Dict[str, str]] = None,
+        seed: Optional[int] = None
+    ):
+        self.total_count = total_count          # 합성 데이터 전체 건수 (조회 구간별)
+        self.latency = latency                  # 응답 지연 (초)
+        self.jitter = jitter                    # 추가 지연 최대값 (초, 균등분포)
+        self.error_rate = error_rate            # HTTP 500 응답 비율
+        self.result_code = result_code          # header.resultCode (00 이외는 API 오류 응답)
+        self.fixtures = fixtures or {}          # 엔드포인트별 녹화 항목 (있으면 합성 대신 사용)
+        self.rejected_keys = rejected_keys or {}  # 서비스키별 오류 resultCode (예: {'expired': '31'})
+        self.fail_pages: Set[int] = set()       # 항상 HTTP 500을 반환할 페이지
+        self.transient_failures: Dict[int, int] = {}  # 페이지별 남은 일시 실패 횟수
+        self.random = random.Random(seed)
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """data.go.kr 형식 응답 핸들러"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        stub: 'StubServer' = self.server.stub
+        config = stub.config
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        stub.record_request(parsed.path)
+
+        endpoint = next((name for name, (path, _) in ENDPOINTS.items() if parsed.path.endswith(path)), None)
+        if endpoint is None:
+            self._send(404, b'Not Found', 'text/plain')
+            return
+
+        page_no = int(query.get('pageNo', ['1'])[0])
+        num_rows = int(query.get('numOfRows', ['10'])[0])
+
+        delay = config.latency + (config.random.uniform(0, config.jitter) if config.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+        if self._should_fail(config, page_no):
+            self._send(500, b'Internal Server Error', 'text/plain')
+            return
+
+        service_key = (query.get('ServiceKey') or query.get('serviceKey') or [''])[0]
+        result_code = config.rejected_keys.get(service_key, config.result_code)
+        items, total_count = self._page_items(config, endpoint, query, page_no, num_rows) if result_code == '00' else ([], 0)
+        header = {
+            'resultCode': result_code,
+            'resultMsg': 'NORMAL SERVICE.' if result_code == '00' else 'SERVICE ERROR'
+        }
+        body = {'items': items, 'numOfRows': num_rows, 'pageNo': page_no, 'totalCount': total_count}
+
+        if query.get('type', [''])[0] == 'json':
+            payload = json.dumps({'response': {'header': header, 'body': body}}, ensure_ascii=False)
+            self._send(200, payload.encode('utf-8'), 'application/json;charset=UTF-8')
+        else:
+            self._send(200, self._to_xml(header, body), 'application/xml;charset=UTF-8')
+
+    def _should_fail(self, config: StubConfig, page_no: int) -> bool:
+        with self.server.stub.lock:
+            if page_no in config.fail_pages:
+                return True
+            if config.transient_failures.get(page_no, 0) > 0:
+                config.transient_failures[page_no] -= 1
+                return True
+            return config.error_rate > 0 and config.random.random() < config.error_rate
+
+    def _page_items(self, config: StubConfig, endpoint: str, query: Dict, page_no: int, num_rows: int):
+        start = (page_no - 1) * num_rows
+        fixture = config.fixtures.get(endpoint)
+        if fixture is not None:
+            return fixture[start:start + num_rows], len(fixture)
+
+        begin_param = ENDPOINTS[endpoint][1]
+        begin_value = query.get(begin_param, ['202501010000'])[0]
+        try:
+            begin = datetime.strptime(begin_value[:12].ljust(12, '0'), '%Y%m%d%H%M')
+        except ValueError:
+            begin = datetime(2025, 1, 1)
+
+        synthesize = SYNTHESIZERS[endpoint]
+        end = min(start + num_rows, config.total_count)
+        return [synthesize(i, begin) for i in range(start, end)], config.total_count
+
+    @staticmethod
+    def _to_xml(header: Dict[str, Any], body: Dict[str, Any]) -> bytes:
+        root = ET.Element('response')
+        header_el = ET.SubElement(root, 'header')
+        for key, value in header.items():
+            ET.SubElement(header_el, key).text = str(value)
+        body_el = ET.SubElement(root, 'body')
+        items_el = ET.SubElement(body_el, 'items')
+        for item in body['items']:
+            item_el = ET.SubElement(items_el, 'item')
+            for key, value in item.items():
+                ET.SubElement(item_el, key).text = '' if value is None else str(value)
+        for key in ('numOfRows', 'pageNo', 'totalCount'):
+            ET.SubElement(body_el, key).text = str(body[key])
+        return ET.tostring(root, encoding='utf-8', xml_declaration=True)
+
+    def _send(self, status: int, payload: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # 동시 연결 시 backlog 초과로 인한 SYN 재전송 방지
+
+
+class StubServer:
+    """백그라운드 스레드에서 실행되는 스텁 서버"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, config: Optional[StubConfig] = None, **kwargs):
+        self.config = config or StubConfig(**kwargs)
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.requests_by_path: Dict[str, int] = {}
+        self._server = _HTTPServer((host, port), StubRequestHandler)
+        self._server.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/1230000/ao/PubDataOpnStdService'
+
+    def url(self, endpoint: str = 'bid_notice') -> str:
+        """엔드포인트 URL (bid_notice / successful_bid)"""
+        return f'{self.base_url}/{ENDPOINTS[endpoint][0]}'
+
+    def record_request(self, path: str) -> None:
+        with self.lock:
+            self.request_count += 1
+            self.requests_by_path[path] = self.requests_by_path.get(path, 0) + 1
+
+    def start(self) -> 'StubServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, name='stub-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='data.go.kr 나라장터 API 스텁 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--total-count', type=int, default=1000, help='조회 구간별 합성 데이터 건수')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='추가 무작위 지연 최대값 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='HTTP 500 응답 비율 (0~1)')
+    parser.add_argument('--result-code', default='00', help='응답 resultCode')
+    parser.add_argument('--seed', type=int, help='지연/오류 난수 시드')
+    parser.add_argument(
+        '--fixture', action='append', default=[], metavar='ENDPOINT=PATH',
+        help='녹화 응답 파일 (예: bid_notice=bids.json, 반복 지정 가능)'
+    )
+    args = parser.parse_args(argv)
+
+    fixtures = {}
+    for spec in args.fixture:
+        endpoint, _, path = spec.partition('=')
+        if endpoint not in ENDPOINTS or not path:
+            parser.error(f'잘못된 fixture 지정: {spec}')
+        fixtures[endpoint] = load_fixture(path)
+
+    server = StubServer(
+        args.host, args.port,
+        total_count=args.total_count,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        result_code=args.result_code,
+        fixtures=fixtures,
+        seed=args.seed
+    )
+    print(f"스텁 서버 실행: {server.url('bid_notice')}")
+    print(f"               {server.url('successful_bid')}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
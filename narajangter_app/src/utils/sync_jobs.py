@@ -0,0 +1,126 @@
+"""
+동기화 작업 체크포인트 모듈
+작업 기록과 페이지 단위 완료 내역을 저장해 중단된 동기화를 누락 페이지부터 재개
+"""
+import json
+import logging
+from typing import List, Dict, Any, Optional, Set, Tuple
+from datetime import datetime
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = 'pending'
+STATUS_RUNNING = 'running'
+STATUS_COMPLETED = 'completed'
+STATUS_FAILED = 'failed'
+STATUS_CANCELLED = 'cancelled'
+
+
+def _now() -> str:
+    return datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S.%f')
+
+
+class SyncJobStore:
+    """sync_jobs / sync_job_pages 테이블 접근 클래스"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def create(self, endpoint: str, window_start: str, window_end: str, incremental: bool = False) -> int:
+        """작업 기록 생성 후 작업 ID 반환 (incremental: 재개해도 완료 시 기준점을 갱신하는 증분 작업)"""
+        result = self.db.session.execute(
+            text("""
+                INSERT INTO sync_jobs (
+                    endpoint, window_start, window_end, incremental, status, total_pages,
+                    completed_pages, fetched_count, inserted_count, created_at, updated_at
+                ) VALUES (
+                    :endpoint, :window_start, :window_end, :incremental, :status, 0, 0, 0, 0, :now, :now
+                )
+            """),
+            {
+                'endpoint': endpoint,
+                'window_start': window_start,
+                'window_end': window_end,
+                'incremental': incremental,
+                'status': STATUS_PENDING,
+                'now': _now()
+            }
+        )
+        self.db.session.commit()
+        return result.lastrowid
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """작업 기록 조회 (없으면 None)"""
+        row = self.db.session.execute(
+            text("""
+                SELECT id, endpoint, window_start, window_end, incremental, status, windows, total_pages,
+                       completed_pages, fetched_count, inserted_count, error
+                FROM sync_jobs WHERE id = :job_id
+            """),
+            {'job_id': job_id}
+        ).mappings().fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job['incremental'] = bool(job['incremental'])
+        job['windows'] = [tuple(w) if w else None for w in json.loads(job['windows'])] if job['windows'] else None
+        return job
+
+    def completed_pages(self, job_id: int) -> Dict[int, Set[int]]:
+        """구간별 완료 페이지 {구간 번호: 페이지 번호 집합}"""
+        rows = self.db.session.execute(
+            text("SELECT window_index, page_no FROM sync_job_pages WHERE job_id = :job_id"),
+            {'job_id': job_id}
+        ).fetchall()
+        completed: Dict[int, Set[int]] = {}
+        for window_index, page_no in rows:
+            completed.setdefault(window_index, set()).add(page_no)
+        return completed
+
+    def set_windows(self, job_id: int, windows: List[Optional[Tuple[int, int]]]) -> None:
+        """구간별 (전체 건수, 페이지 수) 저장 - 확인하지 못한 구간은 None"""
+        self.db.session.execute(
+            text("""
+                UPDATE sync_jobs SET windows = :windows, total_pages = :total_pages, updated_at = :now
+                WHERE id = :job_id
+            """),
+            {
+                'job_id': job_id,
+                'windows': json.dumps([list(w) if w else None for w in windows]),
+                'total_pages': sum(w[1] for w in windows if w),
+                'now': _now()
+            }
+        )
+        self.db.session.commit()
+
+    def checkpoint(self, job_id: int, pages: List[Tuple[int, int]], fetched: int, inserted: int) -> None:
+        """삽입까지 끝난 페이지 기록 및 누적 건수 갱신"""
+        if pages:
+            self.db.session.execute(
+                text("""
+                    INSERT OR IGNORE INTO sync_job_pages (job_id, window_index, page_no)
+                    VALUES (:job_id, :window_index, :page_no)
+                """),
+                [{'job_id': job_id, 'window_index': index, 'page_no': page_no} for index, page_no in pages]
+            )
+        self.db.session.execute(
+            text("""
+                UPDATE sync_jobs SET
+                    completed_pages = (SELECT COUNT(*) FROM sync_job_pages WHERE job_id = :job_id),
+                    fetched_count = fetched_count + :fetched,
+                    inserted_count = inserted_count + :inserted,
+                    updated_at = :now
+                WHERE id = :job_id
+            """),
+            {'job_id': job_id, 'fetched': fetched, 'inserted': inserted, 'now': _now()}
+        )
+        self.db.session.commit()
+
+    def set_status(self, job_id: int, status: str, error: Optional[str] = None) -> None:
+        self.db.session.execute(
+            text("UPDATE sync_jobs SET status = :status, error = :error, updated_at = :now WHERE id = :job_id"),
+            {'job_id': job_id, 'status': status, 'error': error, 'now': _now()}
+        )
+        self.db.session.commit()
+        logger.info(f"동기화 작업 {job_id}: {status}" + (f" ({error})" if error else ""))
@@ -0,0 +1,303 @@
+"""
+data.go.kr 응답 캐시 모듈
+엔드포인트 + 정규화된 요청 파라미터(서비스키 제외) 기준으로 성공 응답을 디스크(SQLite)에 저장해
+이미 조회한 구간을 다시 동기화할 때 호출 한도를 쓰지 않도록 함
+"""
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+from datetime import datetime, timedelta
+
+import requests
+
+from . import json_codec
+from .quota import KST
+
+logger = logging.getLogger(__name__)
+
+# 캐시 DB 위치 (UPSTREAM_CACHE_DB_PATH 환경변수로 변경)
+DEFAULT_DB_PATH = os.environ.get('UPSTREAM_CACHE_DB_PATH') or os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), 'database', 'upstream_cache.db'
+)
+
+# 캐시 키에서 제외할 파라미터 (대소문자 무시)
+EXCLUDED_PARAMS = {'servicekey'}
+
+_XML_SUCCESS = re.compile(rb'<resultCode>\s*00\s*</resultCode>')
+
+
+def normalize_params(params: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    """서비스키와 빈 값을 제외하고 키 순으로 정렬한 (이름, 값) 목록"""
+    return tuple(sorted(
+        (str(name), str(value).strip())
+        for name, value in params.items()
+        if value is not None and str(name).lower() not in EXCLUDED_PARAMS
+    ))
+
+
+def is_cacheable(content: bytes) -> bool:
+    """resultCode 00(정상) 응답인지 확인 - 오류 응답은 캐시하지 않음"""
+    if content.lstrip()[:1] == b'<':
+        return _XML_SUCCESS.search(content) is not None
+    try:
+        return json_codec.loads(content)['response']['header']['resultCode'] == '00'
+    except (ValueError, KeyError, TypeError):
+        return False
+
+
+def cached_response(url: str, content: bytes, content_type: Optional[str] = None) -> requests.Response:
+    """캐시된 본문으로 만든 Response 객체 (HTTPClient 응답과 같은 방식으로 사용)"""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = content
+    response.encoding = 'utf-8'
+    if content_type:
+        response.headers['Content-Type'] = content_type
+    response.headers['X-Upstream-Cache'] = 'HIT'
+    return response
+
+
+class UpstreamCache:
+    """크기 제한이 있는 디스크 응답 캐시 (조회 구간 종료일 기준 TTL)"""
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024   # 캐시 최대 크기
+    DEFAULT_RECENT_TTL = 600                # 최근 구간 응답 보관 시간 (초)
+    DEFAULT_SETTLE_DAYS = 2                 # 구간 종료 후 지연 등록을 기다리는 기간 - 지나면 변경 없는 구간으로 간주
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        recent_ttl: float = DEFAULT_RECENT_TTL,
+        settle_days: int = DEFAULT_SETTLE_DAYS
+    ):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.recent_ttl = recent_ttl
+        self.settle_days = settle_days
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self._memory_conn = sqlite3.connect(db_path, check_same_thread=False) if db_path == ':memory:' else None
+
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS upstream_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    content BLOB NOT NULL,
+                    content_type TEXT,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_upstream_cache_access ON upstream_cache (last_access)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if self._memory_conn is not None:
+            with self._lock, self._memory_conn:
+                yield self._memory_conn
+            return
+
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def cache_key(url: str, params: Dict[str, Any]) -> str:
+        """엔드포인트 + 정규화된 파라미터 해시"""
+        payload = json.dumps([url.rstrip('/'), normalize_params(params)], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def ttl_for(self, params: Dict[str, Any], now: Optional[datetime] = None) -> Optional[float]:
+        """응답 보관 시간 (초) - 종료일이 지나 확정된 구간이면 None(만료 없음)
+
+        조회 종료일시 파라미터(...EndDt)가 없으면 최근 구간과 같이 취급
+        """
+        window_end = self._window_end(params)
+        if window_end is None:
+            return self.recent_ttl
+        now = now or datetime.now(KST).replace(tzinfo=None)
+        if window_end + timedelta(days=self.settle_days) <= now:
+            return None
+        return self.recent_ttl
+
+    @staticmethod
+    def _window_end(params: Dict[str, Any]) -> Optional[datetime]:
+        for name, value in params.items():
+            if not str(name).endswith('EndDt') or not value:
+                continue
+            digits = str(value).strip()
+            try:
+                if len(digits) >= 12:
+                    return datetime.strptime(digits[:12], '%Y%m%d%H%M')
+                return datetime.strptime(digits[:8], '%Y%m%d') + timedelta(days=1)
+            except ValueError:
+                return None
+        return None
+
+    def get(self, url: str, params: Dict[str, Any]) -> Optional[Tuple[bytes, Optional[str]]]:
+        """캐시된 (본문, Content-Type) - 없거나 만료되면 None"""
+        key = self.cache_key(url, params)
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT content, content_type, expires_at FROM upstream_cache WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+            if row is not None and row[2] is not None and row[2] <= now:
+                conn.execute("DELETE FROM upstream_cache WHERE cache_key = ?", (key,))
+                row = None
+            if row is not None:
+                conn.execute("UPDATE upstream_cache SET last_access = ? WHERE cache_key = ?", (now, key))
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return (bytes(row[0]), row[1]) if row is not None else None
+
+    def contains(self, url: str, params: Dict[str, Any]) -> bool:
+        """만료되지 않은 응답 존재 여부 (적중/실패 통계에 반영하지 않음)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM upstream_cache WHERE cache_key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (self.cache_key(url, params), time.time())
+            ).fetchone()
+        return row is not None
+
+    def contains_many(self, url: str, params_list: List[Dict[str, Any]]) -> List[bool]:
+        """여러 요청의 contains를 연결 하나로 조회 (요청 순서대로 결과 반환)"""
+        keys = [self.cache_key(url, params) for params in params_list]
+        found = set()
+        now = time.time()
+        with self._connect() as conn:
+            for i in range(0, len(keys), 500):  # SQLite 변수 개수 제한
+                chunk = keys[i:i + 500]
+                found.update(row[0] for row in conn.execute(
+                    f"""
+                    SELECT cache_key FROM upstream_cache
+                    WHERE cache_key IN ({', '.join('?' * len(chunk))}) AND (expires_at IS NULL OR expires_at > ?)
+                    """,
+                    (*chunk, now)
+                ))
+        return [key in found for key in keys]
+
+    def put(self, url: str, params: Dict[str, Any], content: bytes, content_type: Optional[str] = None) -> bool:
+        """정상 응답 저장 (오류 응답이나 최대 크기를 넘는 응답은 저장하지 않음)"""
+        if len(content) > self.max_bytes or not is_cacheable(content):
+            return False
+
+        now = time.time()
+        ttl = self.ttl_for(params)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO upstream_cache (
+                    cache_key, url, params, content, content_type, size, created_at, expires_at, last_access
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    self.cache_key(url, params),
+                    url,
+                    json.dumps(normalize_params(params), ensure_ascii=False),
+                    sqlite3.Binary(content),
+                    content_type,
+                    len(content),
+                    now,
+                    None if ttl is None else now + ttl,
+                    now
+                )
+            )
+            evicted = self._evict(conn, now)
+
+        with self._lock:
+            self.stores += 1
+            self.evictions += evicted
+        return True
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        """만료 항목 삭제 후 최대 크기를 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        evicted = conn.execute(
+            "DELETE FROM upstream_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        ).rowcount
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM upstream_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return evicted
+
+        excess = total - self.max_bytes
+        victims = []
+        for key, size in conn.execute("SELECT cache_key, size FROM upstream_cache ORDER BY last_access"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM upstream_cache WHERE cache_key = ?", victims)
+        logger.info(f"응답 캐시 {len(victims)}건 정리 (최대 {self.max_bytes} bytes)")
+        return evicted + len(victims)
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM upstream_cache")
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률 및 저장 현황"""
+        with self._connect() as conn:
+            entries, size, immutable = conn.execute(
+                """
+                SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(expires_at IS NULL), 0)
+                FROM upstream_cache
+                """
+            ).fetchone()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'entries': entries,
+                'immutable_entries': immutable,
+                'size_bytes': size,
+                'max_bytes': self.max_bytes
+            }
+
+
+_cache: Optional[UpstreamCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_upstream_cache() -> Optional[UpstreamCache]:
+    """프로세스 공유 응답 캐시 조회 (configure_upstream_cache로 켜지 않았으면 None)"""
+    return _cache
+
+
+def configure_upstream_cache(enabled: bool = True, **kwargs) -> Optional[UpstreamCache]:
+    """공유 응답 캐시 설정 변경 (enabled=False면 캐시 미사용)"""
+    global _cache
+    with _cache_lock:
+        _cache = UpstreamCache(**kwargs) if enabled else None
+    return _cache
@@ -0,0 +1,109 @@
+"""
+증분 동기화 기준점 관리 모듈
+엔드포인트별 마지막 등록일시와 마지막 성공 조회 구간을 저장하고 다음 조회 구간 계산
+"""
+import logging
+from typing import Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OVERLAP_MINUTES = 60   # 지연 등록분을 놓치지 않도록 이전 구간과 겹쳐 조회할 시간
+DEFAULT_INITIAL_DAYS = 30      # 기준점이 없을 때 조회할 기간
+
+
+def _parse_db_datetime(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+class WatermarkStore:
+    """sync_watermarks 테이블 접근 클래스"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def get(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """엔드포인트 기준점 조회 (없으면 None)"""
+        row = self.db.session.execute(
+            text("""
+                SELECT last_rgst_dt, window_start, window_end
+                FROM sync_watermarks WHERE endpoint = :endpoint
+            """),
+            {'endpoint': endpoint}
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            'endpoint': endpoint,
+            'last_rgst_dt': _parse_db_datetime(row[0]),
+            'window_start': row[1],
+            'window_end': row[2]
+        }
+
+    def advance(
+        self,
+        endpoint: str,
+        window_start: str,
+        window_end: str,
+        last_rgst_dt: Optional[datetime] = None
+    ) -> None:
+        """성공한 조회 구간으로 기준점 갱신 (등록일시와 구간은 뒤로 가지 않음 - 늦게 재개된 이전 작업 대비)"""
+        current = self.get(endpoint)
+        if current and current['last_rgst_dt'] and (last_rgst_dt is None or last_rgst_dt < current['last_rgst_dt']):
+            last_rgst_dt = current['last_rgst_dt']
+        if current and current['window_end'] and window_end < current['window_end']:
+            window_start, window_end = current['window_start'], current['window_end']
+
+        now = datetime.utcnow()
+        self.db.session.execute(
+            text("""
+                INSERT INTO sync_watermarks (endpoint, last_rgst_dt, window_start, window_end, updated_at)
+                VALUES (:endpoint, :last_rgst_dt, :window_start, :window_end, :updated_at)
+                ON CONFLICT(endpoint) DO UPDATE SET
+                    last_rgst_dt = excluded.last_rgst_dt,
+                    window_start = excluded.window_start,
+                    window_end = excluded.window_end,
+                    updated_at = excluded.updated_at
+            """),
+            {
+                'endpoint': endpoint,
+                'last_rgst_dt': last_rgst_dt.strftime('%Y-%m-%d %H:%M:%S.%f') if last_rgst_dt else None,
+                'window_start': window_start,
+                'window_end': window_end,
+                'updated_at': now.strftime('%Y-%m-%d %H:%M:%S.%f')
+            }
+        )
+        self.db.session.commit()
+        logger.info(f"기준점 갱신: {endpoint} {window_start} ~ {window_end} (등록일시 {last_rgst_dt})")
+
+
+def next_window(
+    watermark: Optional[Dict[str, Any]],
+    now: datetime,
+    overlap_minutes: int = DEFAULT_OVERLAP_MINUTES,
+    initial_days: int = DEFAULT_INITIAL_DAYS
+) -> Tuple[str, str]:
+    """다음 증분 조회 구간 (YYYYMMDDHHMM, YYYYMMDDHHMM)
+
+    마지막 성공 구간 종료 시각(없으면 마지막 등록일시)에서 overlap_minutes만큼
+    앞당겨 시작하고, 기준점이 없으면 최근 initial_days일을 조회
+    """
+    start = None
+    if watermark:
+        if watermark.get('window_end'):
+            start = datetime.strptime(watermark['window_end'], '%Y%m%d%H%M')
+        elif watermark.get('last_rgst_dt'):
+            start = watermark['last_rgst_dt']
+
+    if start is None:
+        start = (now - timedelta(days=initial_days)).replace(hour=0, minute=0)
+    else:
+        start = min(start, now) - timedelta(minutes=overlap_minutes)
+
+    return start.strftime('%Y%m%d%H%M'), now.strftime('%Y%m%d%H%M')
@@ -0,0 +1,100 @@
+"""
+XML 응답 디코더 모듈
+iterparse로 data.go.kr XML 응답을 항목 단위로 읽어 JSON 응답과 같은 구조의 dict로 변환
+(전체 트리를 만들지 않고 처리한 항목은 바로 해제)
+"""
+import io
+import logging
+from typing import Dict, Any, Iterator, List, Union, BinaryIO
+from xml.etree import ElementTree as ET
+
+from . import json_codec
+
+logger = logging.getLogger(__name__)
+
+# body 아래 숫자 필드 (JSON 응답에서는 정수)
+INT_FIELDS = {'numOfRows', 'pageNo', 'totalCount'}
+
+# 인증/호출 한도 오류 시 반환되는 OpenAPI 공통 오류 응답 필드 → header 필드
+ERROR_HEADER_FIELDS = {
+    'returnReasonCode': 'resultCode',
+    'returnAuthMsg': 'resultMsg',
+}
+
+
+def is_xml(content: bytes) -> bool:
+    return content.lstrip()[:1] == b'<'
+
+
+def _text(elem: ET.Element) -> str:
+    return (elem.text or '').strip()
+
+
+def _scalar(tag: str, value: str) -> Any:
+    if tag in INT_FIELDS and value.isdigit():
+        return int(value)
+    return value
+
+
+def iter_xml_items(source: Union[bytes, BinaryIO]) -> Iterator[Dict[str, str]]:
+    """<items><item>...</item></items>의 항목을 하나씩 dict로 반환"""
+    for kind, value in _iter_events(source):
+        if kind == 'item':
+            yield value
+
+
+def decode_xml(source: Union[bytes, BinaryIO]) -> Dict[str, Any]:
+    """XML 응답을 {'response': {'header': ..., 'body': ...}} 형태로 변환
+
+    항목은 JSON 응답과 같이 body['items'] 목록에 {태그: 텍스트} dict로 담기고,
+    OpenAPI 공통 오류 응답(OpenAPI_ServiceResponse)은 header resultCode/resultMsg로 변환.
+    XML 형식 오류는 ValueError
+    """
+    header: Dict[str, Any] = {}
+    body: Dict[str, Any] = {}
+    items: List[Dict[str, str]] = []
+    for kind, value in _iter_events(source):
+        if kind == 'item':
+            items.append(value)
+        elif kind == 'header':
+            header[value[0]] = value[1]
+        elif kind == 'body':
+            body[value[0]] = _scalar(*value)
+        elif kind == 'error' and value[0] in ERROR_HEADER_FIELDS:
+            header[ERROR_HEADER_FIELDS[value[0]]] = value[1]
+    if items or 'totalCount' in body:
+        body['items'] = items
+    return {'response': {'header': header, 'body': body}}
+
+
+def decode_response(content: bytes) -> Dict[str, Any]:
+    """응답 본문 파싱 (XML이면 decode_xml, 아니면 JSON) - 형식 오류는 ValueError"""
+    if is_xml(content):
+        return decode_xml(content)
+    return json_codec.loads(content)
+
+
+def _iter_events(source: Union[bytes, BinaryIO]) -> Iterator[tuple]:
+    """(종류, 값) 이벤트 - item: 항목 dict, header/body/error: (태그, 텍스트)"""
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    try:
+        # end 이벤트만 받아 하위 요소가 모두 읽힌 시점에 처리
+        for _, elem in ET.iterparse(source):
+            tag = elem.tag
+            if tag == 'item':
+                yield 'item', {child.tag: _text(child) for child in elem}
+                elem.clear()  # 처리한 항목의 필드 해제 - 전체 트리를 메모리에 유지하지 않음
+            elif tag == 'header':
+                for child in elem:
+                    yield 'header', (child.tag, _text(child))
+            elif tag == 'body':
+                for child in elem:
+                    if child.tag != 'items':
+                        yield 'body', (child.tag, _text(child))
+            elif tag == 'cmmMsgHeader':
+                for child in elem:
+                    yield 'error', (child.tag, _text(child))
+    except ET.ParseError as e:
+        raise ValueError(f"XML 파싱 실패: {e}")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+분석 집계 테이블 재구축 스크립트
+집계 테이블과 원본 전체 집계를 비교하고, 어긋난 경우(또는 --force) 원본에서 다시 채움
+"""
+import os
+import sys
+import argparse
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'narajangter_app', 'src'))
+
+from utils.rollups import check_rollups, rebuild_rollups
+
+# 데이터베이스 경로
+DB_PATH = os.path.join(os.path.dirname(__file__), 'narajangter_app', 'src', 'database', 'app.db')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='분석 집계 테이블 검증/재구축')
+    parser.add_argument('--db', default=DB_PATH, help='SQLite DB 경로')
+    parser.add_argument('--check', action='store_true', help='검증만 하고 재구축하지 않음')
+    parser.add_argument('--force', action='store_true', help='어긋난 그룹이 없어도 재구축')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"❌ DB 파일이 없습니다: {args.db}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("분석 집계 테이블 검증")
+    print("=" * 60)
+
+    with Session(create_engine(f'sqlite:///{args.db}')) as session:
+        drift = check_rollups(session)
+        for name, differences in drift.items():
+            status = '✅ 일치' if not differences else f'⚠️ {len(differences)}개 그룹 불일치'
+            print(f"📊 {name}: {status}")
+            for difference in differences[:5]:
+                print(f"   - {difference['group_key']!r}: 집계 {difference['stored']} / 원본 {difference['actual']}")
+
+        if args.check:
+            sys.exit(1 if any(drift.values()) else 0)
+
+        if args.force or any(drift.values()):
+            groups = rebuild_rollups(session)
+            print("\n🔧 재구축 완료: " + ', '.join(f"{name} {count}개 그룹" for name, count in groups.items()))
+        else:
+            print("\n재구축이 필요하지 않습니다. (--force로 강제 재구축)")
+
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
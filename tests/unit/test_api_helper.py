@@ -2,41 +2,62 @@ import unittest
 from unittest.mock import patch, MagicMock
 import sys
 import os
+import json
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
 
 from utils.api_helper import APIHelper
+from utils.resilience import RetryPolicy
 
 class TestAPIHelper(unittest.TestCase):
     def setUp(self):
         self.api_helper = APIHelper()
     
-    @patch('utils.api_helper.requests.get')
-    def test_call_api_success(self, mock_get):
+    @patch('utils.api_helper.get_http_client')
+    def test_call_api_success(self, mock_client):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.content = b'test content'
-        mock_get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
         
         result = self.api_helper.call_api('http://test.com', {'param': 'value'})
         
         self.assertIsNotNone(result)
         self.assertEqual(result.status_code, 200)
     
-    @patch('utils.api_helper.requests.get')
-    def test_call_api_server_error(self, mock_get):
+    @patch('utils.api_helper.get_http_client')
+    def test_call_api_server_error(self, mock_client):
         mock_response = MagicMock()
         mock_response.status_code = 500
-        mock_get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
         
         result = self.api_helper.call_api('http://test.com', {'param': 'value'}, retry=False)
         
         self.assertIsNotNone(result)
         self.assertEqual(result.status_code, 500)
     
+    @patch('utils.api_helper.time.sleep')
+    @patch('utils.api_helper.get_http_client')
+    def test_call_api_retries_server_error_with_backoff(self, mock_client, mock_sleep):
+        error_response = MagicMock()
+        error_response.status_code = 503
+        ok_response = MagicMock()
+        ok_response.status_code = 200
+        mock_client.return_value.get.side_effect = [error_response, ok_response]
+        
+        with patch.object(APIHelper, 'RETRY_POLICY', RetryPolicy(max_attempts=3, base_delay=2, jitter=False)):
+            result = self.api_helper.call_api('http://retry.test.com', {'param': 'value'})
+        
+        self.assertEqual(result.status_code, 200)
+        mock_sleep.assert_called_once_with(2)
+        # 두 번째 시도는 타임아웃을 늘려서 호출
+        first_timeout = mock_client.return_value.get.call_args_list[0].kwargs['timeout']
+        second_timeout = mock_client.return_value.get.call_args_list[1].kwargs['timeout']
+        self.assertGreater(second_timeout, first_timeout)
+    
     def test_parse_api_response_success(self):
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'response': {
                 'header': {
                     'resultCode': '00',
@@ -52,7 +73,7 @@ class TestAPIHelper(unittest.TestCase):
                     'totalCount': 1
                 }
             }
-        }
+        }).encode('utf-8')
         
         result = self.api_helper.parse_api_response(mock_response)
         
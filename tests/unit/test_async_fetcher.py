@@ -0,0 +1,190 @@
+import unittest
+import sys
+import os
+import time
+import threading
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils.async_fetcher import AsyncPageFetcher, extract_items
+from utils.http_client import get_http_client
+from utils.quota import QuotaManager
+from utils.resilience import RetryPolicy, RetryBudget, get_circuit_breaker
+from utils.stub_server import StubServer, StubConfig
+from utils.upstream_cache import UpstreamCache
+
+TOTAL_COUNT = 250
+
+
+class SlowCache(UpstreamCache):
+    """디스크가 느린 상황을 흉내 내는 캐시 (조회/저장마다 동기 대기)"""
+
+    DELAY = 0.1
+
+    def get(self, url, params):
+        time.sleep(self.DELAY)
+        return super().get(url, params)
+
+    def put(self, url, params, content, content_type=None):
+        time.sleep(self.DELAY)
+        return super().put(url, params, content, content_type)
+
+
+class TestAsyncPageFetcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubServer(total_count=TOTAL_COUNT).start()
+        cls.url = cls.server.url('bid_notice')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.config = StubConfig(total_count=TOTAL_COUNT)
+        self.fast_retry = RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.05)
+
+    def test_fetch_all_pages(self):
+        fetcher = AsyncPageFetcher(concurrency=4)
+        items = fetcher.fetch_all_pages(self.url, {'type': 'json', 'numOfRows': '10'})
+
+        self.assertEqual(len(items), TOTAL_COUNT)
+        self.assertEqual(len({item['bidNtceNo'] for item in items}), TOTAL_COUNT)
+        self.assertEqual(fetcher.api_call_count, 25)
+        self.assertEqual(fetcher.failed_pages, [])
+
+    def test_requests_go_through_shared_http_client(self):
+        before = get_http_client().stats()['async']
+        fetcher = AsyncPageFetcher(concurrency=4)
+        fetcher.fetch_all_pages(self.url, {'type': 'json', 'numOfRows': '50'})
+
+        after = get_http_client().stats()['async']
+        self.assertEqual(after['sessions'] - before['sessions'], 1)
+        self.assertEqual(after['requests'] - before['requests'], fetcher.api_call_count)
+
+    def test_max_pages(self):
+        fetcher = AsyncPageFetcher(concurrency=4)
+        items = fetcher.fetch_all_pages(self.url, {'type': 'json', 'numOfRows': '10'}, max_pages=3)
+
+        self.assertEqual(len(items), 30)
+
+    def test_failed_pages_are_reported(self):
+        self.server.config.fail_pages = {3}
+        fetcher = AsyncPageFetcher(concurrency=4, retry_policy=self.fast_retry, retry_budget=RetryBudget())
+        items = fetcher.fetch_all_pages(self.url, {'type': 'json', 'numOfRows': '100'})
+
+        self.assertEqual(len(items), 200)
+        self.assertEqual(fetcher.failed_pages, [(0, 3)])
+        self.assertEqual(fetcher.retry_count, 2)
+
+    def test_failed_pages_keep_their_window(self):
+        self.server.config.fail_pages = {3}
+        fetcher = AsyncPageFetcher(concurrency=4, retry_policy=self.fast_retry, retry_budget=RetryBudget())
+        params = {'type': 'json', 'numOfRows': '100'}
+        pages = list(fetcher.stream_windows(self.url, [params, dict(params)]))
+
+        self.assertEqual(len(pages), 4)
+        self.assertEqual(sorted(fetcher.failed_pages), [(0, 3), (1, 3)])
+        self.assertEqual([window['failed_pages'] for window in fetcher.windows], [[3], [3]])
+
+    def test_transient_failures_are_requeued(self):
+        self.server.config.transient_failures = {1: 1, 4: 2, 7: 1}
+        fetcher = AsyncPageFetcher(concurrency=4, retry_policy=self.fast_retry, retry_budget=RetryBudget())
+        items = fetcher.fetch_all_pages(self.url, {'type': 'json', 'numOfRows': '10'})
+
+        self.assertEqual(len(items), TOTAL_COUNT)
+        self.assertEqual(fetcher.failed_pages, [])
+        self.assertEqual(fetcher.retry_count, 4)
+
+    def test_cancel(self):
+        self.server.config.latency = 0.05
+        fetcher = AsyncPageFetcher(concurrency=2)
+        threading.Timer(0.15, fetcher.cancel).start()
+        items = fetcher.fetch_all_pages(self.url, {'type': 'json', 'numOfRows': '1'})
+
+        self.assertTrue(fetcher.cancelled)
+        self.assertLess(len(items), TOTAL_COUNT)
+
+    def test_cancel_while_stream_buffer_is_full(self):
+        fetcher = AsyncPageFetcher(concurrency=4)
+        pages = []
+        for page in fetcher.stream_windows(self.url, [{'type': 'json', 'numOfRows': '10'}], max_in_flight=2):
+            pages.append(page)
+            if len(pages) == 1:
+                # 느린 소비자 - 출력 큐가 차서 생산자가 빈자리를 기다리는 중에 취소
+                time.sleep(0.3)
+                fetcher.cancel()
+
+        self.assertTrue(fetcher.cancelled)
+        self.assertLess(len(pages), 25)
+
+    def test_quota_reservation(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            quota = QuotaManager(db_path=os.path.join(tmpdir, 'quota.db'), daily_limit=30)
+            fetcher = AsyncPageFetcher(concurrency=4, quota_manager=quota)
+            items = fetcher.fetch_all_pages(self.url, {'ServiceKey': 'test-key', 'type': 'json', 'numOfRows': '10'})
+
+            self.assertEqual(len(items), TOTAL_COUNT)
+            self.assertEqual(quota.usage('test-key')['used'], 25)
+            self.assertEqual(quota.usage('test-key')['reserved'], 0)
+
+    def test_quota_exceeded_refuses_job(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            quota = QuotaManager(db_path=os.path.join(tmpdir, 'quota.db'), daily_limit=10)
+            fetcher = AsyncPageFetcher(concurrency=4, quota_manager=quota)
+            items = fetcher.fetch_all_pages(self.url, {'ServiceKey': 'test-key', 'type': 'json', 'numOfRows': '10'})
+
+            self.assertIsNotNone(fetcher.quota_error)
+            self.assertEqual(len(items), 10)
+            self.assertEqual(fetcher.api_call_count, 1)
+            self.assertEqual(quota.remaining('test-key'), 9)
+
+    def test_quota_error_releases_half_open_probe(self):
+        breaker = get_circuit_breaker(self.url)
+        recovery_timeout = breaker.recovery_timeout
+        try:
+            breaker.recovery_timeout = 0.05
+            for _ in range(breaker.failure_threshold):
+                breaker.record_failure()
+            time.sleep(0.06)
+
+            with tempfile.TemporaryDirectory() as tmpdir:
+                quota = QuotaManager(db_path=os.path.join(tmpdir, 'quota.db'), daily_limit=1)
+                quota.consume('test-key')
+                fetcher = AsyncPageFetcher(quota_manager=quota)
+                fetcher.fetch_all_pages(self.url, {'ServiceKey': 'test-key', 'type': 'json', 'numOfRows': '10'})
+
+            self.assertIsNotNone(fetcher.quota_error)
+            self.assertEqual(breaker.state, breaker.HALF_OPEN)
+            self.assertTrue(breaker.allow_request())
+        finally:
+            breaker.recovery_timeout = recovery_timeout
+            breaker.record_success()
+
+    def test_cache_io_does_not_block_event_loop(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = SlowCache(db_path=os.path.join(tmpdir, 'cache.db'))
+            params = {'type': 'json', 'numOfRows': '25', 'bidNtceEndDt': '202001012359'}
+
+            started = time.monotonic()
+            fetcher = AsyncPageFetcher(concurrency=10, cache=cache)
+            items = fetcher.fetch_all_pages(self.url, params)
+            elapsed = time.monotonic() - started
+
+            self.assertEqual(len(items), TOTAL_COUNT)
+            # 페이지 10개 x (조회 + 저장) 0.1s를 이벤트 루프에서 순서대로 기다리면 2s 이상
+            self.assertLess(elapsed, 1.5)
+
+            cached = AsyncPageFetcher(concurrency=10, cache=cache)
+            self.assertEqual(len(cached.fetch_all_pages(self.url, params)), TOTAL_COUNT)
+            self.assertEqual((cached.cache_hits, cached.api_call_count), (10, 0))
+
+    def test_extract_items(self):
+        self.assertEqual(extract_items({'items': {'bidNtceNo': '1'}}), [{'bidNtceNo': '1'}])
+        self.assertEqual(extract_items({'items': ''}), [])
+        self.assertEqual(extract_items(None), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,271 @@
+import unittest
+import unittest.mock
+import sys
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from models.narajangter import db, BidNotice, SuccessfulBid, SyncWatermark
+from utils.batch_processor import BatchProcessor
+from utils.quota import QuotaManager
+from utils.watermark import WatermarkStore
+from utils.sync_jobs import SyncJobStore
+from utils.resilience import RetryPolicy
+from utils.stub_server import StubServer, StubConfig
+from utils.upstream_cache import UpstreamCache
+
+TOTAL_COUNT = 230
+
+
+class TestBatchProcessor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubServer(total_count=TOTAL_COUNT).start()
+        cls.url = cls.server.url('bid_notice')
+        cls.scsbid_url = cls.server.url('successful_bid')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.config = StubConfig(total_count=TOTAL_COUNT)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.quota = QuotaManager(db_path=os.path.join(self.tmpdir.name, 'quota.db'))
+
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        db.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        self.processor = BatchProcessor(db, 'test-key', quota_manager=self.quota)
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        self.tmpdir.cleanup()
+
+    def test_stream_insert_in_chunks(self):
+        chunks = []
+
+        def insert(chunk):
+            chunks.append(len(chunk))
+            return self.processor.bulk_insert_bid_notices(chunk)
+
+        fetched, inserted = self.processor.stream_insert(
+            self.url, {'ServiceKey': 'test-key', 'type': 'json', 'numOfRows': '10'}, insert, chunk_size=50
+        )
+
+        self.assertEqual(fetched, TOTAL_COUNT)
+        self.assertEqual(inserted, TOTAL_COUNT)
+        self.assertEqual(BidNotice.query.count(), TOTAL_COUNT)
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(size <= 59 for size in chunks))
+
+    def test_stream_insert_bounds_pages_in_flight(self):
+        consumed = []
+        max_gap = []
+
+        def slow_insert(chunk):
+            consumed.append(len(chunk))
+            max_gap.append(self.processor.fetcher.api_call_count - len(consumed))
+            time.sleep(0.01)
+            return len(chunk)
+
+        self.processor.stream_insert(
+            self.url, {'type': 'json', 'numOfRows': '5'}, slow_insert,
+            max_workers=2, chunk_size=1, max_in_flight=3
+        )
+
+        self.assertEqual(sum(consumed), TOTAL_COUNT)
+        # 소비 대기 페이지(3) + 조회 중 페이지(워커 2) + 스레드 전달 중 페이지(2) 이상 앞서가지 않음
+        self.assertLessEqual(max(max_gap), 3 + 2 + 2)
+
+    def test_sync_bid_notices_upserts_existing(self):
+        self.processor.bulk_insert_bid_notices([{'bidNtceNo': '202501010001', 'bidNtceOrd': '00', 'bidNtceNm': '기존'}])
+
+        with unittest.mock.patch('utils.batch_processor.BID_NOTICE_API_URL', self.url):
+            result = self.processor.sync_bid_notices_optimized('20250101', '20250131', chunk_size=100)
+            again = BatchProcessor(db, 'test-key', quota_manager=self.quota).sync_bid_notices_optimized(
+                '20250101', '20250131', chunk_size=100
+            )
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['total_fetched'], TOTAL_COUNT)
+        self.assertEqual(result['inserted'], TOTAL_COUNT - 1)
+        self.assertEqual(result['updated'], 1)
+        self.assertEqual(BidNotice.query.count(), TOTAL_COUNT)
+        self.assertEqual(BidNotice.query.filter_by(bid_notice_no='202501010001').one().bid_notice_nm, '테스트 공고 1')
+        self.assertEqual((again['inserted'], again['updated'], again['duplicates']), (0, 0, TOTAL_COUNT))
+        self.assertEqual(len(result['windows']), 1)
+
+    def test_sync_bid_notices_shards_long_range(self):
+        with unittest.mock.patch('utils.batch_processor.BID_NOTICE_API_URL', self.url):
+            result = self.processor.sync_bid_notices_optimized('20250101', '20250331', chunk_size=100)
+
+        windows = result['windows']
+        self.assertTrue(result['success'])
+        self.assertEqual(
+            [(w['start_date'], w['end_date']) for w in windows],
+            [('20250101', '20250131'), ('20250201', '20250303'), ('20250304', '20250331')]
+        )
+        self.assertTrue(all(w['total_count'] == TOTAL_COUNT and w['pages'] == 3 for w in windows))
+        self.assertEqual(result['total_fetched'], TOTAL_COUNT * 3)
+        self.assertEqual(result['inserted'], TOTAL_COUNT * 3)
+        self.assertEqual(result['api_calls'], 9)
+        self.assertEqual(BidNotice.query.count(), TOTAL_COUNT * 3)
+
+    def test_resync_closed_window_uses_cache(self):
+        cache = UpstreamCache(db_path=os.path.join(self.tmpdir.name, 'cache.db'))
+
+        with unittest.mock.patch('utils.batch_processor.BID_NOTICE_API_URL', self.url):
+            first = BatchProcessor(db, 'test-key', quota_manager=self.quota, cache=cache).sync_bid_notices_optimized(
+                '20250101', '20250131', chunk_size=100
+            )
+            requests_before = self.server.request_count
+            used_before = self.quota.usage('test-key')['used']
+            again = BatchProcessor(db, 'other-key', quota_manager=self.quota, cache=cache).sync_bid_notices_optimized(
+                '20250101', '20250131', chunk_size=100
+            )
+
+        self.assertEqual(first['cache_hits'], 0)
+        self.assertTrue(again['success'])
+        self.assertEqual(again['total_fetched'], TOTAL_COUNT)
+        self.assertEqual((again['api_calls'], again['cache_hits']), (0, 3))
+        self.assertEqual(self.server.request_count, requests_before)
+        self.assertEqual(self.quota.usage('test-key')['used'], used_before)
+        self.assertEqual(self.quota.usage('other-key')['used'], 0)
+
+    def test_incremental_sync_advances_watermark(self):
+        now = datetime(2025, 1, 20, 12, 0)
+        with unittest.mock.patch('utils.batch_processor.BID_NOTICE_API_URL', self.url):
+            first = self.processor.sync_bid_notices_incremental(now=now, chunk_size=100)
+
+            self.assertEqual((first['window_start'], first['window_end']), ('202412210000', '202501201200'))
+            self.assertEqual(first['inserted'], TOTAL_COUNT)
+
+            watermark = SyncWatermark.query.filter_by(endpoint='bid_notice').one()
+            self.assertEqual(watermark.window_end, '202501201200')
+            self.assertEqual(watermark.last_rgst_dt, datetime(2024, 12, 21, 3, 49))
+
+            second = BatchProcessor(db, 'test-key', quota_manager=self.quota).sync_bid_notices_incremental(
+                now=now + timedelta(hours=1), overlap_minutes=30
+            )
+
+        self.assertEqual((second['window_start'], second['window_end']), ('202501201130', '202501201300'))
+        self.assertEqual(len(second['windows']), 1)
+        self.assertEqual(SyncWatermark.query.one().window_end, '202501201300')
+
+    def test_incremental_sync_keeps_watermark_on_failure(self):
+        WatermarkStore(db).advance('bid_notice', '202501190000', '202501200000')
+
+        with unittest.mock.patch('utils.batch_processor.BID_NOTICE_API_URL', 'http://127.0.0.1:9/getDataSetOpnStdBidPblancInfo'), \
+                unittest.mock.patch.object(self.processor.retry_policy, 'max_attempts', 1):
+            result = self.processor.sync_bid_notices_incremental(now=datetime(2025, 1, 20, 6, 0))
+
+        self.assertFalse(result['success'])
+        self.assertEqual(WatermarkStore(db).get('bid_notice')['window_end'], '202501200000')
+
+
+    def test_failed_job_resumes_missing_pages_only(self):
+        self.server.config.fail_pages = {2, 3}
+        processor = BatchProcessor(db, 'test-key', quota_manager=self.quota, retry_policy=RetryPolicy(max_attempts=1))
+
+        with unittest.mock.patch('utils.batch_processor.BID_NOTICE_API_URL', self.url):
+            first = processor.sync_bid_notices_optimized('20250101', '20250131', chunk_size=100)
+
+            job = SyncJobStore(db).get(first['job_id'])
+            self.assertFalse(first['success'])
+            self.assertEqual(first['failed_pages'], [(0, 2), (0, 3)])
+            self.assertEqual(job['status'], 'failed')
+            self.assertEqual(job['windows'], [(TOTAL_COUNT, 3)])
+            self.assertEqual((job['completed_pages'], job['inserted_count']), (1, 100))
+
+            self.server.config.fail_pages = set()
+            resumed = BatchProcessor(db, 'test-key', quota_manager=self.quota).resume_sync_job(first['job_id'])
+
+        job = SyncJobStore(db).get(first['job_id'])
+        self.assertTrue(resumed['success'])
+        self.assertEqual(resumed['api_calls'], 2)
+        self.assertEqual(resumed['inserted'], TOTAL_COUNT - 100)
+        self.assertEqual(job['status'], 'completed')
+        self.assertEqual((job['completed_pages'], job['total_pages'], job['inserted_count']), (3, 3, TOTAL_COUNT))
+        self.assertEqual(BidNotice.query.count(), TOTAL_COUNT)
+
+    def test_resumed_incremental_job_advances_watermark(self):
+        WatermarkStore(db).advance('bid_notice', '202501190000', '202501200000')
+        self.server.config.fail_pages = {2, 3}
+        processor = BatchProcessor(db, 'test-key', quota_manager=self.quota, retry_policy=RetryPolicy(max_attempts=1))
+
+        with unittest.mock.patch('utils.batch_processor.BID_NOTICE_API_URL', self.url):
+            first = processor.sync_bid_notices_incremental(now=datetime(2025, 1, 20, 6, 0), chunk_size=100)
+
+            self.assertFalse(first['success'])
+            self.assertTrue(SyncJobStore(db).get(first['job_id'])['incremental'])
+            self.assertEqual(WatermarkStore(db).get('bid_notice')['window_end'], '202501200000')
+
+            self.server.config.fail_pages = set()
+            resumed = BatchProcessor(db, 'test-key', quota_manager=self.quota).resume_sync_job(first['job_id'])
+
+        self.assertTrue(resumed['success'])
+        self.assertTrue(resumed['incremental'])
+        self.assertEqual(resumed['api_calls'], 2)
+        self.assertEqual(SyncJobStore(db).get(first['job_id'])['status'], 'completed')
+        watermark = WatermarkStore(db).get('bid_notice')
+        self.assertEqual((watermark['window_start'], watermark['window_end']), ('202501192300', '202501200600'))
+        self.assertEqual(watermark['last_rgst_dt'], BidNotice.query.order_by(BidNotice.rgst_dt.desc()).first().rgst_dt)
+
+        # 더 늦게 재개된 이전 작업은 기준점 구간을 되돌리지 않음
+        WatermarkStore(db).advance('bid_notice', '202501190000', '202501200000')
+        self.assertEqual(WatermarkStore(db).get('bid_notice')['window_end'], '202501200600')
+
+
+    def test_sync_successful_bids_weekly_windows(self):
+        self.processor.bulk_insert_successful_bids([{'bidNtceNo': '202501010003', 'bidNtceOrd': '00'}])
+
+        with unittest.mock.patch('utils.batch_processor.SUCCESSFUL_BID_API_URL', self.scsbid_url):
+            result = self.processor.sync_successful_bids_optimized('20250101', '20250110', chunk_size=100)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(
+            [(w['start_date'], w['end_date']) for w in result['windows']],
+            [('20250101', '20250107'), ('20250108', '20250110')]
+        )
+        self.assertEqual(result['total_fetched'], TOTAL_COUNT * 2)
+        self.assertEqual(result['updated'], 1)
+        self.assertEqual(SuccessfulBid.query.count(), TOTAL_COUNT * 2)
+
+        bid = SuccessfulBid.query.filter_by(bid_notice_no='202501080007').one()
+        self.assertEqual(bid.scsbid_corp_nm, '낙찰업체 7')
+        self.assertEqual(bid.scsbid_amount, 900007)
+        self.assertAlmostEqual(bid.scsbid_rate, 80.7)
+        self.assertEqual(bid.openg_dt, datetime(2025, 1, 8, 0, 7))
+
+
+    def test_bulk_upsert_applies_amendments(self):
+        notice = {'bidNtceNo': '202502010001', 'bidNtceOrd': '00', 'bidNtceNm': '원공고', 'presmptPrce': '1000'}
+        self.assertEqual(self.processor.bulk_insert_bid_notices([notice]), 1)
+        created_at = BidNotice.query.one().created_at
+
+        amended = dict(notice, bidNtceNm='정정공고', presmptPrce='2000')
+        rebid = dict(notice, bidNtceOrd='01')
+        self.assertEqual(self.processor.bulk_insert_bid_notices([notice, amended, rebid]), 1)
+
+        db.session.expire_all()
+        original = BidNotice.query.filter_by(bid_notice_ord='00').one()
+        self.assertEqual((original.bid_notice_nm, original.presmpt_price), ('정정공고', 2000))
+        self.assertEqual(original.created_at, created_at)
+        self.assertEqual(BidNotice.query.count(), 2)
+        self.assertEqual(self.processor.updated_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
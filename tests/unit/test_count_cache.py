@@ -0,0 +1,112 @@
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from flask import Flask
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from models.narajangter import db, BidNotice
+from utils.batch_processor import BatchProcessor
+from utils.count_cache import CountCache, configure_count_cache
+from utils.quota import QuotaManager
+
+ROWS = 2000
+EXACT = ('work_div', 'start_date', 'end_date')
+
+
+class TestCountCache(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        db.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        # 공고명의 10%에 '유지관리' 포함
+        begin = datetime(2025, 1, 1)
+        db.session.add_all([
+            BidNotice(
+                bid_notice_no=f'2025{i:05d}',
+                bid_notice_nm=f'공고 {i}' + (' 유지관리' if i % 10 == 0 else ''),
+                bid_notice_ord='00',
+                work_div_nm='용역' if i % 4 == 0 else '물품',
+                rgst_dt=begin + timedelta(minutes=i)
+            )
+            for i in range(ROWS)
+        ])
+        db.session.commit()
+        self.cache = CountCache(sample_rows=400, sample_windows=8)
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_exact_shape_is_counted_once_per_generation(self):
+        query = BidNotice.query.filter(BidNotice.work_div_nm == '용역')
+
+        self.assertEqual(self.cache.count(query, BidNotice, {'work_div': '용역'}, EXACT), (500, True))
+        self.assertEqual(self.cache.count(query, BidNotice, {'work_div': '용역', 'search': ''}, EXACT), (500, True))
+        self.assertEqual((self.cache.hits, self.cache.exact_counts), (1, 1))
+
+        self.cache.invalidate('bid_notices')
+        self.cache.count(query, BidNotice, {'work_div': '용역'}, EXACT)
+        self.assertEqual(self.cache.exact_counts, 2)
+
+    def test_substring_filter_is_estimated(self):
+        query = BidNotice.query.filter(BidNotice.bid_notice_nm.contains('유지관리'))
+
+        total, exact = self.cache.count(query, BidNotice, {'search': '유지관리'}, EXACT)
+
+        self.assertFalse(exact)
+        self.assertAlmostEqual(total, ROWS // 10, delta=ROWS // 20)
+        self.assertEqual(self.cache.count(query, BidNotice, {'search': '유지관리'}, EXACT), (total, False))
+        self.assertEqual(self.cache.count(query, BidNotice, {'search': '유지관리'}, EXACT, force_exact=True), (200, True))
+        # 정확한 건수가 계산된 뒤에는 같은 필터에 정확한 건수 반환
+        self.assertEqual(self.cache.count(query, BidNotice, {'search': '유지관리'}, EXACT), (200, True))
+
+    def test_small_table_is_counted_exactly(self):
+        cache = CountCache(sample_rows=ROWS)
+        query = BidNotice.query.filter(BidNotice.bid_notice_nm.contains('유지관리'))
+
+        self.assertEqual(cache.count(query, BidNotice, {'search': '유지관리'}, EXACT), (200, True))
+
+    def test_result_from_previous_generation_is_not_stored(self):
+        query = BidNotice.query
+
+        class SyncDuringCount:
+            def order_by(inner, *args):
+                return inner
+
+            def count(inner):
+                self.cache.invalidate('bid_notices')
+                return query.count()
+
+        self.cache.count(SyncDuringCount(), BidNotice, {}, EXACT)
+
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_upsert_invalidates_table_generation(self):
+        cache = configure_count_cache()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        processor = BatchProcessor(db, 'test-key', quota_manager=QuotaManager(db_path=os.path.join(tmpdir.name, 'q.db')))
+
+        generation = cache.generation('bid_notices')
+        self.assertEqual(cache.count(BidNotice.query, BidNotice, {}), (ROWS, True))
+        processor.bulk_insert_bid_notices([{'bidNtceNo': '2026000001', 'bidNtceNm': '신규 공고'}])
+
+        self.assertEqual(cache.generation('bid_notices'), generation + 1)
+        self.assertEqual(cache.count(BidNotice.query, BidNotice, {}), (ROWS + 1, True))
+
+        # 변경이 없는 upsert는 세대를 올리지 않음
+        processor.bulk_insert_bid_notices([{'bidNtceNo': '2026000001', 'bidNtceNm': '신규 공고'}])
+        self.assertEqual(cache.generation('bid_notices'), generation + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
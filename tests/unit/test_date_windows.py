@@ -0,0 +1,43 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils.date_windows import DateWindow, split_date_range, plan_windows
+
+
+class TestDateWindows(unittest.TestCase):
+    def test_single_window(self):
+        self.assertEqual(split_date_range('20250101', '20250131', 31), [DateWindow('20250101', '20250131')])
+        self.assertEqual(split_date_range('20250105', '20250105', 7), [DateWindow('20250105', '20250105')])
+
+    def test_year_is_split_into_contiguous_windows(self):
+        windows = plan_windows('bid_notice', '20240101', '20241231')
+
+        self.assertEqual(windows[0].start, '20240101')
+        self.assertEqual(windows[-1].end, '20241231')
+        self.assertTrue(all(w.days <= 31 for w in windows))
+        self.assertEqual(sum(w.days for w in windows), 366)
+        self.assertEqual(len(windows), 12)
+
+    def test_successful_bid_weekly_windows(self):
+        windows = plan_windows('successful_bid', '20250101', '20250120')
+
+        self.assertEqual(windows, [
+            DateWindow('20250101', '20250107'),
+            DateWindow('20250108', '20250114'),
+            DateWindow('20250115', '20250120'),
+        ])
+
+    def test_invalid_range(self):
+        with self.assertRaises(ValueError):
+            split_date_range('20250201', '20250101', 31)
+        with self.assertRaises(ValueError):
+            split_date_range('2025-01-01', '20250131', 31)
+        with self.assertRaises(ValueError):
+            plan_windows('unknown', '20250101', '20250131')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import sys
+import os
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+from flask import Flask
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from models.narajangter import db, BidNotice
+from utils.export import UTF8_BOM, iter_csv, iter_ndjson
+
+
+class TestExporters(unittest.TestCase):
+    columns = ['id', 'bid_notice_nm', 'rgst_dt', 'presmpt_price']
+    rows = [
+        (1, '정보시스템 유지관리, "긴급"', datetime(2025, 1, 2, 3, 4, 5), 1000),
+        (2, '청사 청소 용역', None, None),
+        (3, '도로 보수\n공사', datetime(2025, 1, 3), 2500),
+    ]
+
+    def test_ndjson_one_object_per_line(self):
+        chunks = list(iter_ndjson(self.rows, self.columns, batch_size=2))
+
+        self.assertEqual(len(chunks), 2)
+        lines = b''.join(chunks).decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[0]), {
+            'id': 1, 'bid_notice_nm': '정보시스템 유지관리, "긴급"',
+            'rgst_dt': '2025-01-02T03:04:05', 'presmpt_price': 1000
+        })
+        self.assertIsNone(json.loads(lines[1])['rgst_dt'])
+
+    def test_csv_header_bom_and_quoting(self):
+        chunks = list(iter_csv(self.rows, self.columns, batch_size=2))
+
+        self.assertEqual(len(chunks), 2)
+        text = b''.join(chunks).decode('utf-8')
+        self.assertTrue(text.startswith(UTF8_BOM))
+        records = list(csv.reader(io.StringIO(text[1:], newline='')))
+        self.assertEqual(records[0], self.columns)
+        self.assertEqual(records[1], ['1', '정보시스템 유지관리, "긴급"', '2025-01-02T03:04:05', '1000'])
+        self.assertEqual(records[2], ['2', '청사 청소 용역', '', ''])
+        self.assertEqual(records[3][1], '도로 보수\n공사')
+
+    def test_empty_input(self):
+        self.assertEqual(list(iter_ndjson([], self.columns)), [])
+        self.assertEqual(
+            b''.join(iter_csv([], self.columns, bom=False)),
+            b'id,bid_notice_nm,rgst_dt,presmpt_price\r\n'
+        )
+
+
+class TestExportQuery(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        begin = datetime(2025, 1, 1)
+        for i in range(25):
+            db.session.add(BidNotice(
+                bid_notice_no=f'2025{i:04d}', bid_notice_ord='00', bid_notice_nm=f'공고 {i}',
+                dminstt_nm='조달청', rgst_dt=begin + timedelta(hours=i)
+            ))
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_streams_column_rows_from_query(self):
+        columns = [column.name for column in BidNotice.__table__.columns]
+        rows = BidNotice.query.with_entities(*[getattr(BidNotice, name) for name in columns]).order_by(
+            BidNotice.rgst_dt.desc(), BidNotice.id.desc()
+        ).yield_per(10)
+
+        chunks = list(iter_ndjson(rows, columns, batch_size=10))
+
+        self.assertEqual(len(chunks), 3)
+        items = [json.loads(line) for line in b''.join(chunks).splitlines()]
+        self.assertEqual(len(items), 25)
+        self.assertEqual(items[0]['bid_notice_no'], '20250024')
+        self.assertEqual(items[0]['rgst_dt'], '2025-01-02T00:00:00')
+        self.assertEqual(set(items[0]), set(columns))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import sys
+import os
+import tempfile
+
+from flask import Flask
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from models.narajangter import db, BidNotice
+from utils.batch_processor import BatchProcessor
+from utils.fulltext import BID_NOTICE_FTS, FullTextIndex, phrase
+from utils.quota import QuotaManager
+
+
+class TestFullTextIndex(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        db.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        # 색인 생성 전에 저장된 공고
+        for no, name, agency in (
+            ('1', '정보시스템 유지관리 용역', '조달청'),
+            ('2', '청사 시설 유지보수 공사', '서울특별시 종로구'),
+            ('3', '통합 유지관리 및 운영', '서울특별시'),
+        ):
+            db.session.add(BidNotice(bid_notice_no=no, bid_notice_ord='00', bid_notice_nm=name, dminstt_nm=agency))
+        db.session.commit()
+        self.assertTrue(BID_NOTICE_FTS.ensure(db.session))
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def search(self, **terms):
+        matches = BID_NOTICE_FTS.matches(BID_NOTICE_FTS.match_expression(terms))
+        query = BidNotice.query.join(matches, BidNotice.id == matches.c.id)
+        return sorted(item.bid_notice_no for item in query.all())
+
+    def test_phrase_requires_three_characters(self):
+        self.assertIsNone(phrase('용역'))
+        self.assertEqual(phrase(' 유지관리 '), '"유지관리"')
+        self.assertEqual(phrase('a"b'), '"a""b"')
+
+    def test_existing_rows_are_indexed_on_creation(self):
+        self.assertEqual(self.search(bid_notice_nm='유지관리'), ['1', '3'])
+        self.assertEqual(self.search(bid_notice_nm='유지관리', dminstt_nm='서울특별시'), ['3'])
+        self.assertEqual(self.search(dminstt_nm='종로구'), ['2'])
+
+    def test_substring_match_equals_like(self):
+        for keyword in ('유지관', '템 유지', '시설 유지보수', '없는 검색어'):
+            like = sorted(n.bid_notice_no for n in BidNotice.query.filter(BidNotice.bid_notice_nm.contains(keyword)))
+            self.assertEqual(self.search(bid_notice_nm=keyword), like, keyword)
+
+    def test_ingestion_keeps_index_in_sync(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        quota = QuotaManager(db_path=os.path.join(tmpdir.name, 'quota.db'))
+        processor = BatchProcessor(db, 'test-key', quota_manager=quota)
+
+        processor.bulk_insert_bid_notices([
+            {'bidNtceNo': '1', 'bidNtceNm': '정보시스템 운영 용역', 'dminsttNm': '조달청'},
+            {'bidNtceNo': '4', 'bidNtceNm': '전산장비 유지관리', 'dminsttNm': '국방부'},
+        ])
+
+        self.assertEqual(self.search(bid_notice_nm='유지관리'), ['3', '4'])
+        self.assertEqual(self.search(bid_notice_nm='시스템 운영'), ['1'])
+
+        BidNotice.query.filter_by(bid_notice_no='3').delete()
+        db.session.commit()
+        self.assertEqual(self.search(bid_notice_nm='유지관리'), ['4'])
+
+    def test_missing_triggers_trigger_rebuild(self):
+        db.session.execute(text("DROP TRIGGER bid_notices_fts_ai"))
+        db.session.add(BidNotice(bid_notice_no='5', bid_notice_ord='00', bid_notice_nm='유지관리 신규'))
+        db.session.commit()
+
+        index = FullTextIndex('bid_notices', ('bid_notice_nm', 'dminstt_nm'))
+        self.assertTrue(index.ensure(db.session))
+        self.assertEqual(self.search(bid_notice_nm='유지관리'), ['1', '3', '5'])
+
+    def test_relevance_rank_orders_better_matches_first(self):
+        matches = BID_NOTICE_FTS.matches(BID_NOTICE_FTS.match_expression({'dminstt_nm': '서울특별시'}))
+        ranked = BidNotice.query.join(matches, BidNotice.id == matches.c.id).order_by(matches.c.rank).all()
+
+        self.assertEqual([item.bid_notice_no for item in ranked], ['3', '2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+
+from flask import Flask, jsonify, request
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils.generations import get_data_generations
+from utils.http_cache import ResponseCache, cached_view, configure_response_cache
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = configure_response_cache()
+        self.renders = 0
+        self.app = Flask(__name__)
+
+        @self.app.route('/items')
+        @cached_view('bid_notices')
+        def items():
+            self.renders += 1
+            if request.args.get('fail'):
+                return jsonify({'error': 'fail'}), 500
+            return jsonify({'items': [1, 2, 3], 'page': request.args.get('page', '1')}), 200
+
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        configure_response_cache(enabled=False)
+
+    def test_repeated_reads_are_served_from_cache(self):
+        first = self.client.get('/items?page=1&per_page=20')
+        second = self.client.get('/items?per_page=20&page=1')
+
+        self.assertEqual(self.renders, 1)
+        self.assertEqual(first.headers['X-Response-Cache'], 'MISS')
+        self.assertEqual(second.headers['X-Response-Cache'], 'HIT')
+        self.assertEqual(first.get_data(), second.get_data())
+        self.assertEqual(first.headers['ETag'], second.headers['ETag'])
+        self.assertEqual(first.headers['Cache-Control'], 'no-cache')
+
+        self.client.get('/items?page=2')
+        self.assertEqual(self.renders, 2)
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get('/items').headers['ETag']
+
+        response = self.client.get('/items', headers={'If-None-Match': etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.get_data(), b'')
+        self.assertEqual(self.cache.stats()['not_modified'], 1)
+
+    def test_generation_bump_re_renders_with_same_etag_for_same_body(self):
+        etag = self.client.get('/items').headers['ETag']
+        get_data_generations().bump('bid_notices')
+
+        response = self.client.get('/items', headers={'If-None-Match': etag})
+
+        self.assertEqual(self.renders, 2)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['X-Response-Cache'], 'MISS')
+
+    def test_errors_are_not_cached(self):
+        self.assertEqual(self.client.get('/items?fail=1').status_code, 500)
+        self.assertEqual(self.client.get('/items?fail=1').status_code, 500)
+
+        self.assertEqual(self.renders, 2)
+        self.assertNotIn('ETag', self.client.get('/items?fail=1').headers)
+
+    def test_disabled_cache_still_sends_etag(self):
+        configure_response_cache(enabled=False)
+        etag = self.client.get('/items').headers['ETag']
+
+        self.assertEqual(self.client.get('/items', headers={'If-None-Match': etag}).status_code, 304)
+        self.assertEqual(self.renders, 2)
+
+    def test_lru_eviction_by_size(self):
+        cache = ResponseCache(max_entries=10, max_bytes=100)
+        for i in range(4):
+            cache.put(('items', i), (0,), b'x' * 40, 'application/json')
+
+        self.assertEqual(cache.stats()['entries'], 2)
+        self.assertEqual(cache.stats()['evictions'], 2)
+        self.assertIsNone(cache.get(('items', 0), (0,)))
+        self.assertIsNotNone(cache.get(('items', 3), (0,)))
+        self.assertIsNone(cache.get(('items', 3), (1,)))
+
+
+if __name__ == '__main__':
+    unittest.main()
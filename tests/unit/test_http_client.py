@@ -0,0 +1,88 @@
+import unittest
+import asyncio
+import sys
+import os
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils.http_client import HTTPClient, get_http_client, configure_http_client
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        payload = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHTTPClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        cls.server.daemon_threads = True
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}/'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_connections_are_reused(self):
+        client = HTTPClient(pool_size=2)
+        for _ in range(5):
+            response = client.get(self.url, params={'pageNo': '1'})
+            self.assertEqual(response.status_code, 200)
+
+        stats = client.stats()
+        self.assertEqual(stats['requests'], 5)
+        self.assertEqual(stats['errors'], 0)
+        self.assertEqual(stats['connections_created'], 1)
+        self.assertEqual(stats['pools'][0]['requests'], 5)
+        client.close()
+
+    def test_errors_are_counted(self):
+        client = HTTPClient()
+        with self.assertRaises(Exception):
+            client.get('http://127.0.0.1:1/', timeout=1)
+        self.assertEqual(client.stats()['errors'], 1)
+        client.close()
+
+    def test_async_sessions_are_counted(self):
+        client = HTTPClient(pool_size=2)
+
+        async def fetch():
+            async with client.create_async_session(limit=2, limit_per_host=2) as session:
+                for _ in range(5):
+                    async with session.get(self.url) as response:
+                        self.assertEqual(response.status, 200)
+                        await response.read()
+
+        asyncio.run(fetch())
+
+        stats = client.stats()['async']
+        self.assertEqual((stats['sessions'], stats['requests'], stats['errors']), (1, 5, 0))
+        self.assertEqual(stats['connections_created'], 1)
+        self.assertEqual(client.stats()['requests'], 0)
+        client.close()
+
+    def test_shared_client(self):
+        self.assertIs(get_http_client(), get_http_client())
+
+        client = configure_http_client(pool_size=3, timeout=5)
+        self.assertIs(get_http_client(), client)
+        self.assertEqual(client.stats()['pool_size'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import asyncio
+import sys
+import os
+import threading
+
+from flask import Flask, current_app
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils.job_queue import JobQueue
+
+
+class TestJobQueue(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.queue = JobQueue(max_workers=1, max_history=3)
+
+    def tearDown(self):
+        self.queue.shutdown()
+
+    def test_runs_in_app_context(self):
+        future = self.queue.submit(1, self.app, lambda: current_app.name)
+        future.result(timeout=5)
+
+        status = self.queue.get(1)
+        self.assertEqual(status['queue_status'], 'done')
+        self.assertEqual(status['result'], self.app.name)
+
+    def test_progress_while_running(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def work():
+            started.set()
+            release.wait(5)
+            return {'inserted': 10}
+
+        future = self.queue.submit(1, self.app, work, progress=lambda: {'fetched': 5})
+        self.queue.submit(2, self.app, lambda: None)
+        started.wait(5)
+
+        self.assertEqual(self.queue.get(1)['progress'], {'fetched': 5})
+        self.assertEqual(self.queue.get(2)['queue_status'], 'queued')
+        self.assertEqual(self.queue.pending_count(), 2)
+
+        release.set()
+        future.result(timeout=5)
+        self.assertEqual(self.queue.get(1)['result'], {'inserted': 10})
+
+    def test_error_is_recorded(self):
+        def fail():
+            raise RuntimeError('boom')
+
+        self.queue.submit(1, self.app, fail).result(timeout=5)
+
+        status = self.queue.get(1)
+        self.assertEqual(status['queue_status'], 'error')
+        self.assertEqual(status['error'], 'boom')
+
+    def test_base_exception_is_recorded(self):
+        def cancelled():
+            raise asyncio.CancelledError()
+
+        self.queue.submit(1, self.app, cancelled).result(timeout=5)
+
+        status = self.queue.get(1)
+        self.assertEqual(status['queue_status'], 'error')
+        self.assertEqual(status['error'], 'CancelledError')
+        self.assertEqual(self.queue.pending_count(), 0)
+        self.assertFalse(self.queue.cancel(1))
+
+    def test_cancel_and_history_limit(self):
+        cancelled = []
+        release = threading.Event()
+        self.queue.submit(1, self.app, lambda: release.wait(5), cancel=lambda: cancelled.append(1))
+
+        self.assertTrue(self.queue.cancel(1))
+        self.assertFalse(self.queue.cancel(99))
+        self.assertEqual(cancelled, [1])
+        release.set()
+
+        for job_id in range(2, 6):
+            self.queue.submit(job_id, self.app, lambda: None).result(timeout=5)
+        self.assertEqual(self.queue.job_ids(), [3, 4, 5])
+        self.assertIsNone(self.queue.get(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
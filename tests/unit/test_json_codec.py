@@ -0,0 +1,71 @@
+import unittest
+import sys
+import os
+import json
+from decimal import Decimal
+from datetime import datetime, date
+
+from flask import Flask, jsonify, request
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils import json_codec
+from utils.json_codec import CODECS, STDLIB_CODEC, FastJSONProvider, configure_json_codec, get_json_codec
+
+
+class TestJSONCodec(unittest.TestCase):
+    def tearDown(self):
+        configure_json_codec()
+
+    def test_backends_produce_same_document(self):
+        payload = {
+            'bid_notice_nm': '테스트 공고',
+            'rgst_dt': datetime(2025, 1, 2, 3, 4, 5),
+            'openg_dt': date(2025, 1, 3),
+            'amount': Decimal('1000.5'),
+            'items': [1, None, True]
+        }
+        expected = {
+            'bid_notice_nm': '테스트 공고',
+            'rgst_dt': '2025-01-02T03:04:05',
+            'openg_dt': '2025-01-03',
+            'amount': 1000.5,
+            'items': [1, None, True]
+        }
+
+        for codec in CODECS.values():
+            with self.subTest(backend=codec.name):
+                encoded = codec.dumps(payload)
+                self.assertIn('테스트'.encode('utf-8'), encoded)
+                self.assertEqual(json.loads(encoded), expected)
+                self.assertEqual(codec.loads(encoded), expected)
+
+    def test_invalid_json_raises_value_error(self):
+        for codec in CODECS.values():
+            with self.subTest(backend=codec.name), self.assertRaises(ValueError):
+                codec.loads(b'<?xml version="1.0"?><response/>')
+
+    def test_configure_backend(self):
+        self.assertIs(configure_json_codec('json'), STDLIB_CODEC)
+        self.assertIs(get_json_codec(), STDLIB_CODEC)
+        self.assertEqual(json_codec.loads(b'{"a": 1}'), {'a': 1})
+
+        with self.assertRaises(ValueError):
+            configure_json_codec('simplejson')
+
+    def test_flask_provider(self):
+        app = Flask(__name__)
+        app.json = FastJSONProvider(app)
+
+        @app.route('/echo', methods=['POST'])
+        def echo():
+            return jsonify({'z': request.get_json()['value'], 'a': datetime(2025, 1, 1)})
+
+        response = app.test_client().post('/echo', json={'value': '조달청'})
+
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(response.get_data(), '{"z":"조달청","a":"2025-01-01T00:00:00"}\n'.encode('utf-8'))
+
+
+if __name__ == '__main__':
+    unittest.main()
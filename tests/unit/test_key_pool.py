@@ -0,0 +1,143 @@
+import unittest
+import unittest.mock
+import sys
+import os
+import tempfile
+from collections import Counter
+
+from flask import Flask
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from models.narajangter import db, BidNotice
+from utils.async_fetcher import AsyncPageFetcher
+from utils.batch_processor import BatchProcessor
+from utils.key_pool import KeyPool
+from utils.quota import QuotaManager, QuotaExceededError
+from utils.stub_server import StubServer
+
+TOTAL_COUNT = 450
+
+
+class TestKeyPool(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.quota = QuotaManager(db_path=os.path.join(self.tmpdir.name, 'quota.db'), daily_limit=100)
+        self.pool = KeyPool(['key-a', 'key-b', 'key-c'], quota_manager=self.quota)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_robin_weighted_by_remaining_quota(self):
+        self.quota.consume('key-b', 50)
+        self.quota.consume('key-c', 100)
+
+        picks = Counter(self.pool.acquire() for _ in range(30))
+
+        self.assertEqual(picks, {'key-a': 20, 'key-b': 10})
+        self.assertEqual(self.pool.remaining(), 150)
+
+    def test_ejected_key_is_skipped_until_restored(self):
+        self.pool.eject('key-a', '30 SERVICE_KEY_IS_NOT_REGISTERED_ERROR')
+
+        self.assertNotIn('key-a', {self.pool.acquire() for _ in range(10)})
+        self.pool.restore('key-a')
+        self.assertIn('key-a', {self.pool.acquire() for _ in range(10)})
+
+    def test_ejection_expires(self):
+        self.pool.eject('key-a', 'quota', seconds=0)
+
+        self.assertTrue(self.pool.is_available('key-a'))
+
+    def test_no_available_key_raises(self):
+        for key in self.pool.keys:
+            self.pool.eject(key, 'quota', seconds=30)
+
+        with self.assertRaises(QuotaExceededError) as ctx:
+            self.pool.acquire()
+        self.assertLessEqual(ctx.exception.retry_after, 30)
+
+    def test_set_keys_keeps_ejection_state(self):
+        self.pool.eject('key-a', 'quota')
+        self.pool.set_keys(['key-a', 'key-d'])
+
+        self.assertEqual(self.pool.keys, ['key-a', 'key-d'])
+        self.assertFalse(self.pool.is_available('key-a'))
+        stats = {item['key_id']: item for item in self.pool.stats()}
+        self.assertTrue(stats[QuotaManager.key_id('key-a')]['ejected'])
+
+
+class TestKeyPoolIngestion(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubServer(total_count=TOTAL_COUNT, rejected_keys={'expired-key': '31'}).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.quota = QuotaManager(db_path=os.path.join(self.tmpdir.name, 'quota.db'))
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        db.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        self.tmpdir.cleanup()
+
+    def test_sync_spreads_pages_and_ejects_rejected_key(self):
+        pool = KeyPool(['key-a', 'expired-key', 'key-b'], quota_manager=self.quota)
+        processor = BatchProcessor(db, 'key-a', quota_manager=self.quota, key_pool=pool)
+
+        with unittest.mock.patch('utils.batch_processor.BID_NOTICE_API_URL', self.server.url('bid_notice')):
+            result = processor.sync_bid_notices_optimized('20250101', '20250131', max_workers=2)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(BidNotice.query.count(), TOTAL_COUNT)
+        self.assertFalse(pool.is_available('expired-key'))
+        self.assertEqual(self.quota.usage('expired-key')['used'], 1)
+        used = [self.quota.usage(key)['used'] for key in ('key-a', 'key-b')]
+        self.assertEqual(sum(used), 5)
+        self.assertTrue(all(count >= 2 for count in used))
+
+    def test_fetcher_reserves_quota_per_key_in_blocks(self):
+        pool = KeyPool(['key-a', 'key-b'], quota_manager=self.quota)
+        fetcher = AsyncPageFetcher(concurrency=8, quota_manager=self.quota, key_pool=pool, key_block=10)
+
+        with unittest.mock.patch.object(self.quota, 'consume', wraps=self.quota.consume) as consume, \
+                unittest.mock.patch.object(self.quota, 'reserve', wraps=self.quota.reserve) as reserve:
+            items = fetcher.fetch_all_pages(self.server.url('bid_notice'), {
+                'ServiceKey': 'key-a', 'type': 'json', 'numOfRows': '10'
+            })
+
+        self.assertEqual(len(items), TOTAL_COUNT)
+        self.assertEqual(consume.call_count, 0)
+        self.assertLessEqual(reserve.call_count, 45 // 10 + 2)
+        usage = [self.quota.usage(key) for key in ('key-a', 'key-b')]
+        self.assertEqual(sum(u['used'] for u in usage), fetcher.api_call_count)
+        self.assertEqual([u['reserved'] for u in usage], [0, 0])
+
+    def test_fetcher_key_blocks_shrink_to_remaining_quota(self):
+        quota = QuotaManager(db_path=os.path.join(self.tmpdir.name, 'small.db'), daily_limit=25)
+        pool = KeyPool(['key-a', 'key-b'], quota_manager=quota)
+        fetcher = AsyncPageFetcher(concurrency=4, quota_manager=quota, key_pool=pool, key_block=20)
+
+        items = fetcher.fetch_all_pages(self.server.url('bid_notice'), {
+            'ServiceKey': 'key-a', 'type': 'json', 'numOfRows': '10'
+        })
+
+        self.assertEqual(len(items), TOTAL_COUNT)
+        usage = [quota.usage(key) for key in ('key-a', 'key-b')]
+        self.assertEqual(sum(u['used'] for u in usage), 45)
+        self.assertEqual([u['reserved'] for u in usage], [0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from flask import Flask
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from models.narajangter import db, BidNotice
+from utils.batch_processor import BatchProcessor
+from utils.pagination import encode_cursor, decode_cursor, keyset_page
+from utils.quota import QuotaManager
+from utils.stub_server import synthetic_bid_notice
+
+
+class TestCursor(unittest.TestCase):
+    def test_round_trip(self):
+        value = datetime(2025, 1, 2, 3, 4, 5)
+        self.assertEqual(decode_cursor(encode_cursor(value, 42)), (value, 42))
+        self.assertEqual(decode_cursor(encode_cursor(None, 7)), (None, 7))
+
+    def test_malformed_cursor_raises_value_error(self):
+        for cursor in ('not-a-cursor', encode_cursor(None, 1)[:-3], 'WyJ4IiwxXQ', 'WzEsICJ4Il0'):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+
+class TestKeysetPage(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        # 같은 등록일시가 여러 건이고 등록일시가 없는 공고도 섞인 데이터
+        begin = datetime(2025, 1, 1)
+        for i in range(53):
+            rgst_dt = None if i % 10 == 0 else begin + timedelta(hours=i % 7)
+            db.session.add(BidNotice(
+                bid_notice_no=f'2025{i:04d}', bid_notice_nm=f'공고 {i}', bid_notice_ord='00', rgst_dt=rgst_dt
+            ))
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def walk(self, query, per_page):
+        ids, cursor = [], None
+        while True:
+            items, cursor = keyset_page(query, BidNotice.rgst_dt, BidNotice.id, per_page, cursor)
+            self.assertLessEqual(len(items), per_page)
+            ids += [item.id for item in items]
+            if cursor is None:
+                return ids
+
+    def test_traversal_matches_offset_order(self):
+        expected = [
+            item.id for item in BidNotice.query.order_by(BidNotice.rgst_dt.desc(), BidNotice.id.desc()).all()
+        ]
+
+        for per_page in (1, 4, 10, 53, 100):
+            self.assertEqual(self.walk(BidNotice.query, per_page), expected)
+
+    def test_traversal_applies_filters(self):
+        query = BidNotice.query.filter(BidNotice.bid_notice_no.like('2025001%'))
+        expected = [item.id for item in query.order_by(BidNotice.rgst_dt.desc(), BidNotice.id.desc()).all()]
+
+        self.assertEqual(len(expected), 10)
+        self.assertEqual(self.walk(query, 3), expected)
+
+    def test_last_page_has_no_cursor(self):
+        items, cursor = keyset_page(BidNotice.query, BidNotice.rgst_dt, BidNotice.id, 53)
+        self.assertEqual(len(items), 53)
+        self.assertIsNone(cursor)
+
+    def test_seek_uses_sort_index(self):
+        plan = db.session.execute(db.text(
+            "EXPLAIN QUERY PLAN SELECT id FROM bid_notices "
+            "WHERE rgst_dt IS NOT NULL AND (rgst_dt, id) < (:v, :i) ORDER BY rgst_dt DESC, id DESC LIMIT 21"
+        ), {'v': '2025-01-01 03:00:00.000000', 'i': 10}).fetchall()
+        detail = ' '.join(row[-1] for row in plan)
+
+        self.assertIn('idx_rgst_dt', detail)
+        self.assertNotIn('TEMP B-TREE', detail)
+
+
+
+class TestKeysetPageOverUpsertedRows(unittest.TestCase):
+    """수집 upsert(text() 바인딩)로 저장한 행도 ORM으로 바인딩한 커서 값과 같은 형식으로 비교되는지 확인"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        # 분 단위 등록일시 (마이크로초 0) - 3건씩 같은 등록일시
+        begin = datetime(2026, 9, 17, 7, 0)
+        items = []
+        for i in range(30):
+            item = synthetic_bid_notice(i, begin)
+            item['rgstDt'] = f"{begin + timedelta(minutes=i // 3):%Y%m%d%H%M}"
+            items.append(item)
+        quota = QuotaManager(db_path=os.path.join(self.tmpdir.name, 'quota.db'))
+        BatchProcessor(db, 'test-key', quota_manager=quota).bulk_insert_bid_notices(items)
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        self.tmpdir.cleanup()
+
+    def test_stored_format_matches_orm(self):
+        stored = db.session.execute(db.text('SELECT rgst_dt FROM bid_notices ORDER BY id LIMIT 1')).scalar()
+        self.assertEqual(stored, '2026-09-17 07:00:00.000000')
+
+    def test_traversal_has_no_repeated_boundary_rows(self):
+        expected = [
+            item.id for item in BidNotice.query.order_by(BidNotice.rgst_dt.desc(), BidNotice.id.desc()).all()
+        ]
+
+        for per_page in (1, 2, 3, 4, 7):
+            ids, cursor = [], None
+            for _ in range(len(expected)):  # 경계 행이 반복되면 끝나지 않으므로 페이지 수 제한
+                items, cursor = keyset_page(BidNotice.query, BidNotice.rgst_dt, BidNotice.id, per_page, cursor)
+                ids += [item.id for item in items]
+                if cursor is None:
+                    break
+            self.assertEqual(ids, expected, per_page)
+            self.assertEqual(len(ids), 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
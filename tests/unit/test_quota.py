@@ -0,0 +1,86 @@
+import unittest
+import sys
+import os
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils.quota import QuotaManager, QuotaExceededError
+
+
+class TestQuotaManager(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'quota.db')
+        self.manager = QuotaManager(db_path=self.db_path, daily_limit=10)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_consume_and_remaining(self):
+        self.manager.consume('key-a', 3)
+
+        self.assertEqual(self.manager.remaining('key-a'), 7)
+        self.assertEqual(self.manager.remaining('key-b'), 10)
+
+    def test_usage_is_persisted(self):
+        self.manager.consume('key-a', 4)
+
+        other = QuotaManager(db_path=self.db_path, daily_limit=10)
+        self.assertEqual(other.usage('key-a')['used'], 4)
+
+    def test_consume_over_limit(self):
+        self.manager.consume('key-a', 9)
+
+        with self.assertRaises(QuotaExceededError) as ctx:
+            self.manager.consume('key-a', 2)
+        self.assertEqual(ctx.exception.remaining, 1)
+        self.assertGreater(ctx.exception.retry_after, 0)
+
+    def test_reservation(self):
+        with self.manager.reserve('key-a', 6) as reservation:
+            self.assertEqual(self.manager.remaining('key-a'), 4)
+            with self.assertRaises(QuotaExceededError):
+                self.manager.reserve('key-a', 5)
+
+            for _ in range(4):
+                self.assertTrue(reservation.use())
+
+        usage = self.manager.usage('key-a')
+        self.assertEqual(usage['used'], 4)
+        self.assertEqual(usage['reserved'], 0)
+        self.assertEqual(usage['remaining'], 6)
+
+    def test_reservation_exhausted(self):
+        reservation = self.manager.reserve('key-a', 1)
+        self.assertTrue(reservation.use())
+        self.assertFalse(reservation.use())
+        reservation.release()
+
+    def test_pace(self):
+        manager = QuotaManager(db_path=self.db_path, rate_per_second=10, burst=2)
+
+        self.assertEqual(manager.pace('key-a'), 0)
+        self.assertEqual(manager.pace('key-a'), 0)
+        self.assertGreater(manager.pace('key-a'), 0)
+
+    def test_service_key_is_not_stored(self):
+        self.manager.consume('secret-service-key')
+
+        with open(self.db_path, 'rb') as f:
+            self.assertNotIn(b'secret-service-key', f.read())
+
+    def test_db_path_from_environment(self):
+        # 기본 DB 위치는 모듈 로드 시 QUOTA_DB_PATH 환경변수에서 읽음 (새 프로세스에서 확인)
+        src = os.path.join(os.path.dirname(__file__), '../../narajangter_app/src')
+        output = subprocess.run(
+            [sys.executable, '-c', 'from utils.quota import get_quota_manager; print(get_quota_manager().db_path)'],
+            cwd=src, env=dict(os.environ, QUOTA_DB_PATH=self.db_path), capture_output=True, text=True, check=True
+        ).stdout
+
+        self.assertEqual(output.strip(), self.db_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
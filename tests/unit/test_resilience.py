@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils.resilience import RetryPolicy, RetryBudget, CircuitBreaker, get_circuit_breaker, endpoint_name
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_exponential_delay_without_jitter(self):
+        policy = RetryPolicy(base_delay=1, multiplier=2, max_delay=5, jitter=False)
+
+        self.assertEqual([policy.delay(i) for i in range(4)], [1, 2, 4, 5])
+
+    def test_jitter_stays_within_backoff(self):
+        policy = RetryPolicy(base_delay=1, multiplier=2, max_delay=30)
+
+        for _ in range(100):
+            self.assertLessEqual(policy.delay(2), 4)
+            self.assertGreaterEqual(policy.delay(2), 0)
+
+    def test_timeout_grows_per_attempt(self):
+        policy = RetryPolicy(timeout_multiplier=2, max_timeout=50)
+
+        self.assertEqual(policy.timeout(0, 10), 10)
+        self.assertEqual(policy.timeout(1, 10), 20)
+        self.assertEqual(policy.timeout(3, 10), 50)
+
+
+class TestRetryBudget(unittest.TestCase):
+    def test_budget_limits_retries(self):
+        budget = RetryBudget(ratio=0.1, min_retries=2)
+        for _ in range(30):
+            budget.record_request()
+
+        self.assertEqual(sum(budget.can_retry() for _ in range(10)), 3)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker('test', failure_threshold=3, recovery_timeout=60)
+        for _ in range(3):
+            self.assertTrue(breaker.allow_request())
+            breaker.record_failure()
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow_request())
+        self.assertGreater(breaker.retry_after(), 0)
+
+    def test_half_open_probe(self):
+        breaker = CircuitBreaker('test', failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_released_probe_can_be_retaken(self):
+        breaker = CircuitBreaker('test', failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        self.assertTrue(breaker.allow_request())
+        breaker.release_probe()
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker('test', failure_threshold=5, recovery_timeout=0.05)
+        for _ in range(5):
+            breaker.record_failure()
+        time.sleep(0.06)
+
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    def test_breakers_are_shared_per_endpoint(self):
+        url = 'http://apis.data.go.kr/1230000/ao/PubDataOpnStdService/getDataSetOpnStdCntrctInfo'
+
+        self.assertIs(get_circuit_breaker(url), get_circuit_breaker(url + '?pageNo=2'))
+        self.assertEqual(endpoint_name(url + '?pageNo=2'), 'apis.data.go.kr/1230000/ao/PubDataOpnStdService/getDataSetOpnStdCntrctInfo')
+
+
+if __name__ == '__main__':
+    unittest.main()
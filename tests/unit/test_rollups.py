@@ -0,0 +1,155 @@
+import unittest
+import sys
+import os
+import tempfile
+
+from flask import Flask
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from models.narajangter import db, BidNotice, SuccessfulBid
+from utils.batch_processor import BatchProcessor
+from utils.quota import QuotaManager
+from utils import rollups
+from utils.rollups import check_rollups, ensure_rollups, read_rollup, rebuild_rollups
+
+
+def notice(no, work_div, price, rgst_dt='202501150930'):
+    return {'bidNtceNo': no, 'bidNtceNm': f'공고 {no}', 'taskClsfcNm': work_div, 'presmptPrce': price, 'rgstDt': rgst_dt}
+
+
+class TestRollups(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        db.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        # 집계 테이블 생성 전에 저장된 데이터
+        db.session.add(BidNotice(bid_notice_no='0', bid_notice_ord='00', bid_notice_nm='기존', presmpt_price=500))
+        db.session.commit()
+        ensure_rollups(db.session)
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        quota = QuotaManager(db_path=os.path.join(self.tmpdir.name, 'quota.db'))
+        self.processor = BatchProcessor(db, 'test-key', quota_manager=quota)
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        self.tmpdir.cleanup()
+
+    def rollup(self, name):
+        return {row['group_key']: (row['row_count'], row['total'], row['min_value'], row['max_value'])
+                for row in read_rollup(db.session, name)}
+
+    def test_existing_rows_are_aggregated_on_creation(self):
+        self.assertEqual(self.rollup('rollup_bid_amount_by_work_div'), {None: (1, 500, 500, 500)})
+        self.assertEqual(self.rollup('rollup_bid_amount_by_month'), {})
+
+    def test_ingestion_updates_rollups(self):
+        self.processor.bulk_insert_bid_notices([
+            notice('1', '용역', '1000'),
+            notice('2', '용역', '3000', '202502011000'),
+            notice('3', '공사', '2000'),
+            notice('4', '공사', None),
+        ])
+
+        self.assertEqual(self.rollup('rollup_bid_amount_by_work_div'), {
+            None: (1, 500, 500, 500), '용역': (2, 4000, 1000, 3000), '공사': (1, 2000, 2000, 2000)
+        })
+        self.assertEqual(self.rollup('rollup_bid_amount_by_month'), {
+            '2025-01': (2, 3000, 1000, 2000), '2025-02': (1, 3000, 3000, 3000)
+        })
+        self.assertFalse(any(check_rollups(db.session).values()))
+
+    def test_updates_and_deletes_recompute_extremes(self):
+        self.processor.bulk_insert_bid_notices([notice(str(i), '용역', str(1000 * i)) for i in range(1, 5)])
+
+        # 최대값 행의 가격 변경, 최소값 행의 업무구분/월 변경, 행 삭제
+        self.processor.bulk_insert_bid_notices([
+            notice('4', '용역', '1500'),
+            notice('1', '물품', '1000', '202503010000'),
+        ])
+        BidNotice.query.filter_by(bid_notice_no='2').delete()
+        db.session.commit()
+
+        self.assertEqual(self.rollup('rollup_bid_amount_by_work_div'), {
+            None: (1, 500, 500, 500), '용역': (2, 4500, 1500, 3000), '물품': (1, 1000, 1000, 1000)
+        })
+        self.assertEqual(self.rollup('rollup_bid_amount_by_month'), {
+            '2025-01': (2, 4500, 1500, 3000), '2025-03': (1, 1000, 1000, 1000)
+        })
+        self.assertFalse(any(check_rollups(db.session).values()))
+
+    def test_successful_bid_rate_rollup(self):
+        self.processor.bulk_insert_successful_bids([
+            {'bidNtceNo': '1', 'taskClsfcNm': '용역', 'scsbidRate': '87.5'},
+            {'bidNtceNo': '2', 'taskClsfcNm': '용역', 'scsbidRate': '90.5'},
+            {'bidNtceNo': '3', 'taskClsfcNm': '용역'},
+        ])
+        SuccessfulBid.query.filter_by(bid_notice_no='2').update({'scsbid_rate': 80.0})
+        db.session.commit()
+
+        self.assertEqual(self.rollup('rollup_successful_bid_rate_by_work_div'), {'용역': (2, 167.5, 80.0, 87.5)})
+
+    def test_rebuild_repairs_drift(self):
+        self.processor.bulk_insert_bid_notices([notice('1', '용역', '1000')])
+        db.session.execute(text("UPDATE rollup_bid_amount_by_work_div SET row_count = 99 WHERE group_key = '용역'"))
+        db.session.execute(text("DELETE FROM rollup_bid_amount_by_month"))
+        db.session.commit()
+
+        drift = check_rollups(db.session)
+        self.assertEqual([d['group_key'] for d in drift['rollup_bid_amount_by_work_div']], ['용역'])
+        self.assertEqual([d['group_key'] for d in drift['rollup_bid_amount_by_month']], ['2025-01'])
+
+        rebuild_rollups(db.session)
+        self.assertFalse(any(check_rollups(db.session).values()))
+
+    def test_matches_baseline_group_by(self):
+        self.processor.bulk_insert_bid_notices([notice('1', '용역', '1000'), notice('2', None, '2000')])
+        db.session.add(BidNotice(bid_notice_no='3', bid_notice_ord='00', bid_notice_nm='빈 업무구분',
+                                 work_div_nm='', presmpt_price=700))
+        db.session.commit()
+
+        # 집계 테이블 도입 전 분석 API의 업무구분별 GROUP BY
+        baseline = db.session.execute(text("""
+            SELECT work_div_nm, COUNT(id), SUM(presmpt_price), MIN(presmpt_price), MAX(presmpt_price)
+            FROM bid_notices WHERE presmpt_price IS NOT NULL GROUP BY work_div_nm
+        """)).fetchall()
+        rows = read_rollup(db.session, 'rollup_bid_amount_by_work_div')
+
+        self.assertEqual(
+            [(row['group_key'], row['row_count'], row['total'], row['min_value'], row['max_value']) for row in rows],
+            [tuple(row) for row in baseline]
+        )
+        self.assertEqual([row['group_key'] for row in rows][:2], [None, ''])
+        self.assertTrue(all(type(row['total']) is int for row in rows))
+        self.assertFalse(any(check_rollups(db.session).values()))
+
+    def test_outdated_definition_is_rebuilt(self):
+        # 이전 버전 정의 (NULL 업무구분을 ''로 저장하던 트리거)
+        db.session.execute(text("DROP TRIGGER rollup_bid_amount_by_work_div_ai"))
+        db.session.execute(text(
+            "CREATE TRIGGER rollup_bid_amount_by_work_div_ai AFTER INSERT ON bid_notices BEGIN "
+            "INSERT INTO rollup_bid_amount_by_work_div (group_key, row_count, total, min_value, max_value) "
+            "SELECT IFNULL(new.work_div_nm, ''), 1, new.presmpt_price, new.presmpt_price, new.presmpt_price "
+            "WHERE new.presmpt_price IS NOT NULL ON CONFLICT (group_key) DO UPDATE SET row_count = row_count + 1; END"
+        ))
+        db.session.execute(text("UPDATE rollup_bid_amount_by_work_div SET group_key = ''"))
+        db.session.commit()
+        rollups._ensured.clear()
+
+        ensure_rollups(db.session)
+        db.session.add(BidNotice(bid_notice_no='1', bid_notice_ord='00', bid_notice_nm='신규', presmpt_price=300))
+        db.session.commit()
+
+        self.assertEqual(self.rollup('rollup_bid_amount_by_work_div'), {None: (2, 800, 300, 500)})
+
+
+if __name__ == '__main__':
+    unittest.main()
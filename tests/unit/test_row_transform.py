@@ -0,0 +1,100 @@
+import unittest
+import sys
+import os
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils.row_transform import (
+    BID_NOTICE_TRANSFORMER, SUCCESSFUL_BID_TRANSFORMER, RowTransformer, Field, DATETIME,
+    parse_compact_datetime, parse_int, parse_float
+)
+from utils.stub_server import synthetic_bid_notice
+
+
+class TestRowTransform(unittest.TestCase):
+    def test_parse_compact_datetime(self):
+        self.assertEqual(parse_compact_datetime('202501021530'), datetime(2025, 1, 2, 15, 30))
+        self.assertEqual(parse_compact_datetime('20250102'), datetime(2025, 1, 2))
+        self.assertEqual(parse_compact_datetime('2025-01-02 15:30:45'), datetime(2025, 1, 2, 15, 30, 45))
+        self.assertEqual(parse_compact_datetime('2025-01-02 15:30'), datetime(2025, 1, 2, 15, 30))
+        for value in (None, '', '2025010215', '202513011200', '20250230', 'abcdefghijkl'):
+            self.assertIsNone(parse_compact_datetime(value), value)
+
+    def test_parse_numbers(self):
+        self.assertEqual([parse_int(v) for v in ('1000', ' 42 ', '-7', '+3', 5)], [1000, 42, -7, 3, 5])
+        self.assertEqual([parse_int(v) for v in (None, '', '-', '1,000', 'abc', '1e3', '1000.0', '1000.5')], [None] * 8)
+        self.assertEqual([parse_float(v) for v in ('87.745', '90', '-.5', '5.', 1.5)], [87.745, 90.0, -0.5, 5.0, 1.5])
+        self.assertEqual([parse_float(v) for v in (None, '', '.', '1.2.3')], [None] * 4)
+
+    def test_numbers_match_legacy_conversion(self):
+        # 기존 BatchProcessor._parse_int/_parse_float (행마다 int()/float() + 예외 처리)
+        def legacy_parse_int(value):
+            if value is None:
+                return None
+            try:
+                return int(value)
+            except:
+                return None
+
+        def legacy_parse_float(value):
+            if value is None or value == '':
+                return None
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+
+        values = [
+            None, '', ' ', '0', '007', '1000', ' 42 ', '-7', '+3', '-', '+', '1_000', '1,000', '1000.0',
+            '1000.5', '-1000.5', '.5', '5.', '1e3', 'abc', '12abc', 'nan', 'inf', '１２', '٣', 5, 1000.5,
+            float('inf'), float('nan'), True, [], {}
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(repr(parse_int(value)), repr(legacy_parse_int(value)))
+                self.assertEqual(repr(parse_float(value)), repr(legacy_parse_float(value)))
+
+        item = {'bidNtceNo': '1', 'presmptPrce': '1000.5', 'asignBdgtAmt': '미정'}
+        row = BID_NOTICE_TRANSFORMER.transform(item)
+        self.assertEqual((row['presmpt_price'], row['basic_amount']), (None, None))
+
+    def test_bid_notice_row(self):
+        created_at = datetime(2025, 1, 1)
+        row = BID_NOTICE_TRANSFORMER.transform(synthetic_bid_notice(3, datetime(2025, 1, 1)), created_at)
+
+        self.assertEqual(row['bid_notice_no'], '202501010003')
+        self.assertEqual(row['bid_notice_ord'], '00')
+        self.assertEqual(row['rgst_dt'], datetime(2025, 1, 1, 0, 3))
+        self.assertEqual(row['presmpt_price'], 1000003)
+        self.assertEqual(row['basic_amount'], 1100003)
+        self.assertEqual(row['work_div_nm'], '외자')
+        self.assertIs(row['created_at'], created_at)
+        self.assertEqual(list(row), BID_NOTICE_TRANSFORMER.columns)
+
+    def test_defaults_and_truncation(self):
+        row = BID_NOTICE_TRANSFORMER.transform({'bidNtceNo': '1', 'bidNtceNm': 'x' * 600, 'dminsttNm': None})
+
+        self.assertEqual(len(row['bid_notice_nm']), 500)
+        self.assertEqual((row['bid_notice_ord'], row['dminstt_nm'], row['rgst_dt']), ('00', '', None))
+
+    def test_successful_bid_fallback_source(self):
+        rows = SUCCESSFUL_BID_TRANSFORMER.transform_many([
+            {'bidNtceNo': '1', 'scsbidCpnyNm': '대체업체', 'scsbidRate': '87.5'},
+            {'bidNtceNm': '공고번호 없음'}
+        ])
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual((rows[0]['scsbid_corp_nm'], rows[0]['scsbid_rate']), ('대체업체', 87.5))
+
+    def test_datetime_memo_is_bounded(self):
+        transformer = RowTransformer([Field('rgst_dt', ('rgstDt',), DATETIME)], required='rgstDt', memo_size=3)
+
+        rows = transformer.transform_many({'rgstDt': f'2025010100{i % 5:02d}'} for i in range(20))
+
+        self.assertEqual(rows[7]['rgst_dt'], datetime(2025, 1, 1, 0, 2))
+        self.assertLessEqual(len(transformer._memo), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+import unittest
+import sys
+import os
+from datetime import datetime
+
+from flask import Flask, jsonify
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from models.narajangter import db, BidNotice
+from utils.count_cache import CountCache
+from utils.generations import get_data_generations
+from utils.http_cache import cached_view, configure_response_cache
+from utils.shared_cache import MemoryBackend, SharedCache, configure_shared_cache
+
+
+class FailingBackend(MemoryBackend):
+    name = 'failing'
+
+    def get(self, key):
+        raise ConnectionError('down')
+
+    mget = set = incr = get
+
+
+class FlakyBackend(MemoryBackend):
+    """down=True인 동안 모든 호출이 실패하는 백엔드 (Redis 장애 흉내)"""
+    name = 'flaky'
+
+    def __init__(self):
+        super().__init__()
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise ConnectionError('down')
+
+    def get(self, key):
+        self._check()
+        return super().get(key)
+
+    def mget(self, keys):
+        self._check()
+        return super().mget(keys)
+
+    def set(self, key, value, ttl=None):
+        self._check()
+        return super().set(key, value, ttl)
+
+    def incr(self, key):
+        self._check()
+        return super().incr(key)
+
+
+class TestSharedCache(unittest.TestCase):
+    def setUp(self):
+        self.backend = MemoryBackend()
+        self.shared = configure_shared_cache(backend=self.backend, namespace='test')
+
+    def tearDown(self):
+        configure_shared_cache(enabled=False)
+        configure_response_cache(enabled=False)
+
+    def test_generations_are_shared_through_backend(self):
+        self.assertIs(get_data_generations(), self.shared.generations)
+
+        # 다른 워커가 같은 백엔드에서 세대를 올림
+        other = SharedCache(self.backend, namespace='test')
+        other.generations.bump('bid_notices')
+
+        self.assertEqual(get_data_generations().snapshot(('bid_notices', 'successful_bids')), (1, 0))
+
+    def test_keys_are_namespaced_by_generation(self):
+        self.shared.set_json('count', (1,), ('bid_notices', ()), [10, True])
+
+        self.assertEqual(self.shared.get_json('count', (1,), ('bid_notices', ())), [10, True])
+        self.assertIsNone(self.shared.get_json('count', (2,), ('bid_notices', ())))
+        self.assertIsNone(SharedCache(self.backend, namespace='other').get_json('count', (1,), ('bid_notices', ())))
+        self.assertTrue(all(key.startswith('test:') for key in self.backend._data))
+
+    def test_response_rendered_once_across_workers(self):
+        renders = []
+        app = Flask(__name__)
+
+        @app.route('/items')
+        @cached_view('bid_notices')
+        def items():
+            renders.append(1)
+            return jsonify({'items': [1, 2, 3]}), 200
+
+        client = app.test_client()
+
+        configure_response_cache()
+        first = client.get('/items')
+        # 두 번째 워커 (로컬 캐시가 빈 상태)
+        configure_response_cache()
+        second = client.get('/items')
+        third = client.get('/items')
+
+        self.assertEqual(len(renders), 1)
+        self.assertEqual([r.headers['X-Response-Cache'] for r in (first, second, third)], ['MISS', 'SHARED', 'HIT'])
+        self.assertEqual(first.headers['ETag'], second.headers['ETag'])
+
+        # 한 워커의 동기화가 모든 워커의 캐시를 무효화
+        SharedCache(self.backend, namespace='test').generations.bump('bid_notices')
+        self.assertEqual(client.get('/items').headers['X-Response-Cache'], 'MISS')
+        self.assertEqual(len(renders), 2)
+
+    def test_counts_are_shared_across_workers(self):
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            db.session.add(BidNotice(bid_notice_no='1', bid_notice_ord='00', bid_notice_nm='x', rgst_dt=datetime.now()))
+            db.session.commit()
+
+            self.assertEqual(CountCache().count(BidNotice.query, BidNotice, {}), (1, True))
+            other_worker = CountCache()
+            self.assertEqual(other_worker.count(BidNotice.query, BidNotice, {}), (1, True))
+            self.assertEqual(other_worker.exact_counts, 0)
+            db.drop_all()
+
+    def test_backend_errors_fall_back_to_local(self):
+        cache = configure_shared_cache(backend=FailingBackend(), namespace='test')
+
+        self.assertIsNone(cache.get('response', (0,), 'key'))
+        cache.set('response', (0,), 'key', b'value')
+        bumped = cache.generations.bump('bid_notices')
+        first, second = cache.generations.get('bid_notices'), cache.generations.get('bid_notices')
+        # 장애 중 세대는 매번 새 음수 값 (어떤 캐시 항목과도 맞지 않음)
+        self.assertTrue(all(value < 0 for value in (bumped, first, second)))
+        self.assertEqual(len({bumped, first, second}), 3)
+        self.assertEqual(cache.stats()['errors'], 2)
+
+    def test_redis_outage_then_write_never_serves_stale_response(self):
+        backend = FlakyBackend()
+        shared = configure_shared_cache(backend=backend, namespace='test')
+        configure_response_cache()
+        payload = {'version': 1}
+        renders = []
+        app = Flask(__name__)
+
+        @app.route('/items')
+        @cached_view('bid_notices')
+        def items():
+            renders.append(1)
+            return jsonify(payload), 200
+
+        client = app.test_client()
+        # 다른 워커가 먼저 동기화해 공유 세대가 1 (프로세스 내 세대는 0)
+        SharedCache(backend, namespace='test').generations.bump('bid_notices')
+        self.assertEqual(client.get('/items').json, {'version': 1})
+        self.assertEqual(client.get('/items').headers['X-Response-Cache'], 'HIT')
+
+        # Redis 장애 중 이 워커가 동기화 (세대 증가 실패)
+        backend.down = True
+        payload['version'] = 2
+        shared.generations.bump('bid_notices')
+
+        for _ in range(2):
+            response = client.get('/items')
+            self.assertEqual(response.headers['X-Response-Cache'], 'MISS')
+            self.assertEqual(response.json, {'version': 2})
+        self.assertEqual(len(renders), 3)
+
+        # 복구되면 올리지 못한 세대를 반영해 다른 워커의 캐시도 무효화
+        backend.down = False
+        self.assertEqual(client.get('/items').headers['X-Response-Cache'], 'MISS')
+        self.assertEqual(SharedCache(backend, namespace='test').generations.get('bid_notices'), 2)
+        self.assertEqual(client.get('/items').headers['X-Response-Cache'], 'HIT')
+
+    def test_unreachable_redis_disables_shared_tier(self):
+        self.assertIsNone(configure_shared_cache('redis://127.0.0.1:1/0'))
+        self.assertNotIsInstance(get_data_generations(), type(self.shared.generations))
+
+
+if __name__ == '__main__':
+    unittest.main()
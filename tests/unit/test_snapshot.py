@@ -0,0 +1,168 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+from flask import Flask
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from models.narajangter import db, BidNotice, SuccessfulBid
+from utils import snapshot
+from utils.snapshot import (
+    NULL_PARTITION, arrow_type_name, export_snapshot, partition_path, partition_signatures,
+    read_manifest, reflect_table
+)
+
+
+class SnapshotTestCase(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.output_dir = tempfile.mkdtemp()
+
+        for i, rgst_dt in enumerate([
+            datetime(2025, 1, 1), datetime(2025, 1, 31, 23, 59, 59), datetime(2025, 2, 1),
+            datetime(2025, 12, 15), None
+        ]):
+            db.session.add(BidNotice(
+                bid_notice_no=f'2025{i:04d}', bid_notice_ord='00', bid_notice_nm=f'공고 {i}',
+                rgst_dt=rgst_dt, presmpt_price=1000 * (i + 1)
+            ))
+        db.session.commit()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+
+class TestPartitionSignatures(SnapshotTestCase):
+    def signatures(self):
+        return partition_signatures(db.session, reflect_table(db.session, 'bid_notices'), 'rgst_dt')
+
+    def test_groups_rows_by_month(self):
+        signatures = self.signatures()
+
+        self.assertEqual(
+            {month: signature['rows'] for month, signature in signatures.items()},
+            {'2025-01': 2, '2025-02': 1, '2025-12': 1, NULL_PARTITION: 1}
+        )
+
+    def test_checksum_changes_when_row_is_updated_in_place(self):
+        before = self.signatures()
+        notice = BidNotice.query.filter_by(bid_notice_no='20250000').one()
+        notice.presmpt_price = 999
+        db.session.commit()
+
+        after = self.signatures()
+
+        self.assertNotEqual(before['2025-01']['checksum'], after['2025-01']['checksum'])
+        self.assertEqual(before['2025-01']['rows'], after['2025-01']['rows'])
+        self.assertEqual(before['2025-02'], after['2025-02'])
+
+    def test_partition_filter_matches_month_boundaries(self):
+        table = reflect_table(db.session, 'bid_notices')
+        for month, expected in (('2025-01', 2), ('2025-12', 1), (NULL_PARTITION, 1)):
+            rows = db.session.execute(
+                table.select().where(snapshot._partition_filter('rgst_dt', month))
+            ).all()
+            self.assertEqual(len(rows), expected, month)
+
+    def test_arrow_types_follow_declared_columns(self):
+        types = {column.name: arrow_type_name(column) for column in reflect_table(db.session, 'successful_bids').columns}
+
+        self.assertEqual(types['id'], 'int64')
+        self.assertEqual(types['scsbid_amount'], 'int64')
+        self.assertEqual(types['scsbid_rate'], 'double')
+        self.assertEqual(types['openg_dt'], 'timestamp[us]')
+        self.assertEqual(types['scsbid_corp_nm'], 'string')
+
+    @unittest.skipIf(snapshot.pa is not None, 'pyarrow 설치됨')
+    def test_export_requires_pyarrow(self):
+        with self.assertRaises(RuntimeError):
+            export_snapshot(db.session, self.output_dir, 'bid_notices')
+
+
+@unittest.skipUnless(snapshot.pa is not None, 'pyarrow 미설치')
+class TestExportSnapshot(SnapshotTestCase):
+    def read_partition(self, month, snapshot_format='parquet'):
+        path = partition_path(self.output_dir, 'bid_notices', month, snapshot_format)
+        if snapshot_format == 'parquet':
+            return snapshot.pq.read_table(path)
+        return snapshot.pa.ipc.open_file(path).read_all()
+
+    def test_full_export_writes_typed_monthly_partitions(self):
+        result = export_snapshot(db.session, self.output_dir, 'bid_notices')
+
+        self.assertEqual(result['written'], ['2025-01', '2025-02', '2025-12', NULL_PARTITION])
+        self.assertEqual(result['rows'], 5)
+        january = self.read_partition('2025-01')
+        self.assertEqual(january.num_rows, 2)
+        self.assertEqual(str(january.schema.field('rgst_dt').type), 'timestamp[us]')
+        self.assertEqual(str(january.schema.field('presmpt_price').type), 'int64')
+        self.assertEqual(january.column('rgst_dt').to_pylist()[1], datetime(2025, 1, 31, 23, 59, 59))
+        self.assertEqual(read_manifest(self.output_dir, 'bid_notices')['partitions']['2025-02']['rows'], 1)
+
+    def test_incremental_export_rewrites_only_changed_months(self):
+        export_snapshot(db.session, self.output_dir, 'bid_notices')
+        self.assertEqual(export_snapshot(db.session, self.output_dir, 'bid_notices')['written'], [])
+
+        db.session.add(BidNotice(bid_notice_no='20259999', bid_notice_ord='00', bid_notice_nm='신규',
+                                 rgst_dt=datetime(2026, 3, 1)))
+        BidNotice.query.filter_by(bid_notice_no='20250002').one().bid_notice_nm = '변경된 공고'
+        db.session.commit()
+
+        result = export_snapshot(db.session, self.output_dir, 'bid_notices')
+
+        self.assertEqual(result['written'], ['2025-02', '2026-03'])
+        self.assertEqual(result['unchanged'], 3)
+        self.assertEqual(self.read_partition('2025-02').column('bid_notice_nm').to_pylist(), ['변경된 공고'])
+
+    def test_emptied_month_is_removed(self):
+        export_snapshot(db.session, self.output_dir, 'bid_notices')
+        BidNotice.query.filter_by(bid_notice_no='20250003').delete()
+        db.session.commit()
+
+        result = export_snapshot(db.session, self.output_dir, 'bid_notices')
+
+        self.assertEqual(result['removed'], ['2025-12'])
+        self.assertFalse(os.path.exists(partition_path(self.output_dir, 'bid_notices', '2025-12', 'parquet')))
+        self.assertNotIn('2025-12', read_manifest(self.output_dir, 'bid_notices')['partitions'])
+
+    def test_format_change_rewrites_all_months(self):
+        export_snapshot(db.session, self.output_dir, 'bid_notices')
+
+        result = export_snapshot(db.session, self.output_dir, 'bid_notices', snapshot_format='arrow')
+
+        self.assertEqual(len(result['written']), 4)
+        self.assertEqual(self.read_partition(NULL_PARTITION, 'arrow').num_rows, 1)
+        self.assertFalse(os.path.exists(partition_path(self.output_dir, 'bid_notices', '2025-01', 'parquet')))
+
+    def test_successful_bids_partitioned_by_opening_date(self):
+        db.session.add(SuccessfulBid(bid_notice_no='1', bid_notice_ord='00', openg_dt=datetime(2025, 5, 2),
+                                     scsbid_rate=87.745))
+        db.session.commit()
+
+        result = export_snapshot(db.session, self.output_dir, 'successful_bids')
+
+        self.assertEqual(result['written'], ['2025-05'])
+        table = snapshot.pq.read_table(partition_path(self.output_dir, 'successful_bids', '2025-05', 'parquet'))
+        self.assertEqual(table.column('scsbid_rate').to_pylist(), [87.745])
+
+    def test_unknown_table_or_format_is_rejected(self):
+        with self.assertRaises(ValueError):
+            export_snapshot(db.session, self.output_dir, 'api_configs')
+        with self.assertRaises(ValueError):
+            export_snapshot(db.session, self.output_dir, 'bid_notices', snapshot_format='xlsx')
+
+
+if __name__ == '__main__':
+    unittest.main()
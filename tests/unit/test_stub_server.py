@@ -0,0 +1,66 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+import xml.etree.ElementTree as ET
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils.stub_server import StubServer, load_fixture
+
+
+class TestStubServer(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer(total_count=25).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def get(self, endpoint='bid_notice', **params):
+        return requests.get(self.server.url(endpoint), params=params, timeout=5)
+
+    def test_json_paging(self):
+        body = self.get(type='json', numOfRows='10', pageNo='3', bidNtceBgnDt='202503010900').json()['response']['body']
+
+        self.assertEqual(body['totalCount'], 25)
+        self.assertEqual(len(body['items']), 5)
+        self.assertEqual(body['items'][0]['bidNtceNo'], '202503010020')
+        self.assertEqual(body['items'][0]['rgstDt'], '202503010920')
+
+    def test_xml_response(self):
+        root = ET.fromstring(self.get('successful_bid', numOfRows='2').content)
+
+        self.assertEqual(root.findtext('header/resultCode'), '00')
+        self.assertEqual(root.findtext('body/totalCount'), '25')
+        self.assertEqual(len(root.findall('body/items/item')), 2)
+        self.assertIsNotNone(root.findtext('body/items/item/scsbidAmt'))
+
+    def test_failures_and_result_code(self):
+        self.server.config.fail_pages = {2}
+        self.server.config.transient_failures = {3: 1}
+        self.server.config.result_code = '22'
+
+        self.assertEqual(self.get(type='json', pageNo='2').status_code, 500)
+        self.assertEqual(self.get(type='json', pageNo='3').status_code, 500)
+        response = self.get(type='json', pageNo='3')
+        self.assertEqual(response.json()['response']['header']['resultCode'], '22')
+        self.assertEqual(self.server.request_count, 3)
+
+    def test_fixture(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8') as f:
+            json.dump({'response': {'body': {'items': [{'bidNtceNo': 'F1'}, {'bidNtceNo': 'F2'}]}}}, f)
+        try:
+            self.server.config.fixtures = {'bid_notice': load_fixture(f.name)}
+        finally:
+            os.unlink(f.name)
+
+        body = self.get(type='json', numOfRows='1', pageNo='2').json()['response']['body']
+        self.assertEqual(body['totalCount'], 2)
+        self.assertEqual(body['items'], [{'bidNtceNo': 'F2'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+import unittest.mock
+import sys
+import os
+import json
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils.upstream_cache import UpstreamCache, is_cacheable, cached_response
+from utils.api_helper import APIHelper
+from utils.stub_server import StubServer
+
+
+def page(result_code='00', items=None):
+    return json.dumps({
+        'response': {
+            'header': {'resultCode': result_code, 'resultMsg': 'NORMAL SERVICE.'},
+            'body': {'items': items or [], 'totalCount': len(items or [])}
+        }
+    }).encode('utf-8')
+
+
+class TestUpstreamCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = UpstreamCache(db_path=os.path.join(self.tmpdir.name, 'cache.db'), recent_ttl=60)
+        self.url = 'http://example.com/getDataSetOpnStdBidPblancInfo'
+        self.params = {'ServiceKey': 'key-a', 'type': 'json', 'bidNtceEndDt': '202501312359', 'pageNo': '1'}
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_key_ignores_service_key_and_order(self):
+        other = {'pageNo': 1, 'bidNtceEndDt': '202501312359', 'type': 'json', 'serviceKey': 'key-b'}
+
+        self.assertEqual(self.cache.cache_key(self.url, self.params), self.cache.cache_key(self.url, other))
+        self.assertNotEqual(
+            self.cache.cache_key(self.url, self.params),
+            self.cache.cache_key(self.url, {**self.params, 'pageNo': '2'})
+        )
+
+    def test_hit_miss_counters(self):
+        self.assertIsNone(self.cache.get(self.url, self.params))
+        self.assertTrue(self.cache.put(self.url, self.params, page(items=[{'bidNtceNo': '1'}]), 'application/json'))
+
+        content, content_type = self.cache.get(self.url, {**self.params, 'ServiceKey': 'key-b'})
+
+        self.assertEqual(json.loads(content)['response']['body']['items'], [{'bidNtceNo': '1'}])
+        self.assertEqual(content_type, 'application/json')
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (1, 1, 1))
+
+    def test_contains_many_matches_contains(self):
+        pages = [{**self.params, 'pageNo': str(page_no)} for page_no in range(1, 6)]
+        for params in pages[1:4]:
+            self.cache.put(self.url, params, page(items=[{'bidNtceNo': params['pageNo']}]))
+
+        self.assertEqual(self.cache.contains_many(self.url, pages), [False, True, True, True, False])
+        self.assertEqual(self.cache.contains_many(self.url, pages), [self.cache.contains(self.url, p) for p in pages])
+        self.assertEqual(self.cache.contains_many(self.url, []), [])
+
+    def test_error_responses_not_cached(self):
+        self.assertFalse(self.cache.put(self.url, self.params, page(result_code='22')))
+        self.assertFalse(self.cache.put(self.url, self.params, b'<html>error</html>'))
+        self.assertTrue(is_cacheable(b'<response><header><resultCode>00</resultCode></header></response>'))
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_ttl_policy(self):
+        now = datetime(2025, 2, 10, 12, 0)
+
+        self.assertIsNone(self.cache.ttl_for({'bidNtceEndDt': '202501312359'}, now))
+        self.assertIsNone(self.cache.ttl_for({'opengEndDt': '20250205'}, now))
+        self.assertEqual(self.cache.ttl_for({'bidNtceEndDt': '202502092359'}, now), 60)
+        self.assertEqual(self.cache.ttl_for({'type': 'json'}, now), 60)
+
+    def test_recent_window_expires(self):
+        params = {**self.params, 'bidNtceEndDt': datetime.now().strftime('%Y%m%d2359')}
+        self.cache.put(self.url, params, page())
+
+        with unittest.mock.patch('utils.upstream_cache.time.time', return_value=9e12):
+            self.assertIsNone(self.cache.get(self.url, params))
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_evicts_least_recently_used(self):
+        content = page(items=[{'bidNtceNo': 'x' * 100}])
+        cache = UpstreamCache(db_path=os.path.join(self.tmpdir.name, 'small.db'), max_bytes=len(content) * 2)
+        for page_no in ('1', '2'):
+            cache.put(self.url, {**self.params, 'pageNo': page_no}, content)
+        cache.get(self.url, {**self.params, 'pageNo': '1'})
+
+        cache.put(self.url, {**self.params, 'pageNo': '3'}, content)
+
+        self.assertTrue(cache.contains(self.url, {**self.params, 'pageNo': '1'}))
+        self.assertFalse(cache.contains(self.url, {**self.params, 'pageNo': '2'}))
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_cached_response_parses(self):
+        parsed = APIHelper.parse_api_response(cached_response(self.url, page(items=[{'a': 1}])))
+
+        self.assertTrue(parsed['success'])
+        self.assertEqual(parsed['items'], [{'a': 1}])
+
+    def test_call_api_uses_shared_cache(self):
+        with StubServer(total_count=5) as server, \
+                unittest.mock.patch('utils.api_helper.get_upstream_cache', return_value=self.cache), \
+                unittest.mock.patch('utils.api_helper.get_quota_manager') as quota:
+            url = server.url('bid_notice')
+            params = {'ServiceKey': 'key-a', 'type': 'json', 'bidNtceEndDt': '202501312359'}
+            first = APIHelper.call_api(url, params)
+            second = APIHelper.call_api(url, {**params, 'ServiceKey': 'key-b'})
+
+            self.assertEqual(server.request_count, 1)
+        self.assertEqual(quota.return_value.consume.call_count, 1)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second.headers['X-Upstream-Cache'], 'HIT')
+
+
+if __name__ == '__main__':
+    unittest.main()
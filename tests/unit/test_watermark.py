@@ -0,0 +1,35 @@
+import unittest
+import sys
+import os
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils.watermark import next_window
+
+
+class TestNextWindow(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime(2025, 3, 10, 14, 25)
+
+    def test_initial_window(self):
+        self.assertEqual(next_window(None, self.now, initial_days=7), ('202503030000', '202503101425'))
+
+    def test_window_starts_from_last_window_end_with_overlap(self):
+        watermark = {'window_end': '202503101300', 'last_rgst_dt': datetime(2025, 3, 10, 12, 50)}
+
+        self.assertEqual(next_window(watermark, self.now, overlap_minutes=60), ('202503101200', '202503101425'))
+
+    def test_falls_back_to_last_rgst_dt(self):
+        watermark = {'window_end': None, 'last_rgst_dt': datetime(2025, 3, 9, 8, 0)}
+
+        self.assertEqual(next_window(watermark, self.now, overlap_minutes=10), ('202503090750', '202503101425'))
+
+    def test_future_watermark_is_clamped(self):
+        watermark = {'window_end': '202503120000'}
+
+        self.assertEqual(next_window(watermark, self.now, overlap_minutes=5), ('202503101420', '202503101425'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import sys
+import os
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../narajangter_app/src'))
+
+from utils.xml_decoder import decode_xml, decode_response, iter_xml_items
+from utils.api_helper import APIHelper
+from utils.async_fetcher import AsyncPageFetcher
+from utils.resilience import RetryPolicy, RetryBudget
+from utils.stub_server import StubServer
+from utils.upstream_cache import cached_response
+
+ERROR_XML = b"""<OpenAPI_ServiceResponse>
+    <cmmMsgHeader>
+        <errMsg>SERVICE ERROR</errMsg>
+        <returnAuthMsg>SERVICE_KEY_IS_NOT_REGISTERED_ERROR</returnAuthMsg>
+        <returnReasonCode>30</returnReasonCode>
+    </cmmMsgHeader>
+</OpenAPI_ServiceResponse>"""
+
+
+class TestXMLDecoder(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubServer(total_count=25).start()
+        cls.url = cls.server.url('bid_notice')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def fetch(self, **params):
+        params = {'ServiceKey': 'test-key', 'numOfRows': '10', 'pageNo': '3', 'bidNtceBgnDt': '202501010000', **params}
+        return requests.get(self.url, params=params, timeout=5).content
+
+    def test_same_document_as_json(self):
+        xml_page = self.fetch()
+        json_page = self.fetch(type='json')
+
+        self.assertTrue(xml_page.startswith(b'<?xml'))
+        self.assertEqual(decode_xml(xml_page), decode_response(json_page))
+        self.assertEqual(decode_response(xml_page)['response']['body']['totalCount'], 25)
+        self.assertEqual(len(list(iter_xml_items(xml_page))), 5)
+
+    def test_openapi_error_response(self):
+        data = decode_xml(ERROR_XML)
+
+        self.assertEqual(data['response']['header'], {
+            'resultCode': '30',
+            'resultMsg': 'SERVICE_KEY_IS_NOT_REGISTERED_ERROR'
+        })
+        result = APIHelper.parse_api_response(cached_response(self.url, ERROR_XML))
+        self.assertFalse(result['success'])
+        self.assertIn('(30)', result['error'])
+
+    def test_parse_api_response_xml(self):
+        result = APIHelper.parse_api_response(cached_response(self.url, self.fetch()))
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['total_count'], 25)
+        self.assertEqual([item['bidNtceNo'] for item in result['items']], [f'20250101{i:04d}' for i in range(20, 25)])
+
+    def test_malformed_xml_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            decode_xml(b'<response><header>')
+
+    def test_async_fetcher_reads_xml(self):
+        fetcher = AsyncPageFetcher(
+            concurrency=4,
+            retry_policy=RetryPolicy(max_attempts=1),
+            retry_budget=RetryBudget()
+        )
+
+        items = fetcher.fetch_all_pages(self.url, {'ServiceKey': 'test-key', 'numOfRows': '10', 'bidNtceBgnDt': '202501010000'})
+
+        self.assertEqual(len(items), 25)
+        self.assertEqual(fetcher.failed_pages, [])
+
+
+if __name__ == '__main__':
+    unittest.main()